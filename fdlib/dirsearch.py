@@ -6,39 +6,103 @@
 언급할 때에도 사용됨.
 
 """
+import io
 import os
-import heapq
-from typing import TypeAlias
+import re
+import sys
+import json
+import time
+import queue
+import struct
+import hashlib
+import ctypes
+import ctypes.util
+import select
+import fnmatch
+import itertools
+import threading
+from typing import TypeAlias, TextIO, NamedTuple
+from collections.abc import Iterator, Iterable, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-from submodules.tree import PathTree
+from submodules.tree import PathTree, REMOVEALL, TEXT, ExportFormat
+from submodules.tree import _sortLengthOrder, _iterLengthOrder
 
 # type aliases
 Path: TypeAlias = str  # entity의 경로.
 DirPath: TypeAlias = str
+# 디렉토리 탐색 시 각 entity를 탐색 대상에 포함할지 결정하는 함수.
+EntryPredicate: TypeAlias = Callable[[os.DirEntry], bool]
+
+# DirScanCache에서 디렉토리의 수정 시각이 탐색 시각과 이 시간(나노초) 이내로 
+# 가까우면, 같은 수정 시각 안에 다시 바뀔 수 있으므로 다음 탐색 때 다시 읽는다.
+_RACY_MTIME_NS = 2 * 10**9
+
+# DirWatcher에서 쓰는 inotify 관련 상수들. (linux/inotify.h 참고)
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONT_FOLLOW = 0x02000000
+_IN_EXCL_UNLINK = 0x04000000
+_IN_WATCH_MASK = (
+    _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_MOVE_SELF 
+    | _IN_ONLYDIR | _IN_DONT_FOLLOW | _IN_EXCL_UNLINK
+)
+# struct inotify_event의 고정 길이 부분. (wd, mask, cookie, len)
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+# find_duplicate_files()에서 먼저 해시하는 파일 앞, 뒤 부분의 크기와 
+# 파일 전체를 해시할 때 한 번에 읽는 크기. (바이트)
+_HASH_EDGE_SIZE = 64 * 1024
+_HASH_BLOCK_SIZE = 1024 * 1024
+# find_duplicate_files()의 해시 캐시 파일 형식 버전.
+_HASH_CACHE_VERSION = 1
+
+# iter_all_in_rootdir_parallel()에서 디렉토리 탐색 결과를 나타내는 상수들.
+_EMPTY_DIR = 0  # 빈 디렉토리.
+_SKIPPED_DIR = 1  # 이미 탐색했거나 조건에 맞지 않아 반환하지 않는 디렉토리.
 
 def sort_length_order(
-        liststr: list[str],
-        ascending: bool = True
+        liststr: Iterable[str],
+        ascending: bool = True,
+        k: int | None = None
     ) -> (list[str]):
     """문자열들의 리스트를 입력값으로 받으면, 문자열들의 길이 순으로 
     정렬한 결과를 반환하는 함수.
 
     파일 및 디렉토리들의 경로 문자열들을 리스트로 받았을 때 이를 
-    경로 문자열 길이 순으로 정렬하고자 할 때 쓰는 함수.
+    경로 문자열 길이 순으로 정렬하고자 할 때 쓰는 함수. 
+    길이가 같은 문자열들은 입력 순서와 관계 없이 항상 문자열 오름차순으로 
+    정렬되므로, 같은 문자열들을 담은 리스트라면 순서가 달라도 
+    정렬 결과가 같다.
 
     Parameters
     ----------
-    liststr : list[str]
+    liststr : Iterable[str]
         정렬시키고자 하는 문자열들의 리스트
     ascending : bool, default True
         정렬 시 문자열들의 길이가 짧은 것부터 오름차순으로 정렬할지를 
         결정하는 매개변수. 
         True 시 오름차순, False 시 내림차순으로 정렬.
+    k : int | None, default None
+        정렬 결과 중 앞에서부터 k개만 필요할 때 입력. 
+        k개를 채우는 데 필요한 길이의 문자열들만 정렬한다. 
+        None 시 모든 문자열들을 정렬하여 반환.
 
     Returns
     -------
     list[str]
 
+    See Also
+    --------
+    iter_length_order : 같은 순서로 문자열들을 하나씩 반환하는 제너레이터.
+
     Examples
     --------
 
@@ -51,24 +115,233 @@ def sort_length_order(
     >>> result = sort_length_order(some_liststr)
     >>> print(result)
     ['hi', 'how are you?', 'merci beaucoup', 'nice to meet you']
+    >>> sort_length_order(some_liststr, ascending=False, k=2)
+    ['nice to meet you', 'merci beaucoup']
+
+    """
+    return _sortLengthOrder(liststr, ascending, k)
+
+def iter_length_order(
+        strings: Iterable[str],
+        ascending: bool = True
+    ) -> (Iterator[str]):
+    """sort_length_order()와 같은 순서로 문자열들을 하나씩 반환하는 제너레이터.
+
+    문자열들을 길이별로 묶어둔 뒤 반환할 차례가 된 길이의 문자열들만 
+    정렬하므로, 가장 짧은(또는 긴) 경로 몇 개만 확인하고 중간에 
+    반복을 멈추는 경우 나머지 문자열들은 정렬하지 않는다.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        정렬시키고자 하는 문자열들.
+    ascending : bool, default True
+        True 시 길이가 짧은 문자열부터, False 시 긴 문자열부터 반환.
+
+    Yields
+    ------
+    str
+
+    Examples
+    --------
+
+    >>> paths = ['a/bb/c.txt', 'a/b.txt', 'a/bb/a.txt', 'a/bb/cc/d.txt']
+    >>> for path in iter_length_order(paths, ascending=False):
+    ...     print(path)
+    a/bb/cc/d.txt
+    a/bb/a.txt
+    a/bb/c.txt
+    a/b.txt
 
     """
-    heap_list = []
-    for string in liststr:
-        if ascending:
-            str_len = len(string)
+    return _iterLengthOrder(strings, ascending)
+
+def _compile_patterns(
+        patterns: Iterable[str]
+    ) -> (tuple[Callable | None, Callable | None]):
+    """glob 패턴들을 entity 이름과 비교할 정규표현식과 
+    상대경로와 비교할 정규표현식으로 나누어 컴파일하고, 
+    각각의 match 메서드를 반환. 해당하는 패턴이 없으면 None."""
+    name_patterns, path_patterns = [], []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern).replace(os.sep, '/')
+        if '/' in pattern: path_patterns.append(fnmatch.translate(pattern))
+        else: name_patterns.append(fnmatch.translate(pattern))
+    name_match = path_match = None
+    if name_patterns: name_match = re.compile('|'.join(name_patterns)).match
+    if path_patterns: path_match = re.compile('|'.join(path_patterns)).match
+    return name_match, path_match
+
+def _make_entry_filters(
+        prefix_len: int,
+        include: Iterable[str] | None,
+        exclude: Iterable[str] | None,
+        extensions: Iterable[str] | None,
+        predicate: EntryPredicate | None
+    ) -> (tuple[Callable[[os.DirEntry], bool] | None, 
+                Callable[[os.DirEntry, bool], bool] | None]):
+    """디렉토리 탐색 시 사용할 두 필터 함수를 만들어 반환.
+
+    첫 번째 함수는 entity를 받아 exclude 패턴과 일치하거나 predicate가 
+    False를 반환하면 True를 반환한다. True가 반환된 디렉토리는 열지 않는다. 
+    두 번째 함수는 반환 대상인 파일 또는 leaf 디렉토리 entity와 
+    디렉토리 여부를 받아, include 패턴 및 extensions 조건을 만족하면 True를 반환한다. 
+    조건이 없으면 해당 함수 대신 None을 반환한다.
+    """
+    def match_any(
+            entry: os.DirEntry, 
+            name_match: Callable | None, 
+            path_match: Callable | None
+        ) -> (bool):
+        if name_match is not None and name_match(os.path.normcase(entry.name)):
+            return True
+        if path_match is not None:
+            relpath = os.path.normcase(entry.path[prefix_len:]).replace(os.sep, '/')
+            if path_match(relpath): return True
+        return False
+
+    is_excluded = None
+    if exclude or predicate is not None:
+        ex_name_match, ex_path_match = _compile_patterns(exclude or [])
+        def excluded(entry: os.DirEntry) -> (bool):
+            if match_any(entry, ex_name_match, ex_path_match): return True
+            return predicate is not None and not predicate(entry)
+        is_excluded = excluded
+
+    is_selected = None
+    if include or extensions is not None:
+        in_name_match, in_path_match = _compile_patterns(include or [])
+        if extensions is not None:
+            # str.endswith()에 튜플로 한 번에 비교한다.
+            extensions = tuple({
+                os.path.normcase(ext if ext.startswith('.') else '.' + ext)
+                for ext in extensions
+            })
+        def selected(entry: os.DirEntry, is_dir: bool) -> (bool):
+            if extensions is not None:
+                if is_dir: return False
+                if not os.path.normcase(entry.name).endswith(extensions): return False
+            if include:
+                return match_any(entry, in_name_match, in_path_match)
+            return True
+        is_selected = selected
+    return is_excluded, is_selected
+
+def iter_all_in_rootdir(
+        root_dir: DirPath, 
+        to_abspath: bool = True,
+        follow_symlinks: bool = True,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        predicate: EntryPredicate | None = None
+    ) -> (Iterator[Path]):
+    """루트 디렉토리 경로가 주어지면 해당 디렉토리 내 
+    모든 파일들과 leaf 디렉토리의 경로들을 하나씩 반환하는 제너레이터.
+
+    os.scandir()로 디렉토리를 읽어 각 entity가 디렉토리인지를 
+    DirEntry.is_dir()로 판단하므로, 확장자가 없는 파일이나 이름에 '.'이 
+    들어간 디렉토리도 올바르게 구분한다. 재귀 호출 대신 명시적인 스택으로 
+    하위 디렉토리들을 탐색하므로 디렉토리 깊이에 제한이 없다. 
+    경로들은 디렉토리 내 entity 순서대로 깊이 우선으로 반환된다.
+
+    Parameters
+    ----------
+    root_dir : str
+        루트 디렉토리 경로
+    to_abspath : bool, default True
+        루트 디렉토리 내 하위 파일 및 디렉토리들의 경로를 절대경로 또는 
+        상대경로로 반환할 지 결정하는 매개변수. 
+        True 시 절대경로로 반환한다.
+        False 시 상대경로로 반환한다. 여기서 상대경로는 해당 절대경로에서 
+        root_dir로 지정된 루트 디렉토리의 절대경로를 뺀 경로이다.
+    follow_symlinks : bool, default True
+        디렉토리를 가리키는 심볼릭 링크를 디렉토리로 보고 그 안을 탐색할지를 
+        결정하는 매개변수. 
+        True 시 링크된 디렉토리도 탐색한다. 이 때 이미 탐색한 디렉토리를 
+        가리키는 링크는 탐색하지 않고 건너뛰므로, 링크가 상위 디렉토리를 
+        가리켜 순환이 생기더라도 탐색이 끝난다. 
+        False 시 심볼릭 링크는 링크 대상과 상관없이 파일처럼 취급한다.
+    include : Iterable[str] | None, default None
+        반환할 파일 및 leaf 디렉토리의 glob 패턴들. 
+        하나라도 일치하는 entity만 반환한다. 
+        '/'가 없는 패턴(예: '*.log')은 entity의 이름과, '/'가 있는 패턴
+        (예: '2024-*/*.log')은 루트 디렉토리로부터의 상대경로와 비교한다. 
+        하위 디렉토리 탐색 여부에는 영향을 주지 않는다.
+    exclude : Iterable[str] | None, default None
+        제외할 파일 및 디렉토리의 glob 패턴들. 패턴 비교 방식은 include와 같다. 
+        패턴과 일치하는 디렉토리는 열지 않으므로 그 안의 entity들도 모두 제외된다.
+        예) ['.git', 'node_modules', '*.tmp']
+    extensions : Iterable[str] | None, default None
+        반환할 파일들의 확장자들. 예) ['.log', 'txt']
+        입력 시 해당 확장자를 가지는 파일들만 반환하며, leaf 디렉토리는 
+        반환하지 않는다.
+    max_depth : int | None, default None
+        탐색할 최대 깊이. 루트 디렉토리 바로 아래의 entity들의 깊이가 1이다. 
+        해당 깊이의 디렉토리는 열지 않고 그 경로를 leaf 디렉토리처럼 반환한다. 
+        None 시 깊이 제한 없이 탐색한다.
+    predicate : Callable[[os.DirEntry], bool] | None, default None
+        os.DirEntry 객체를 받아 False를 반환하면 해당 entity를 제외하는 함수. 
+        exclude와 마찬가지로 제외된 디렉토리는 열지 않는다. 
+        DirEntry.stat() 등 캐시된 정보로 판단하면 추가 시스템 콜이 적다.
+
+    Yields
+    ------
+    str
+        루트 디렉토리 내 최하위 파일 및 디렉토리의 경로.
+
+    """
+    root_dir = os.path.abspath(root_dir)
+    # 상대경로 변환 시 잘라낼 루트 디렉토리 경로 부분의 길이.
+    prefix_len = len(os.path.join(root_dir, ''))
+    is_excluded, is_selected = _make_entry_filters(
+        prefix_len, include, exclude, extensions, predicate
+    )
+    if max_depth is not None and max_depth < 1: return
+    # 이미 탐색한 디렉토리들의 (장치 번호, inode 번호).
+    visited: set[tuple[int, int]] = set()
+
+    def scan(dirpath: DirPath) -> (list[os.DirEntry] | None):
+        """디렉토리 내 entity들을 반환. 이미 탐색한 디렉토리면 None을 반환."""
+        if follow_symlinks:
+            st = os.stat(dirpath)
+            key = (st.st_dev, st.st_ino)
+            if key in visited: return None
+            visited.add(key)
+        with os.scandir(dirpath) as it:
+            return list(it)
+
+    root_entities = scan(root_dir)
+    # 디렉토리별 아직 확인하지 않은 entity들의 이터레이터를 쌓아두는 스택.
+    # 스택의 길이가 곧 확인하는 entity들의 깊이이다.
+    stack = [iter(root_entities)]
+    while stack:
+        for entry in stack[-1]:
+            if is_excluded is not None and is_excluded(entry): continue
+            is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+            if is_dir and (max_depth is None or len(stack) < max_depth):
+                entities = scan(entry.path)
+                if entities is None: continue
+                if entities:
+                    stack.append(iter(entities))
+                    break
+            # 파일 또는 leaf 디렉토리인 경우.
+            if is_selected is not None and not is_selected(entry, is_dir): continue
+            yield entry.path if to_abspath else entry.path[prefix_len:]
         else:
-            str_len = - len(string)
-        heap_list.append((str_len, string))
-    heapq.heapify(heap_list)
-    result = []
-    while heap_list:
-        result.append(heapq.heappop(heap_list)[1])
-    return result
+            stack.pop()
 
 def get_all_in_rootdir(
         root_dir: DirPath, 
-        to_abspath: bool = True
+        to_abspath: bool = True,
+        follow_symlinks: bool = True,
+        max_workers: int = 1,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        predicate: EntryPredicate | None = None
     ) -> (list[str]):
     """루트 디렉토리 경로가 주어지면 해당 디렉토리 내 
     모든 파일들과 leaf 디렉토리의 경로들을 리스트로 묶어 반환.
@@ -83,41 +356,651 @@ def get_all_in_rootdir(
         True 시 절대경로로 반환한다.
         False 시 상대경로로 반환한다. 여기서 상대경로는 해당 절대경로에서 
         root_dir로 지정된 루트 디렉토리의 절대경로를 뺀 경로이다.
+    follow_symlinks : bool, default True
+        디렉토리를 가리키는 심볼릭 링크 안을 탐색할지를 결정하는 매개변수. 
+        iter_all_in_rootdir() 함수 참고.
+    max_workers : int, default 1
+        디렉토리를 탐색할 스레드 수. 
+        2 이상이면 iter_all_in_rootdir_parallel() 함수로 여러 스레드가 
+        동시에 탐색하며, 반환되는 경로들의 순서는 1일 때와 같다.
+    include, exclude, extensions, max_depth, predicate
+        탐색 및 반환 대상을 거르는 조건들. iter_all_in_rootdir() 함수 참고.
 
     Returns
     -------
     list[str]
         루트 디렉토리 내 모든 최하위 파일 및 디렉토리들의 절대경로의 
         리스트.
+
+    Notes
+    -----
+    이 함수는 내부적으로 iter_all_in_rootdir() 또는 
+    iter_all_in_rootdir_parallel() 함수를 사용함.
     
     """
-    results: list[str] = []
+    filters = {
+        'include': include, 'exclude': exclude, 'extensions': extensions,
+        'max_depth': max_depth, 'predicate': predicate
+    }
+    if max_workers > 1:
+        return list(iter_all_in_rootdir_parallel(
+            root_dir, to_abspath, follow_symlinks, max_workers, 
+            ordered=True, **filters
+        ))
+    return list(iter_all_in_rootdir(
+        root_dir, to_abspath, follow_symlinks, **filters
+    ))
+
+def iter_all_in_rootdir_parallel(
+        root_dir: DirPath, 
+        to_abspath: bool = True,
+        follow_symlinks: bool = True,
+        max_workers: int | None = None,
+        ordered: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        predicate: EntryPredicate | None = None
+    ) -> (Iterator[Path]):
+    """iter_all_in_rootdir()와 같으나, 여러 스레드가 하위 디렉토리들을 
+    나누어 동시에 탐색하는 제너레이터.
+
+    네트워크 드라이브처럼 디렉토리를 읽는 데 오래 걸리거나 하위 디렉토리가 
+    매우 많은 디렉토리 트리를 탐색할 때 사용한다. 
+    각 스레드는 자신의 작업 큐에 쌓인 하위 디렉토리들을 나중에 찾은 것부터 
+    탐색하며, 자신의 작업 큐가 비면 다른 스레드의 작업 큐에서 가장 먼저 
+    쌓인 디렉토리를 가져와(work stealing) 탐색한다.
+
+    Parameters
+    ----------
+    root_dir : str
+        루트 디렉토리 경로
+    to_abspath : bool, default True
+        iter_all_in_rootdir() 함수 참고.
+    follow_symlinks : bool, default True
+        iter_all_in_rootdir() 함수 참고. 
+        같은 디렉토리를 가리키는 경로가 여러 개일 때 그 중 어느 경로로 
+        탐색될지는 스레드들의 탐색 순서에 따라 달라질 수 있다.
+    max_workers : int | None, default None
+        디렉토리를 탐색할 스레드 수. 
+        None 시 concurrent.futures.ThreadPoolExecutor의 기본값을 따른다.
+    ordered : bool, default False
+        True 시 iter_all_in_rootdir()와 같은 순서로 경로들을 반환한다. 
+        이 때 앞선 디렉토리의 탐색이 끝날 때까지 뒤의 디렉토리들의 
+        탐색 결과를 보관해둔다. 
+        False 시 탐색이 끝난 디렉토리의 경로들부터 바로 반환한다.
+    include, exclude, extensions, max_depth, predicate
+        탐색 및 반환 대상을 거르는 조건들. iter_all_in_rootdir() 함수 참고. 
+        predicate 함수는 여러 스레드에서 동시에 호출될 수 있다.
+
+    Yields
+    ------
+    str
+        루트 디렉토리 내 최하위 파일 및 디렉토리의 경로.
+
+    """
     root_dir = os.path.abspath(root_dir)
-    
-    def search(dirpath: DirPath):
-        entities = os.listdir(dirpath)
-        if not entities:
-            # leaf 디렉토리인 경우, 해당 디렉토리 경로를
-            # 결과에 추가한다.
-            if dirpath != root_dir:
-                results.append(dirpath)
-            return
-        for entity in entities:
-            if os.path.splitext(entity)[1]:
-                # 해당 entity가 파일일 경우.
-                results.append(os.path.join(dirpath, entity))
-            else:
-                # 해당 entity가 디렉토리일 경우.
-                subdir_path = os.path.join(dirpath, entity)
-                search(subdir_path)
+    prefix_len = len(os.path.join(root_dir, ''))
+    is_excluded, is_selected = _make_entry_filters(
+        prefix_len, include, exclude, extensions, predicate
+    )
+    if max_depth is not None and max_depth < 1: return
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+    visited: set[tuple[int, int]] = set()
+    visited_lock = threading.Lock()
 
-    search(root_dir)
+    # 스레드별 작업 큐. 작업은 (디렉토리 번호, 디렉토리 경로, 깊이, 
+    # 빈 디렉토리일 경우 반환 대상인지 여부).
+    task_queues = [deque() for _ in range(max_workers)]
+    task_queues[0].append((0, root_dir, 0, False))
+    task_ids = itertools.count(1)
+    # 탐색이 끝나지 않은 디렉토리 수와 중단 여부. condition으로 보호된다.
+    state = {'pending': 1, 'stop': False}
+    condition = threading.Condition()
+    # (디렉토리 번호, 디렉토리 경로, 탐색 결과 또는 예외)
+    results = queue.SimpleQueue()
 
-    if not to_abspath:
-        for i, res in enumerate(results):
-            results[i] = os.path.relpath(res, root_dir)
-    
-    return results
+    def scan(dirpath: DirPath, depth: int, selected: bool) -> (list | int):
+        """디렉토리를 탐색하여, 반환할 파일 및 leaf 디렉토리의 경로와 
+        열어볼 하위 디렉토리의 작업들의 리스트를 반환. 
+        반환할 빈 디렉토리면 _EMPTY_DIR, 이미 탐색했거나 반환하지 않는 
+        빈 디렉토리면 _SKIPPED_DIR를 반환."""
+        if follow_symlinks:
+            st = os.stat(dirpath)
+            key = (st.st_dev, st.st_ino)
+            with visited_lock:
+                if key in visited: return _SKIPPED_DIR
+                visited.add(key)
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+        if not entries: return _EMPTY_DIR if selected else _SKIPPED_DIR
+        items = []
+        for entry in entries:
+            if is_excluded is not None and is_excluded(entry): continue
+            is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+            leaf_selected = is_selected is None or is_selected(entry, is_dir)
+            if is_dir and (max_depth is None or depth + 1 < max_depth):
+                items.append((next(task_ids), entry.path, depth + 1, leaf_selected))
+            elif leaf_selected:
+                items.append(entry.path if to_abspath else entry.path[prefix_len:])
+        return items
+
+    def take_task(worker_id: int) -> (tuple[int, DirPath, int, bool] | None):
+        """자신의 작업 큐에서 가장 나중에 쌓인 작업을 꺼내고, 비어있으면 
+        다른 스레드의 작업 큐에서 가장 먼저 쌓인 작업을 가져온다."""
+        try:
+            return task_queues[worker_id].pop()
+        except IndexError:
+            pass
+        for i in range(1, max_workers):
+            try:
+                return task_queues[(worker_id + i) % max_workers].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def work(worker_id: int) -> (None):
+        while True:
+            # 제너레이터가 중간에 닫히거나 예외가 발생하면 남은 작업이 있어도 
+            # 더 이상 탐색하지 않는다.
+            with condition:
+                if state['stop']: return
+            task = take_task(worker_id)
+            if task is None:
+                with condition:
+                    while (not state['stop'] and state['pending'] 
+                           and not any(task_queues)):
+                        condition.wait()
+                    if state['stop'] or not state['pending']: return
+                continue
+            task_id, dirpath, depth, selected = task
+            try:
+                items = scan(dirpath, depth, selected)
+            except Exception as e:
+                # 예외는 제너레이터를 소비하는 쪽에서 다시 발생시킨다.
+                items = e
+            subdirs = []
+            if type(items) == list:
+                subdirs = [item for item in items if type(item) == tuple]
+            with condition:
+                if state['stop']: return
+                state['pending'] += len(subdirs) - 1
+                task_queues[worker_id].extend(subdirs)
+                if not state['pending']: condition.notify_all()
+                elif subdirs: condition.notify(len(subdirs))
+            results.put((task_id, dirpath, items))
+
+    # ordered가 True일 때, 아직 반환하지 않은 디렉토리들의 탐색 결과.
+    finished: dict[int, list | int] = {}
+
+    def get_result(task_id: int) -> (list | int):
+        """해당 번호의 디렉토리 탐색 결과를 반환. 
+        다른 디렉토리의 결과가 먼저 오면 보관해둔다."""
+        while task_id not in finished:
+            done_id, dirpath, items = results.get()
+            if isinstance(items, Exception): raise items
+            finished[done_id] = items
+        return finished.pop(task_id)
+
+    executor = ThreadPoolExecutor(max_workers)
+    try:
+        for worker_id in range(max_workers):
+            executor.submit(work, worker_id)
+        if ordered:
+            items = get_result(0)
+            if type(items) != list: return
+            stack = [iter(items)]
+            while stack:
+                for item in stack[-1]:
+                    if type(item) != tuple:
+                        yield item
+                        continue
+                    task_id, dirpath = item[:2]
+                    sub_items = get_result(task_id)
+                    if type(sub_items) == list:
+                        stack.append(iter(sub_items))
+                        break
+                    if sub_items == _EMPTY_DIR:
+                        yield dirpath if to_abspath else dirpath[prefix_len:]
+                else:
+                    stack.pop()
+        else:
+            remaining = 1
+            while remaining:
+                task_id, dirpath, items = results.get()
+                remaining -= 1
+                if isinstance(items, Exception): raise items
+                if items == _EMPTY_DIR:
+                    yield dirpath if to_abspath else dirpath[prefix_len:]
+                    continue
+                if items == _SKIPPED_DIR: continue
+                for item in items:
+                    if type(item) == tuple: remaining += 1
+                    else: yield item
+    finally:
+        with condition:
+            state['stop'] = True
+            for task_queue in task_queues: task_queue.clear()
+            condition.notify_all()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+class EntryInfo(NamedTuple):
+    """iter_info_in_rootdir()에서 반환하는 entity의 정보."""
+    path: Path
+    is_dir: bool
+    size: int  # 바이트. 디렉토리인 경우 디렉토리 자체의 크기.
+    mtime: float  # 최종 수정 시각. os.path.getmtime()과 같다.
+    ctime: float  # os.path.getctime()과 같다. (윈도우에서는 생성 시각)
+    inode: int  # 심볼릭 링크를 따라간 경우 링크 대상의 inode 번호.
+
+def iter_info_in_rootdir(
+        root_dir: DirPath, 
+        to_abspath: bool = True,
+        follow_symlinks: bool = True,
+        include_dirs: bool = False,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        predicate: EntryPredicate | None = None
+    ) -> (Iterator[EntryInfo]):
+    """iter_all_in_rootdir()와 같은 entity들을 탐색하되, 경로 대신 
+    크기, 수정 시각 등의 정보를 담은 EntryInfo 객체를 하나씩 반환하는 제너레이터.
+
+    정보는 탐색 중 얻는 os.DirEntry.stat()의 결과로 채우므로, 경로만 얻은 뒤 
+    os.path.getsize() 등으로 entity마다 다시 조회하는 것보다 시스템 콜이 적다. 
+    (윈도우에서는 디렉토리를 읽을 때 함께 얻으므로 추가 시스템 콜이 없다.)
+
+    Parameters
+    ----------
+    root_dir : str
+        루트 디렉토리 경로
+    to_abspath : bool, default True
+        EntryInfo.path를 절대경로 또는 상대경로로 반환할 지 결정하는 매개변수. 
+        get_all_in_rootdir() 함수 참고.
+    follow_symlinks : bool, default True
+        심볼릭 링크를 따라갈지를 결정하는 매개변수. 
+        True 시 링크 대상의 정보를, False 시 링크 자체의 정보를 반환한다. 
+        iter_all_in_rootdir() 함수 참고.
+    include_dirs : bool, default False
+        True 시 leaf 디렉토리가 아닌, 탐색한 디렉토리들의 정보도 반환한다. 
+        각 디렉토리의 정보는 그 안의 모든 entity들의 정보 다음에 반환되므로, 
+        하위 트리의 합계 등을 한 번의 탐색으로 구할 수 있다. 
+        루트 디렉토리의 정보는 반환하지 않는다.
+    include, exclude, extensions, max_depth, predicate
+        탐색 및 반환 대상을 거르는 조건들. iter_all_in_rootdir() 함수 참고. 
+        include_dirs로 반환하는 디렉토리들에는 include, extensions가 
+        적용되지 않는다.
+
+    Yields
+    ------
+    EntryInfo
+        루트 디렉토리 내 최하위 파일 및 디렉토리의 정보.
+
+    See Also
+    --------
+    get_dir_sizes
+
+    """
+    root_dir = os.path.abspath(root_dir)
+    prefix_len = len(os.path.join(root_dir, ''))
+    is_excluded, is_selected = _make_entry_filters(
+        prefix_len, include, exclude, extensions, predicate
+    )
+    if max_depth is not None and max_depth < 1: return
+    visited: set[tuple[int, int]] = set()
+    if follow_symlinks:
+        st = os.stat(root_dir)
+        visited.add((st.st_dev, st.st_ino))
+
+    # EntryInfo()보다 빠르게 EntryInfo 객체를 만든다.
+    make_info = EntryInfo._make
+
+    with os.scandir(root_dir) as it:
+        root_entities = list(it)
+    # (아직 확인하지 않은 entity들의 이터레이터, 해당 디렉토리의 정보)의 스택.
+    stack: list[tuple[Iterator[os.DirEntry], EntryInfo | None]] = [
+        (iter(root_entities), None)
+    ]
+    while stack:
+        for entry in stack[-1][0]:
+            if is_excluded is not None and is_excluded(entry): continue
+            is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+            followed = follow_symlinks
+            try:
+                st = entry.stat(follow_symlinks=follow_symlinks)
+            except FileNotFoundError:
+                # 대상이 없는 심볼릭 링크인 경우.
+                st = entry.stat(follow_symlinks=False)
+                followed = False
+            # inode 번호도 크기, 시각과 같은 stat 결과에서 얻는다. 
+            # DirEntry.inode()는 심볼릭 링크 자체의 inode 번호이다.
+            inode = st.st_ino
+            if not inode:
+                # 윈도우에서는 DirEntry.stat()의 st_ino가 0이다.
+                if followed and entry.is_symlink():
+                    st = os.stat(entry.path)
+                    inode = st.st_ino
+                else: inode = entry.inode()
+            if is_dir and (max_depth is None or len(stack) < max_depth):
+                if follow_symlinks:
+                    if not st.st_ino:
+                        # 윈도우에서는 DirEntry.stat()의 st_dev, st_ino가 0이다.
+                        st = os.stat(entry.path)
+                    key = (st.st_dev, st.st_ino)
+                    if key in visited: continue
+                    visited.add(key)
+                with os.scandir(entry.path) as it:
+                    entities = list(it)
+                if entities:
+                    info = None
+                    if include_dirs:
+                        info = make_info((
+                            entry.path if to_abspath else entry.path[prefix_len:],
+                            True, st.st_size, st.st_mtime, st.st_ctime, inode
+                        ))
+                    stack.append((iter(entities), info))
+                    break
+            # 파일 또는 leaf 디렉토리인 경우.
+            if is_selected is not None and not is_selected(entry, is_dir): continue
+            yield make_info((
+                entry.path if to_abspath else entry.path[prefix_len:],
+                is_dir, st.st_size, st.st_mtime, st.st_ctime, inode
+            ))
+        else:
+            info = stack.pop()[1]
+            if info is not None: yield info
+
+def get_dir_sizes(
+        root_dir: DirPath, 
+        to_abspath: bool = True,
+        follow_symlinks: bool = True,
+        report_depth: int | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        predicate: EntryPredicate | None = None
+    ) -> (dict[DirPath, int]):
+    """루트 디렉토리와 그 안의 모든 디렉토리들 각각에 대해, 해당 디렉토리 안의 
+    모든 파일들의 크기(바이트)의 합을 반환하는 함수. (du 명령어와 비슷함)
+
+    iter_info_in_rootdir()와 같은 방식으로 한 번만 탐색하며, 하위 디렉토리의 
+    합계를 상위 디렉토리에 더해 나가는 방식으로 구한다. 
+    파일의 크기는 os.stat()의 st_size이며, 디스크 블록 단위로 계산하지 않는다. 
+
+    예) 크기가 가장 큰 날짜 디렉토리 세 개. (루트 디렉토리 포함)
+
+        sizes = get_dir_sizes(log_base_dir, report_depth=1)
+        sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:3]
+
+    Parameters
+    ----------
+    root_dir : str
+        루트 디렉토리 경로
+    to_abspath : bool, default True
+        반환할 디렉토리 경로들을 절대경로 또는 상대경로로 반환할 지 결정하는 
+        매개변수. 상대경로인 경우 루트 디렉토리는 ''로 나타낸다.
+    follow_symlinks : bool, default True
+        심볼릭 링크를 따라갈지를 결정하는 매개변수. 
+        iter_info_in_rootdir() 함수 참고.
+    report_depth : int | None, default None
+        결과에 포함할 디렉토리의 최대 깊이. 루트 디렉토리의 깊이가 0이다. 
+        탐색 깊이는 제한하지 않으므로 합계에는 더 깊은 곳의 파일들도 포함된다. 
+        None 시 모든 디렉토리를 포함한다.
+    include, exclude, extensions, predicate
+        합계에 포함할 파일들을 거르는 조건들. iter_all_in_rootdir() 함수 참고.
+
+    Returns
+    -------
+    dict[str, int]
+        디렉토리 경로를 키로, 해당 디렉토리 내 파일 크기의 합을 값으로 
+        가지는 딕셔너리. 하위 디렉토리가 상위 디렉토리보다 먼저 오며, 
+        루트 디렉토리가 마지막에 온다.
+
+    """
+    root_dir = os.path.abspath(root_dir)
+    prefix_len = len(os.path.join(root_dir, ''))
+    is_excluded, is_selected = _make_entry_filters(
+        prefix_len, include, exclude, extensions, predicate
+    )
+    visited: set[tuple[int, int]] = set()
+    if follow_symlinks:
+        st = os.stat(root_dir)
+        visited.add((st.st_dev, st.st_ino))
+
+    sizes: dict[DirPath, int] = {}
+    with os.scandir(root_dir) as it:
+        root_entities = list(it)
+    # [아직 확인하지 않은 entity들의 이터레이터, 디렉토리의 상대경로, 
+    # 현재까지의 파일 크기 합계]의 스택.
+    stack = [[iter(root_entities), '', 0]]
+    while stack:
+        frame = stack[-1]
+        for entry in frame[0]:
+            if is_excluded is not None and is_excluded(entry): continue
+            if entry.is_dir(follow_symlinks=follow_symlinks):
+                if follow_symlinks:
+                    st = entry.stat()
+                    if not st.st_ino: st = os.stat(entry.path)
+                    key = (st.st_dev, st.st_ino)
+                    if key in visited: continue
+                    visited.add(key)
+                with os.scandir(entry.path) as it:
+                    entities = list(it)
+                if entities:
+                    stack.append([iter(entities), entry.path[prefix_len:], 0])
+                    break
+                # 빈 디렉토리인 경우.
+                if is_selected is None or is_selected(entry, True):
+                    sizes[entry.path[prefix_len:]] = 0
+                continue
+            if is_selected is not None and not is_selected(entry, False): continue
+            try:
+                frame[2] += entry.stat(follow_symlinks=follow_symlinks).st_size
+            except FileNotFoundError:
+                # 대상이 없는 심볼릭 링크인 경우.
+                frame[2] += entry.stat(follow_symlinks=False).st_size
+        else:
+            _, relpath, size = stack.pop()
+            sizes[relpath] = size
+            if stack: stack[-1][2] += size
+
+    if report_depth is not None:
+        sizes = {
+            path: size for path, size in sizes.items() 
+            if not path or path.count(os.sep) < report_depth
+        }
+    if to_abspath:
+        prefix = os.path.join(root_dir, '')
+        sizes = {
+            (prefix + path if path else root_dir): size 
+            for path, size in sizes.items()
+        }
+    return sizes
+
+def _hash_file_edges(file_path: Path, size: int) -> (tuple[str | None, bool]):
+    """파일의 앞, 뒤 _HASH_EDGE_SIZE 바이트의 해시값을 반환. 
+    파일이 그보다 작으면 파일 전체의 해시값을 반환하며, 이 경우 두 번째 반환값이 
+    True이다. 파일을 읽을 수 없으면 해시값 대신 None을 반환한다.
+    ProcessPoolExecutor에서 쓸 수 있도록 모듈 수준 함수로 둔다."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(file_path, 'rb') as file:
+            if size <= 2 * _HASH_EDGE_SIZE:
+                h.update(file.read())
+                return h.hexdigest(), True
+            h.update(file.read(_HASH_EDGE_SIZE))
+            file.seek(-_HASH_EDGE_SIZE, os.SEEK_END)
+            h.update(file.read(_HASH_EDGE_SIZE))
+    except OSError:
+        return None, False
+    return h.hexdigest(), False
+
+def _hash_file(file_path: Path) -> (str | None):
+    """파일 전체를 _HASH_BLOCK_SIZE씩 읽어 해시값을 반환. 
+    파일을 읽을 수 없으면 None을 반환."""
+    h = hashlib.blake2b(digest_size=16)
+    buffer = bytearray(_HASH_BLOCK_SIZE)
+    view = memoryview(buffer)
+    try:
+        with open(file_path, 'rb', buffering=0) as file:
+            while n := file.readinto(buffer):
+                h.update(view[:n])
+    except OSError:
+        return None
+    return h.hexdigest()
+
+def find_duplicate_files(
+        root_dir: DirPath, 
+        to_abspath: bool = True,
+        min_size: int = 1,
+        max_workers: int = 1,
+        cache_path: str | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        extensions: Iterable[str] | None = None,
+        predicate: EntryPredicate | None = None
+    ) -> (list[list[Path]]):
+    """루트 디렉토리 내에서 내용이 같은 파일들을 찾아 반환하는 함수.
+
+    모든 파일을 끝까지 읽지 않도록 다음 순서로 후보를 줄여나간다.
+    1. 크기가 같은 파일들끼리 묶는다. 
+    2. 크기가 같은 파일이 있는 파일들만 앞, 뒤 64KB를 읽어 해시값을 구하고, 
+    해시값이 같은 파일들끼리 묶는다. (128KB 이하의 파일은 여기서 끝남)
+    3. 해시값이 같은 파일이 있는 파일들만 전체를 읽어 해시값을 구한다.
+
+    같은 파일을 가리키는 하드 링크들은 한 번만 읽으며, 같은 그룹으로 반환된다. 
+    심볼릭 링크는 따라가지 않는다.
+
+    Parameters
+    ----------
+    root_dir : str
+        루트 디렉토리 경로
+    to_abspath : bool, default True
+        반환할 파일 경로들을 절대경로 또는 상대경로로 반환할 지 결정하는 
+        매개변수. get_all_in_rootdir() 함수 참고.
+    min_size : int, default 1
+        비교할 파일의 최소 크기(바이트). 기본값은 빈 파일들을 제외한다.
+    max_workers : int, default 1
+        해시값을 구할 프로세스 수. 
+        2 이상이면 ProcessPoolExecutor로 여러 프로세스가 나누어 파일을 읽는다. 
+        이 경우 윈도우 등에서는 이 함수를 호출하는 스크립트에 
+        if __name__ == '__main__': 구문이 있어야 한다.
+    cache_path : str | None, default None
+        해시값들을 저장할 JSON 파일 경로. 
+        입력 시 해당 파일에 저장된 해시값들 중 (inode 번호, 수정 시각, 크기)가 
+        같은 파일의 해시값은 다시 구하지 않으며, 탐색 후 이번에 탐색한 
+        파일들의 해시값들로 해당 파일을 덮어쓴다. 
+        파일이 없거나 형식이 잘못된 경우 빈 캐시로 시작한다.
+    include, exclude, extensions, predicate
+        비교할 파일들을 거르는 조건들. iter_all_in_rootdir() 함수 참고.
+
+    Returns
+    -------
+    list[list[str]]
+        내용이 같은 파일 경로들의 리스트들. 각 리스트는 경로 순으로 정렬되며, 
+        리스트들은 파일 크기가 큰 것부터 정렬된다. 
+        탐색 도중 삭제되는 등 읽을 수 없는 파일들은 제외된다.
+
+    """
+    # "inode 번호:수정 시각:크기" -> [앞, 뒤 부분 해시값, 전체 해시값 | None]
+    cache: dict[str, list[str | None]] = {}
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data['version'] == _HASH_CACHE_VERSION:
+                cache = {
+                    key: value for key, value in data['hashes'].items()
+                    if type(value) == list and len(value) == 2
+                }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            cache = {}
+
+    # 크기별 {캐시 key: 경로들}. 하드 링크들은 같은 key를 가진다.
+    by_size: dict[int, dict[str, list[Path]]] = {}
+    # inode 번호를 얻을 수 없는 파일 시스템의 파일들. 경로를 key로 쓰며 캐시하지 않는다.
+    uncacheable: set[str] = set()
+    for info in iter_info_in_rootdir(
+            root_dir, to_abspath, follow_symlinks=False, include=include,
+            exclude=exclude, extensions=extensions, predicate=predicate):
+        if info.is_dir or info.size < min_size: continue
+        if info.inode:
+            key = f"{info.inode}:{info.mtime!r}:{info.size}"
+        else:
+            key = info.path
+            uncacheable.add(key)
+        by_size.setdefault(info.size, {}).setdefault(key, []).append(info.path)
+
+    # 내용이 같은 것으로 확인된 (크기, 해시값 등)별 경로들.
+    groups: dict[tuple[int, str], list[Path]] = {}
+    # 1. 크기가 같은 다른 파일이 있는 파일들만 남긴다. 
+    # 하드 링크들만 있는 경우 파일을 읽지 않고 같은 그룹으로 둔다.
+    files: dict[str, list[Path]] = {}
+    sizes: dict[str, int] = {}
+    for size, keys in by_size.items():
+        if len(keys) == 1:
+            key, paths = keys.popitem()
+            if len(paths) > 1: groups[(size, key)] = paths
+            continue
+        for key, paths in keys.items():
+            files[key] = paths
+            sizes[key] = size
+
+    root_prefix = '' if to_abspath else os.path.join(os.path.abspath(root_dir), '')
+    def hash_all(func: Callable, keys: list[str], *args) -> (list):
+        """keys에 해당하는 파일들의 해시값을 구한다."""
+        paths = [root_prefix + files[key][0] for key in keys]
+        if max_workers > 1 and len(keys) > 1:
+            chunksize = max(1, len(keys) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers) as executor:
+                return list(executor.map(func, paths, *args, chunksize=chunksize))
+        return list(map(func, paths, *args))
+
+    # 2. 앞, 뒤 부분의 해시값으로 묶는다.
+    uncached = [key for key in files if key not in cache]
+    edge_hashes = hash_all(_hash_file_edges, uncached, [sizes[key] for key in uncached])
+    for key, (edge_hash, complete) in zip(uncached, edge_hashes):
+        if edge_hash is not None:
+            cache[key] = [edge_hash, edge_hash if complete else None]
+    by_edge: dict[tuple[int, str], list[str]] = {}
+    for key in files:
+        if key in cache:
+            by_edge.setdefault((sizes[key], cache[key][0]), []).append(key)
+
+    # 3. 앞, 뒤 부분의 해시값이 같은 파일들만 전체 해시값으로 묶는다.
+    candidates = []
+    for group in by_edge.values():
+        if len(group) > 1: 
+            candidates.extend(group)
+        elif len(files[group[0]]) > 1:
+            groups[(sizes[group[0]], group[0])] = files[group[0]]
+    uncached = [key for key in candidates if cache[key][1] is None]
+    for key, full_hash in zip(uncached, hash_all(_hash_file, uncached)):
+        cache[key][1] = full_hash
+    for key in candidates:
+        full_hash = cache[key][1]
+        if full_hash is not None:
+            groups.setdefault((sizes[key], full_hash), []).extend(files[key])
+
+    if cache_path is not None:
+        # 이번에 탐색한 파일들의 해시값들만 저장한다.
+        hashes = {
+            key: cache[key] for key in files 
+            if key in cache and key not in uncacheable
+        }
+        with open(cache_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': _HASH_CACHE_VERSION, 'hashes': hashes}, 
+                      file, separators=(',', ':'))
+
+    duplicates = [
+        (size, sorted(paths)) for (size, _), paths in groups.items() 
+        if len(paths) > 1
+    ]
+    duplicates.sort(key=lambda item: (-item[0], item[1]))
+    return [paths for _, paths in duplicates]
 
 def get_ptree_from_rootdir(
         root_dir: DirPath, 
@@ -143,18 +1026,68 @@ def get_ptree_from_rootdir(
 
     Notes
     -----
-    이 함수는 내부적으로 get_all_in_rootdir() 함수를 사용함.
+    이 함수는 내부적으로 get_all_in_rootdir() 함수를 사용함. 
+    경로의 구분 기호로 os.sep을 사용한다.
 
     """
     leaf_path = get_all_in_rootdir(root_dir, to_abspath)
-    ptree = PathTree(delimiter='\\')
+    ptree = PathTree(delimiter=os.sep)
+    if not to_abspath:
+        prefix = _get_tree_prefix(root_dir)
+        leaf_path = [prefix + path for path in leaf_path]
     ptree.appendAll(leaf_path)
     return ptree
 
-def visualize_rootdir(
+def _get_tree_prefix(root_dir: DirPath) -> (str):
+    """루트 디렉토리로부터의 상대경로 앞에 붙여, 루트 디렉토리명으로 시작하는 
+    PathTree 절대경로로 만드는 접두사를 반환."""
+    root_dir = os.path.abspath(root_dir)
+    return os.path.join(os.path.basename(root_dir) or root_dir, '')
+
+def _get_tree_sizes(
         root_dir: DirPath,
         to_abspath: bool = True
-    ) -> (str):
+    ) -> (tuple[list[str], dict[str, dict[str, int]]]):
+    """iter_info_in_rootdir()로 한 번 탐색하여, PathTree에 넣을 경로들과 
+    경로별 {'size': 크기, 'files': 파일 수} 딕셔너리를 반환. 
+    파일은 'size'만 가지며, 디렉토리의 'size', 'files'는 그 안의 모든 
+    파일들의 크기 합과 개수이다."""
+    root_path = os.path.abspath(root_dir)
+    prefix = ''
+    if not to_abspath:
+        prefix = _get_tree_prefix(root_dir)
+        root_path = prefix[:-len(os.sep)]
+    paths: list[str] = []
+    info: dict[str, dict[str, int]] = {}
+    # 아직 결과를 확정하지 않은 디렉토리별 [크기 합, 파일 수]. 
+    # iter_info_in_rootdir()는 하위 entity들을 디렉토리보다 먼저 반환한다.
+    totals: dict[str, list[int]] = {}
+    for entry in iter_info_in_rootdir(root_dir, to_abspath, include_dirs=True):
+        path = prefix + entry.path
+        paths.append(path)
+        if entry.is_dir:
+            size, files = totals.pop(path, (0, 0))
+            info[path] = {'size': size, 'files': files}
+        else:
+            size, files = entry.size, 1
+            info[path] = {'size': size}
+        parent = path.rpartition(os.sep)[0] or root_path
+        total = totals.get(parent)
+        if total is None: totals[parent] = [size, files]
+        else:
+            total[0] += size
+            total[1] += files
+    size, files = totals.pop(root_path, (0, 0))
+    info[root_path] = {'size': size, 'files': files}
+    return paths, info
+
+def visualize_rootdir(
+        root_dir: DirPath,
+        to_abspath: bool = True,
+        file: TextIO | None = None,
+        fmt: ExportFormat = TEXT,
+        with_sizes: bool = False
+    ) -> (str | None):
     """루트 디렉토리의 경로가 주어지면 해당 루트 디렉토리 내 모든 
     최하위 디렉토리 및 파일들을 탐색하여 이를 트리 구조 형태의 문자열로 
     재구성하여 반환하는 함수.
@@ -167,20 +1100,60 @@ def visualize_rootdir(
         루트 디렉토리 내 최하위 디렉토리 및 파일들의 경로를 절대경로 
         또는 상대경로로 저장할지 결정하는 매개변수.
         True 시 절대경로로, False 시 루트 디렉토리명으로 시작하는 상대경로로 저장.
+    file : TextIO | None, default None
+        트리 구조 문자열을 쓸 텍스트 파일 객체(open()으로 연 파일, 
+        sys.stdout 등). 입력 시 트리 구조 전체를 하나의 문자열로 만들지 않고 
+        한 줄씩 file에 바로 쓴다.
+    fmt : int, default TEXT
+        출력 형식. submodules.tree 모듈의 TEXT(상자 그리기 문자 트리), 
+        JSON(중첩된 JSON 객체), OUTLINE(들여쓴 개요), DOT(Graphviz DOT) 
+        상수들 중 하나. PathTree.iterExport() 참고.
+    with_sizes : bool, default False
+        True 시 각 노드에 크기를 덧붙인다. 파일은 크기(size), 
+        디렉토리는 그 안의 모든 파일들의 크기 합(size)과 파일 수(files)를 
+        덧붙이며, 루트 디렉토리의 상위 디렉토리 노드들에는 덧붙이지 않는다. 
+        크기는 iter_info_in_rootdir()로 트리를 만들 때 함께 구하므로 
+        디렉토리 트리를 한 번만 탐색한다.
 
     Returns
     -------
     str
+        file 인자를 입력하지 않은 경우, 트리 구조 문자열.
+    None
+        file 인자를 입력한 경우 또는 fmt가 지원하지 않는 형식인 경우.
+
+    Examples
+    --------
+    예) 'logs' 디렉토리를 크기와 함께 들여쓴 개요로 출력.
+
+        print(visualize_rootdir('logs', False, fmt=OUTLINE, with_sizes=True))
+
+        logs (size=1200, files=2)
+          2024-01-24 (size=1200, files=2)
+            debug.log (size=200)
+            error.log (size=1000)
 
     Notes
     -----
-    이 함수는 내부적으로 get_all_in_rootdir() 함수를 사용함.
+    이 함수는 내부적으로 get_all_in_rootdir() 함수를 사용함. 
+    with_sizes가 True면 iter_info_in_rootdir() 함수를 사용함. 
+    경로의 구분 기호로 os.sep을 사용한다.
 
     """
-    leaf_path = get_all_in_rootdir(root_dir, to_abspath)
-    ptree = PathTree(delimiter='\\')
-    ptree.appendAll(leaf_path)
-    return ptree.getTreeStructure()
+    if with_sizes:
+        paths, info = _get_tree_sizes(root_dir, to_abspath)
+        ptree = PathTree(delimiter=os.sep)
+        ptree.appendAll(paths)
+        annotate = info.get
+    else:
+        ptree = get_ptree_from_rootdir(root_dir, to_abspath)
+        annotate = None
+    if file is not None:
+        ptree.writeExport(file, fmt, annotate)
+        return None
+    buffer = io.StringIO()
+    if not ptree.writeExport(buffer, fmt, annotate): return None
+    return buffer.getvalue()
 
 def validate_if_your_dir_with_ext(
         root_dir: str, 
@@ -287,40 +1260,620 @@ def validate_if_your_dir_with_ext(
     (False, ['log'])가 될 것이다.
 
     """
-    sub_entities = os.listdir(root_dir)
-    proce_exts = []
-    # sub_entities 데이터 전처리.
-    for entity in sub_entities:
-        ext = os.path.splitext(entity)[1]
-        if not ext:
-            ext = 'dir'
-        proce_exts.append(ext)
-    sub_en_ex = zip(sub_entities, proce_exts)
-
-    # include 매개변수 데이터 전처리.
-    processed_include = []
-    for ext in include:
-        if not ext.startswith('.'):
-            ext = '.' + ext
-        processed_include.append(ext)
-
-    is_passed: bool = True
-    failed_because = []
-    for entity, ext in sub_en_ex:
-        if ((not dir_include_ok and ext == 'dir') or
-            (ext != 'dir' and ext not in processed_include)):
-            is_passed = False
-            failed_because.append(entity)
+    rule = DirRule(
+        include, dir_include_ok, required_exts=() if not_include_ok else include
+    )
+    result = rule.validate(root_dir)
+    return (
+        result.is_valid, 
+        result.invalid_entities + [f'no {ext}' for ext in result.missing_exts]
+    )
+
+class DirValidation(NamedTuple):
+    """DirRule.validate()의 검사 결과."""
+    path: DirPath
+    is_valid: bool
+    # 허용되지 않은 확장자의 파일 또는 하위 디렉토리명들.
+    invalid_entities: list[str]
+    # 반드시 있어야 하지만 디렉토리 내에 없는 확장자들.
+    missing_exts: list[str]
+
+class DirRule():
+    """디렉토리가 가져도 되는 파일 확장자, 반드시 가져야 하는 확장자, 
+    하위 디렉토리 허용 여부로 이뤄진 검사 조건 클래스. 
+    여러 디렉토리를 같은 조건으로 검사할 때 확장자 전처리를 한 번만 한다."""
+    def __init__(
+            self, 
+            allowed_exts: Iterable[str],
+            dir_include_ok: bool = False,
+            required_exts: Iterable[str] = ()
+        ):
+        """
+        Parameters
+        ----------
+        allowed_exts : Iterable[str]
+            디렉토리 내 파일들이 가져도 되는 확장자들. 예) ['.log', 'txt'] 
+            이 외의 확장자를 가진 파일이 있으면 검사에 통과하지 못한다.
+        dir_include_ok : bool, default False
+            하위 디렉토리가 있어도 되는지 여부. 
+            validate_if_your_dir_with_ext() 함수 참고.
+        required_exts : Iterable[str], default ()
+            디렉토리 내에 각각 하나 이상 있어야 하는 확장자들. 
+            allowed_exts에 없더라도 가져도 되는 확장자로 간주한다.
+
+        """
+        def normalize(ext: str) -> (str):
+            return ext if ext.startswith('.') else '.' + ext
+
+        self.required_exts = list(dict.fromkeys(map(normalize, required_exts)))
+        self.allowed_exts = frozenset(map(normalize, allowed_exts)).union(
+            self.required_exts)
+        self.dir_include_ok = dir_include_ok
+
+    def validate(self, dirpath: DirPath) -> (DirValidation):
+        """디렉토리를 한 번 읽어 검사 조건을 만족하는지 검사한다. 
+        하위 디렉토리 안은 검사하지 않는다. 
+        디렉토리가 없으면 FileNotFoundError를 일으킨다.
+
+        validate_if_your_dir_with_ext() 함수와 달리, 확장자가 없는 파일과 
+        이름에 '.'이 있는 디렉토리도 파일인지 디렉토리인지 구분하여 검사한다. 
+        (확장자가 없는 파일은 확장자가 ''인 것으로 보며, 허용되지 않는다.)
+        """
+        invalid_entities = []
+        found_exts = set()
+        allowed_exts = self.allowed_exts
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir():
+                    if not self.dir_include_ok: invalid_entities.append(name)
+                    continue
+                dot = name.rfind('.')
+                if name[0] == '.':
+                    # os.path.splitext()와 같이 이름 앞쪽의 '.'들은 확장자로 보지 않는다.
+                    if dot < len(name) - len(name.lstrip('.')): dot = -1
+                ext = name[dot:] if dot > 0 else ''
+                if ext in allowed_exts: found_exts.add(ext)
+                else: invalid_entities.append(name)
+        missing_exts = [ext for ext in self.required_exts if ext not in found_exts]
+        return DirValidation(
+            dirpath, not invalid_entities and not missing_exts, 
+            invalid_entities, missing_exts
+        )
+
+def validate_dirs(
+        dirpaths: Iterable[DirPath],
+        rule: DirRule,
+        max_workers: int = 1
+    ) -> (list[DirValidation | None]):
+    """여러 디렉토리들을 같은 검사 조건으로 검사하는 함수.
+
+    예) 베이스 디렉토리 내 날짜 디렉토리들 중 로그 파일만 가진 디렉토리들.
     
-    # include로 지정된 확장자들 중 대상 디렉토리에는 없는 
-    # 확장자가 있는지 확인.
-    if not not_include_ok:
-        for inc in processed_include:
-            if inc not in proce_exts:
-                is_passed = False
-                failed_because.append(f'no {inc}')
-
-    return is_passed, failed_because
+        rule = DirRule(['.log'])
+        results = validate_dirs(date_dirpaths, rule)
+        [r.path for r in results if r is not None and r.is_valid]
+
+    Parameters
+    ----------
+    dirpaths : Iterable[str]
+        검사할 디렉토리 경로들.
+    rule : DirRule
+        검사 조건.
+    max_workers : int, default 1
+        디렉토리들을 검사할 스레드 수. 2 이상이면 ThreadPoolExecutor로 여러 
+        스레드가 나누어 검사하며, 네트워크 드라이브 등 디렉토리를 읽는 시간이 
+        긴 경우에 효과가 있다.
+
+    Returns
+    -------
+    list[DirValidation | None]
+        dirpaths와 같은 순서의 검사 결과들. 
+        존재하지 않는 디렉토리의 검사 결과는 None이다.
+
+    """
+    def validate(dirpath: DirPath) -> (DirValidation | None):
+        try:
+            return rule.validate(dirpath)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(validate, dirpaths))
+    return list(map(validate, dirpaths))
+
+
+class DirScanCache():
+    """루트 디렉토리 내 디렉토리별 수정 시각과 하위 entity 목록을 보관하여, 
+    다시 탐색할 때 바뀐 디렉토리만 읽는 클래스."""
+    def __init__(self, root_dir: DirPath, to_abspath: bool = True):
+        """
+        디렉토리의 수정 시각(mtime)은 그 디렉토리 바로 아래의 entity가 
+        추가, 삭제, 이름 변경될 때 바뀐다. 이를 이용해 rescan() 호출 시 
+        모든 디렉토리의 수정 시각만 확인하고, 수정 시각이 바뀐 디렉토리만 
+        다시 읽어 이전 탐색 결과와의 차이를 반환한다. 
+        파일 내용의 변경은 추적하지 않으며, 심볼릭 링크는 링크 대상과 
+        상관없이 파일처럼 취급한다.
+
+        Parameters
+        ----------
+        root_dir : str
+            루트 디렉토리 경로
+        to_abspath : bool, default True
+            rescan() 등에서 반환하는 경로들을 절대경로 또는 상대경로로 
+            반환할 지 결정하는 매개변수. get_all_in_rootdir() 함수 참고.
+
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.to_abspath = to_abspath
+        # 경로들은 os.path.join() 대신 아래 접두사들을 이어붙여 만든다.
+        self._abs_prefix = os.path.join(self.root_dir, '')
+        self._root_name = os.path.basename(self.root_dir) or self.root_dir
+        self._tree_prefix = os.path.join(self._root_name, '')
+        # 루트 디렉토리로부터의 상대경로('' = 루트 디렉토리)를 key로, 
+        # [수정 시각(ns), {하위 entity 이름: 디렉토리 여부}]를 value로 가진다.
+        self._dirs: dict[Path, list] = {}
+        self._ptree = self._newPathTree()
+        # 처음 읽는 디렉토리를 os.scandir()로 읽기 직전에 그 상대경로를 
+        # 인자로 호출되는 함수. DirWatcher에서 감시 대상을 추가할 때 쓴다.
+        self._on_new_dir: Callable[[Path], None] | None = None
+        # 보관된 디렉토리의 정보를 삭제할 때 그 상대경로를 인자로 호출되는 함수. 
+        # DirWatcher에서 감시 대상을 제외할 때 쓴다.
+        self._on_drop_dir: Callable[[Path], None] | None = None
+
+    def _newPathTree(self) -> (PathTree):
+        """루트 디렉토리명을 root 노드로 하는 빈 PathTree를 만든다."""
+        ptree = PathTree(delimiter=os.sep)
+        ptree.appendAbs(self._getTreePath(''))
+        return ptree
+
+    def _getTreePath(self, relpath: Path) -> (str):
+        """상대경로를 PathTree 내 노드의 절대경로로 변환. 
+        PathTree에는 루트 디렉토리명으로 시작하는 상대경로로 저장된다."""
+        if not relpath: return self._root_name
+        return self._tree_prefix + relpath
+
+    def _toOutputPath(self, relpath: Path) -> (Path):
+        if self.to_abspath: return self._abs_prefix + relpath
+        return relpath
+
+    def getPathTree(self) -> (PathTree):
+        """탐색 결과를 담은 PathTree 객체를 반환. 
+        루트 디렉토리명으로 시작하는 상대경로로 노드들을 저장하며, 
+        rescan() 호출 시 바뀐 부분만 수정된다."""
+        return self._ptree
+
+    def getAllLeafs(self) -> (list[Path]):
+        """마지막 탐색 결과의 모든 최하위 파일 및 디렉토리들의 경로를 
+        리스트로 반환. 디렉토리를 다시 읽지 않는다."""
+        if '' not in self._dirs: return []
+        return [self._toOutputPath(p) for p in self._iterCachedLeafs('')]
+
+    def _iterCachedLeafs(self, relpath: Path) -> (Iterator[Path]):
+        """보관된 정보로 relpath 디렉토리 내 최하위 파일 및 디렉토리들의 
+        상대경로를 반환."""
+        stack = [relpath]
+        while stack:
+            dirpath = stack.pop()
+            children = self._dirs[dirpath][1]
+            if not children and dirpath:
+                yield dirpath
+                continue
+            dir_prefix = dirpath + os.sep if dirpath else ''
+            for name, is_dir in children.items():
+                child = dir_prefix + name
+                if is_dir: stack.append(child)
+                else: yield child
+
+    def _dropCachedDir(self, relpath: Path) -> (list[Path]):
+        """보관된 relpath 디렉토리와 그 하위 디렉토리들의 정보를 삭제하고, 
+        삭제된 최하위 파일 및 디렉토리들의 상대경로를 반환."""
+        if relpath not in self._dirs: return []
+        leafs = list(self._iterCachedLeafs(relpath))
+        stack = [relpath]
+        while stack:
+            dirpath = stack.pop()
+            dir_prefix = dirpath + os.sep if dirpath else ''
+            for name, is_dir in self._dirs.pop(dirpath)[1].items():
+                if is_dir: stack.append(dir_prefix + name)
+            if self._on_drop_dir is not None: self._on_drop_dir(dirpath)
+        return leafs
+
+    def rescan(
+            self, 
+            dirpaths: Iterable[Path] | None = None
+        ) -> (dict[str, list[Path]]):
+        """루트 디렉토리를 다시 탐색하여, 이전 탐색 결과 대비 추가 및 삭제된 
+        최하위 파일 및 디렉토리들의 경로를 반환한다. 
+        처음 호출 시에는 모든 경로가 추가된 것으로 반환된다. 
+
+        모든 디렉토리의 수정 시각을 확인하되(os.stat()), 수정 시각이 
+        바뀐 디렉토리만 os.scandir()로 다시 읽는다. 보관된 PathTree 객체도 
+        바뀐 부분만 수정된다.
+
+        Parameters
+        ----------
+        dirpaths : Iterable[str] | None, default None
+            바뀐 것을 이미 알고 있는 디렉토리들의 루트 디렉토리로부터의 
+            상대경로들('' = 루트 디렉토리). 입력 시 다른 디렉토리들의 수정 
+            시각은 확인하지 않고, 해당 디렉토리들과 그 안에 새로 생긴 
+            디렉토리들만 수정 시각과 상관없이 다시 읽는다. 
+            이전 탐색 결과에 없는 디렉토리는 무시한다.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            'added' key에 추가된 경로들의 리스트, 'removed' key에 삭제된 
+            경로들의 리스트를 가지는 딕셔너리. 각 리스트는 정렬되어 있다. 
+            예를 들어 빈 디렉토리에 파일이 생기면, 해당 디렉토리 경로는 
+            삭제된 경로로, 파일 경로는 추가된 경로로 반환된다.
+
+        """
+        added: list[Path] = []
+        removed: list[Path] = []
+        ptree = self._ptree
+        now = time.time_ns()
+
+        def remove_child(child: Path, was_dir: bool):
+            if was_dir: removed.extend(self._dropCachedDir(child))
+            else: removed.append(child)
+            ptree.remove(self._getTreePath(child), REMOVEALL)
+
+        if dirpaths is None:
+            targets = None
+            stack: list[Path] = ['']
+        else:
+            # 상위 디렉토리를 먼저 읽도록 역순으로 정렬하여 스택에 넣는다.
+            targets = set(dirpaths)
+            stack = sorted(targets, reverse=True)
+        # 하위 디렉토리가 사라져 수정 시각과 상관없이 다시 읽을 디렉토리들.
+        forced: set[Path] = set()
+        while stack:
+            relpath = stack.pop()
+            dirpath = self._abs_prefix + relpath
+            dir_prefix = relpath + os.sep if relpath else ''
+            state = self._dirs.get(relpath)
+            if targets is not None and state is None and relpath in targets:
+                # 이전 탐색 결과에 없거나, 상위 디렉토리를 읽으면서 삭제된 경우.
+                continue
+            try:
+                st = os.stat(dirpath)
+                if (targets is None and state is not None and 
+                    state[0] == st.st_mtime_ns and relpath not in forced):
+                    for name, is_dir in state[1].items():
+                        if is_dir: stack.append(dir_prefix + name)
+                    continue
+
+                if state is None and self._on_new_dir is not None:
+                    self._on_new_dir(relpath)
+                with os.scandir(dirpath) as it:
+                    new_children = {
+                        entry.name: entry.is_dir(follow_symlinks=False) 
+                        for entry in it
+                    }
+            except (FileNotFoundError, NotADirectoryError):
+                # 상위 디렉토리를 읽은 뒤 삭제된 경우. 상위 디렉토리를 다시 읽는다.
+                if not relpath: raise
+                parent = os.path.dirname(relpath)
+                forced.add(parent)
+                stack.append(parent)
+                continue
+            old_children = state[1] if state is not None else {}
+            for name, was_dir in old_children.items():
+                if new_children.get(name) != was_dir:
+                    remove_child(dir_prefix + name, was_dir)
+            if relpath and state is not None and not old_children and new_children:
+                # 빈 디렉토리였던 경우.
+                removed.append(relpath)
+            if relpath and not new_children and (state is None or old_children):
+                # 빈 디렉토리가 된 경우.
+                added.append(relpath)
+            for name, is_dir in new_children.items():
+                child = dir_prefix + name
+                if is_dir: 
+                    if targets is None: 
+                        stack.append(child)
+                    elif child not in self._dirs:
+                        targets.discard(child)
+                        stack.append(child)
+                elif old_children.get(name) is not False:
+                    added.append(child)
+            mtime = st.st_mtime_ns
+            if now - mtime < _RACY_MTIME_NS: mtime = -1
+            self._dirs[relpath] = [mtime, new_children]
+
+        # 추가된 경로들은 탐색이 끝난 뒤 PathTree에 한 번에 추가한다.
+        ptree.appendAll(self._getTreePath(p) for p in added)
+        added.sort()
+        removed.sort()
+        if self.to_abspath:
+            added = [self._abs_prefix + p for p in added]
+            removed = [self._abs_prefix + p for p in removed]
+        return {'added': added, 'removed': removed}
+
+    def saveCache(self, file_path: str) -> (None):
+        """보관된 디렉토리 정보들을 JSON 파일로 저장한다."""
+        data = {'root_dir': self.root_dir, 'dirs': self._dirs}
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    def loadCache(self, file_path: str) -> (bool):
+        """saveCache()로 저장한 JSON 파일에서 디렉토리 정보들을 읽어오고, 
+        이를 바탕으로 PathTree 객체를 다시 만든다. 
+        이후 rescan() 호출 시 저장된 이후로 바뀐 디렉토리들만 읽는다.
+
+        Returns
+        -------
+        bool
+            정보를 읽어온 경우 True. 파일의 형식이 잘못되었거나 다른 루트 
+            디렉토리의 정보인 경우 False를 반환하며, 이 때 보관된 정보는 바뀌지 않는다.
+
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            root_dir, dirs = data['root_dir'], data['dirs']
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if (type(dirs) != dict or '' not in dirs or 
+            os.path.normcase(root_dir) != os.path.normcase(self.root_dir)):
+            return False
+        self._dirs = dirs
+        self._ptree = self._newPathTree()
+        self._ptree.appendAll(self._getTreePath(p) for p in self._iterCachedLeafs(''))
+        return True
+
+
+class _Inotify():
+    """ctypes로 libc의 inotify 함수들을 호출하는 클래스."""
+    def __init__(self):
+        """
+        inotify를 쓸 수 없는 환경에서는 OSError를 일으킨다.
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify는 리눅스에서만 쓸 수 있습니다.")
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            self._init1 = libc.inotify_init1
+            self._add_watch = libc.inotify_add_watch
+            self._rm_watch = libc.inotify_rm_watch
+        except (OSError, AttributeError, TypeError) as e:
+            raise OSError("libc에서 inotify 함수들을 찾을 수 없습니다.") from e
+        self._init1.argtypes = [ctypes.c_int]
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = self._call(self._init1, os.O_NONBLOCK | os.O_CLOEXEC)
+
+    def _call(self, func: Callable, *args) -> (int):
+        result = func(*args)
+        if result < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        return result
+
+    def addWatch(self, path: DirPath) -> (int):
+        """path 디렉토리를 감시 대상에 추가하고 watch descriptor를 반환."""
+        return self._call(self._add_watch, self.fd, os.fsencode(path), _IN_WATCH_MASK)
+
+    def removeWatch(self, wd: int) -> (None):
+        """감시 대상에서 제외한다. 이미 제외된 경우 무시한다."""
+        self._rm_watch(self.fd, wd)
+
+    def readEvents(self) -> (list[tuple[int, int]]):
+        """읽을 수 있는 모든 이벤트들의 (watch descriptor, mask)를 반환."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += _INOTIFY_EVENT.size + name_len
+
+    def close(self) -> (None):
+        os.close(self.fd)
+
+
+class DirWatcher():
+    """루트 디렉토리 내 파일 및 디렉토리의 추가, 삭제를 감시하여 
+    PathTree 객체에 실시간으로 반영하는 클래스."""
+    def __init__(
+            self, 
+            root_dir: DirPath, 
+            to_abspath: bool = True,
+            interval: float = 1.0,
+            batch_delay: float = 0.05,
+            use_inotify: bool = True
+        ):
+        """
+        리눅스에서는 inotify로 바뀐 디렉토리들을 통지받아 해당 디렉토리들만 
+        다시 읽는다. inotify를 쓸 수 없는 환경이거나 감시 가능한 디렉토리 
+        수를 넘은 경우, interval 초마다 DirScanCache.rescan()으로 수정 
+        시각이 바뀐 디렉토리들을 찾는 방식(polling)으로 바뀐다. 
+        객체 생성 시 루트 디렉토리 전체를 한 번 탐색한다.
+
+        Parameters
+        ----------
+        root_dir : str
+            감시할 루트 디렉토리 경로
+        to_abspath : bool, default True
+            poll() 등에서 반환하는 경로들을 절대경로 또는 상대경로로 
+            반환할 지 결정하는 매개변수. get_all_in_rootdir() 함수 참고.
+        interval : float, default 1.0
+            polling 방식에서 루트 디렉토리를 다시 탐색하는 간격(초).
+        batch_delay : float, default 0.05
+            inotify 방식에서 첫 이벤트를 받은 후 이 시간(초) 동안 들어오는 
+            이벤트들을 모아 한 번에 반영한다. 
+            같은 디렉토리에 대한 여러 이벤트들은 한 번의 탐색으로 합쳐진다.
+        use_inotify : bool, default True
+            False 입력 시 inotify를 쓸 수 있어도 polling 방식을 쓴다.
+
+        """
+        self.interval = interval
+        self.batch_delay = batch_delay
+        self._cache = DirScanCache(root_dir, to_abspath)
+        self._inotify: _Inotify | None = None
+        self._wd_to_dir: dict[int, Path] = {}
+        self._dir_to_wd: dict[Path, int] = {}
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except OSError:
+                self._inotify = None
+            else:
+                self._cache._on_new_dir = self._addWatch
+                self._cache._on_drop_dir = self._removeWatch
+        self._cache.rescan()
+        self._next_poll = time.monotonic() + interval
+
+    @property
+    def backend(self) -> (str):
+        """현재 쓰고 있는 감시 방식. 'inotify' 또는 'poll'."""
+        return 'poll' if self._inotify is None else 'inotify'
+
+    def getPathTree(self) -> (PathTree):
+        """감시 결과를 반영하는 PathTree 객체를 반환. 
+        DirScanCache.getPathTree() 참고."""
+        return self._cache.getPathTree()
+
+    def getAllLeafs(self) -> (list[Path]):
+        """현재까지 반영된 모든 최하위 파일 및 디렉토리들의 경로를 반환."""
+        return self._cache.getAllLeafs()
+
+    def _addWatch(self, relpath: Path) -> (None):
+        """디렉토리를 처음 읽기 직전에 호출되어 감시 대상에 추가한다."""
+        if self._inotify is None: return
+        try:
+            wd = self._inotify.addWatch(self._cache._abs_prefix + relpath)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # 감시 가능한 디렉토리 수를 넘는 등의 경우.
+            self._switchToPolling()
+            return
+        # 이미 감시 중인 디렉토리(inode)를 다시 추가하면 같은 wd가 반환된다. 
+        # 루트 디렉토리 안에서 옮겨진 디렉토리인 경우.
+        old_relpath = self._wd_to_dir.get(wd)
+        if old_relpath is not None and old_relpath != relpath:
+            self._dir_to_wd.pop(old_relpath, None)
+        self._wd_to_dir[wd] = relpath
+        self._dir_to_wd[relpath] = wd
+
+    def _removeWatch(self, relpath: Path) -> (None):
+        """보관된 정보가 삭제된 디렉토리를 감시 대상에서 제외한다. 
+        루트 디렉토리 밖으로 옮겨진 디렉토리의 하위 디렉토리들은 
+        IN_MOVE_SELF 이벤트가 오지 않으므로 여기서 제외해야 한다."""
+        wd = self._dir_to_wd.pop(relpath, None)
+        if wd is None or self._inotify is None: return
+        # 이미 루트 디렉토리 안의 다른 경로로 다시 추가된 경우 제외하지 않는다.
+        if self._wd_to_dir.get(wd) != relpath: return
+        del self._wd_to_dir[wd]
+        self._inotify.removeWatch(wd)
+
+    def _clearWatches(self) -> (None):
+        self._inotify.close()
+        self._inotify = None
+        self._wd_to_dir.clear()
+        self._dir_to_wd.clear()
+        self._cache._on_new_dir = None
+        self._cache._on_drop_dir = None
+
+    def _switchToPolling(self) -> (None):
+        self._clearWatches()
+        # 이후 rescan()에서 수정 시각과 상관없이 모든 디렉토리를 다시 읽는다.
+        for state in self._cache._dirs.values(): state[0] = -1
+        self._next_poll = time.monotonic()
+
+    def _readDirtyDirs(self, dirty: set[Path]) -> (bool):
+        """inotify 이벤트들을 읽어 바뀐 디렉토리들을 dirty에 추가한다. 
+        이벤트가 넘쳐 일부를 잃은 경우 False를 반환."""
+        for wd, mask in self._inotify.readEvents():
+            if mask & _IN_Q_OVERFLOW: return False
+            relpath = self._wd_to_dir.get(wd)
+            if relpath is None: continue
+            if mask & _IN_IGNORED:
+                del self._wd_to_dir[wd]
+                if self._dir_to_wd.get(relpath) == wd: del self._dir_to_wd[relpath]
+            elif mask & _IN_MOVE_SELF:
+                # 옮겨진 위치가 루트 디렉토리 안이면 상위 디렉토리를 다시 읽을 때 
+                # 같은 wd로 다시 추가된다.
+                self._inotify.removeWatch(wd)
+            else:
+                dirty.add(relpath)
+        return True
+
+    def poll(self, timeout: float | None = None) -> (dict[str, list[Path]]):
+        """변경 사항이 생길 때까지 최대 timeout 초 동안 기다린 후, 
+        추가 및 삭제된 최하위 파일 및 디렉토리들의 경로를 반환한다. 
+        PathTree 객체에도 해당 변경 사항이 반영된다.
+
+        Parameters
+        ----------
+        timeout : float | None, default None
+            최대 대기 시간(초). None 입력 시 변경 사항이 생길 때까지 기다리고, 
+            0 입력 시 기다리지 않는다.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            DirScanCache.rescan()의 반환값과 같은 형식. 
+            timeout 내에 변경 사항이 없으면 빈 리스트들을 가진다.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._inotify is None:
+                wait = self._next_poll - time.monotonic()
+                if deadline is not None: 
+                    wait = min(wait, deadline - time.monotonic())
+                if wait > 0: time.sleep(wait)
+                if time.monotonic() >= self._next_poll:
+                    self._next_poll = time.monotonic() + self.interval
+                    delta = self._cache.rescan()
+                    if delta['added'] or delta['removed']: return delta
+            else:
+                delta = self._pollInotify(deadline)
+                if delta['added'] or delta['removed']: return delta
+            if deadline is not None and time.monotonic() >= deadline:
+                return {'added': [], 'removed': []}
+
+    def _pollInotify(self, deadline: float | None) -> (dict[str, list[Path]]):
+        wait = None if deadline is None else max(deadline - time.monotonic(), 0)
+        fd = self._inotify.fd
+        if not select.select([fd], [], [], wait)[0]:
+            return {'added': [], 'removed': []}
+        dirty: set[Path] = set()
+        batch_end = time.monotonic() + self.batch_delay
+        complete = self._readDirtyDirs(dirty)
+        while complete:
+            wait = batch_end - time.monotonic()
+            if wait <= 0 or not select.select([fd], [], [], wait)[0]: break
+            complete = self._readDirtyDirs(dirty)
+        if not complete:
+            # 잃은 이벤트가 있으므로 수정 시각으로 바뀐 디렉토리들을 찾는다.
+            self._inotify.readEvents()
+            return self._cache.rescan()
+        return self._cache.rescan(dirty)
+
+    def watch(self) -> (Iterator[dict[str, list[Path]]]):
+        """변경 사항이 생길 때마다 poll()의 반환값을 반환하는 제너레이터."""
+        while True:
+            yield self.poll()
+
+    def close(self) -> (None):
+        """inotify 자원을 해제한다. 이후 polling 방식으로만 동작한다."""
+        if self._inotify is not None: self._clearWatches()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 if __name__ == '__main__':
     # 테스트 용 코드.
@@ -346,29 +346,35 @@ def make_zip_structure(
         """
         results: list[str] = []
         root_dir = os.path.abspath(root_dir)
-        
-        def search(dirpath: str):
-            entities = os.listdir(dirpath)
-            if not entities:
-                # leaf 디렉토리인 경우, 해당 디렉토리 경로를
-                # 결과에 추가한다.
-                if dirpath != root_dir:
-                    results.append(dirpath)
-                return
-            for entity in entities:
-                if os.path.splitext(entity)[1]:
-                    # 해당 entity가 파일일 경우.
-                    results.append(os.path.join(dirpath, entity))
-                else:
-                    # 해당 entity가 디렉토리일 경우.
-                    subdir_path = os.path.join(dirpath, entity)
-                    search(subdir_path)
-
-        search(root_dir)
+        prefix_len = len(os.path.join(root_dir, ''))
+        # 이미 탐색한 디렉토리들의 (장치 번호, inode 번호).
+        visited: set[tuple[int, int]] = set()
+
+        def scan(dirpath: str) -> (list[os.DirEntry] | None):
+            st = os.stat(dirpath)
+            key = (st.st_dev, st.st_ino)
+            if key in visited: return None
+            visited.add(key)
+            with os.scandir(dirpath) as it:
+                return list(it)
+
+        stack = [iter(scan(root_dir))]
+        while stack:
+            for entry in stack[-1]:
+                if entry.is_dir():
+                    entities = scan(entry.path)
+                    if entities is None: continue
+                    if entities:
+                        stack.append(iter(entities))
+                        break
+                # 파일 또는 leaf 디렉토리인 경우.
+                results.append(entry.path)
+            else:
+                stack.pop()
 
         if not to_abspath:
             for i, res in enumerate(results):
-                results[i] = os.path.relpath(res, root_dir)
+                results[i] = res[prefix_len:]
         
         return results
     
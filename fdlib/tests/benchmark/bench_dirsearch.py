@@ -0,0 +1,408 @@
+"""dirsearch.py 모듈의 디렉토리 탐색 함수들의 성능 측정 모듈.
+
+pytest 등의 테스트 수집 대상이 되지 않도록 파일명을 bench_로 시작하게 함.
+해당 디렉토리에서 직접 실행하여 측정 결과를 확인한다.
+측정용 디렉토리 트리는 임시 디렉토리에 만들었다가 측정 후 삭제한다.
+
+예)
+python bench_dirsearch.py
+
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+from dirimporttool import get_super_dir_directly
+
+for i in range(1, 2+1):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+import dirsearch as dirs
+
+def make_dir_tree(
+        root_dir: str,
+        file_number: int,
+        fanout: int = 8,
+        depth: int = 4
+    ) -> (None):
+    """root_dir 안에 파일이 약 file_number개인 디렉토리 트리를 만드는 함수.
+    로그 베이스 디렉토리처럼 날짜 디렉토리 아래에 로그 파일들이 있는 구조를 흉내낸다.
+    """
+    rand = random.Random(0)
+    dirpaths = [root_dir]
+    for d in range(depth):
+        for parent in dirpaths[:]:
+            if len(dirpaths) * fanout > file_number // 10: break
+            for i in range(fanout):
+                dirpath = os.path.join(parent, f"d{d}_{i}")
+                os.mkdir(dirpath)
+                dirpaths.append(dirpath)
+    for i in range(file_number):
+        dirpath = rand.choice(dirpaths)
+        open(os.path.join(dirpath, f"file{i}.log"), 'w').close()
+
+def listdir_recursive(root_dir: str) -> (list[str]):
+    """이전 get_all_in_rootdir()의 방식. os.listdir()로 재귀 탐색하며,
+    확장자 유무로 파일인지 디렉토리인지를 추측한다."""
+    results = []
+    def search(dirpath: str):
+        entities = os.listdir(dirpath)
+        if not entities:
+            if dirpath != root_dir: results.append(dirpath)
+            return
+        for entity in entities:
+            if os.path.splitext(entity)[1]:
+                results.append(os.path.join(dirpath, entity))
+            else:
+                search(os.path.join(dirpath, entity))
+    search(root_dir)
+    return results
+
+def listdir_isdir_recursive(root_dir: str) -> (list[str]):
+    """os.listdir()로 재귀 탐색하되, os.path.isdir()로 디렉토리인지 확인하는 방식."""
+    results = []
+    def search(dirpath: str):
+        entities = os.listdir(dirpath)
+        if not entities:
+            if dirpath != root_dir: results.append(dirpath)
+            return
+        for entity in entities:
+            path = os.path.join(dirpath, entity)
+            if os.path.isdir(path): search(path)
+            else: results.append(path)
+    search(root_dir)
+    return results
+
+def measure(title: str, func: callable):
+    """func를 한 번 실행하여 소요 시간을 출력하고 func의 반환값을 반환한다."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{title:<45} {elapsed * 1000:10.1f} ms")
+    return result
+
+def bench_walk(sizes: tuple[int, ...] = (1_000, 10_000, 100_000)):
+    """파일이 size개인 디렉토리 트리의 모든 leaf 경로를 찾는 시간을 측정."""
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as root_dir:
+            make_dir_tree(root_dir, size)
+            root_dir = os.path.abspath(root_dir)
+            measure(f"listdir + 확장자 추측 x {size}",
+                    lambda: listdir_recursive(root_dir))
+            measure(f"listdir + os.path.isdir() x {size}",
+                    lambda: listdir_isdir_recursive(root_dir))
+            measure(f"get_all_in_rootdir() x {size}",
+                    lambda: dirs.get_all_in_rootdir(root_dir))
+            measure(f"get_all_in_rootdir(symlink X) x {size}",
+                    lambda: dirs.get_all_in_rootdir(root_dir, follow_symlinks=False))
+            measure(f"next(iter_all_in_rootdir()) x {size}",
+                    lambda: next(dirs.iter_all_in_rootdir(root_dir)))
+
+def bench_filter(file_number: int = 100_000):
+    """파일이 file_number개인 디렉토리 트리와, 그보다 파일이 9배 많은 
+    제외 대상 디렉토리('node_modules')가 있을 때, 모든 경로를 찾은 뒤 거르는 
+    시간과 exclude, extensions 인자로 탐색하며 거르는 시간을 비교."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        make_dir_tree(root_dir, file_number)
+        excluded_dir = os.path.join(root_dir, 'node_modules')
+        os.mkdir(excluded_dir)
+        make_dir_tree(excluded_dir, file_number * 9)
+        root_dir = os.path.abspath(root_dir)
+
+        def filter_after_walk():
+            return [
+                p for p in dirs.get_all_in_rootdir(root_dir) 
+                if os.sep + 'node_modules' + os.sep not in p and p.endswith('.log')
+            ]
+        measure("get_all_in_rootdir() + 결과 거르기", filter_after_walk)
+        measure("get_all_in_rootdir(exclude, extensions)", 
+                lambda: dirs.get_all_in_rootdir(
+                    root_dir, exclude=['node_modules'], extensions=['.log']))
+        measure("get_all_in_rootdir(max_depth=2)", 
+                lambda: dirs.get_all_in_rootdir(root_dir, max_depth=2))
+
+def bench_parallel_walk(
+        file_number: int = 1_000_000,
+        workers: tuple[int, ...] = (1, 2, 4, 8, 16),
+        latency: float = 0.0
+    ):
+    """파일이 file_number개인 디렉토리 트리를 iter_all_in_rootdir_parallel()로 
+    탐색할 때 스레드 수에 따른 처리량(초당 경로 수)을 측정. 
+    디렉토리를 읽는 시간이 긴 네트워크 드라이브 등에서 차이가 크게 나타나므로, 
+    latency(초)를 입력하면 os.scandir() 호출마다 그만큼 기다리도록 하여 
+    네트워크 드라이브를 흉내낸다."""
+    print(f"latency: {latency * 1000} ms")
+    original_scandir = os.scandir
+    def slow_scandir(path):
+        time.sleep(latency)
+        return original_scandir(path)
+
+    with tempfile.TemporaryDirectory() as root_dir:
+        measure(f"make_dir_tree() x {file_number}",
+                lambda: make_dir_tree(root_dir, file_number, fanout=16))
+        root_dir = os.path.abspath(root_dir)
+        if latency: os.scandir = slow_scandir
+
+        def report(title: str, func: callable):
+            start = time.perf_counter()
+            count = sum(1 for _ in func())
+            elapsed = time.perf_counter() - start
+            print(f"{title:<45} {elapsed * 1000:10.1f} ms "
+                  f"{count / elapsed:12,.0f} paths/s")
+
+        try:
+            report("iter_all_in_rootdir()", 
+                   lambda: dirs.iter_all_in_rootdir(root_dir))
+            for max_workers in workers:
+                report(f"parallel(max_workers={max_workers})", 
+                       lambda: dirs.iter_all_in_rootdir_parallel(
+                           root_dir, max_workers=max_workers))
+                report(f"parallel(max_workers={max_workers}, ordered)", 
+                       lambda: dirs.iter_all_in_rootdir_parallel(
+                           root_dir, max_workers=max_workers, ordered=True))
+        finally:
+            os.scandir = original_scandir
+
+def bench_info(file_number: int = 100_000):
+    """파일이 file_number개인 디렉토리 트리에서 모든 파일의 크기와 
+    수정 시각, 생성 시각을 구하는 시간과, 디렉토리별 파일 크기 합계를 구하는 
+    시간을 경로를 얻은 뒤 다시 조회하는 방식과 비교."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        make_dir_tree(root_dir, file_number)
+        root_dir = os.path.abspath(root_dir)
+
+        def stat_after_walk():
+            return [
+                (p, os.path.getsize(p), os.path.getmtime(p), os.path.getctime(p))
+                for p in dirs.get_all_in_rootdir(root_dir)
+            ]
+        measure("get_all_in_rootdir() + getsize() 등", stat_after_walk)
+        measure("list(iter_info_in_rootdir())",
+                lambda: list(dirs.iter_info_in_rootdir(root_dir)))
+
+        def sizes_after_walk():
+            sizes = {}
+            for dirpath, _, filenames in os.walk(root_dir):
+                size = sum(
+                    os.path.getsize(os.path.join(dirpath, f)) for f in filenames)
+                # 상위 디렉토리들에 모두 더한다.
+                while True:
+                    sizes[dirpath] = sizes.get(dirpath, 0) + size
+                    if dirpath == root_dir: break
+                    dirpath = os.path.dirname(dirpath)
+            return sizes
+        measure("os.walk() + getsize() 디렉토리별 합계", sizes_after_walk)
+        measure("get_dir_sizes()", lambda: dirs.get_dir_sizes(root_dir))
+
+def bench_visualize(file_number: int = 100_000):
+    """파일이 file_number개인 디렉토리 트리를 visualize_rootdir()로 출력하는 
+    시간을 크기를 덧붙이지 않을 때와, 크기를 덧붙이기 위해 경로를 얻은 뒤 
+    다시 조회하는 방식, with_sizes=True로 한 번에 탐색하는 방식과 비교."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        make_dir_tree(root_dir, file_number)
+        root_dir = os.path.abspath(root_dir)
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            measure("visualize_rootdir(file=devnull)",
+                    lambda: dirs.visualize_rootdir(root_dir, False, devnull))
+
+            def annotate_after_walk():
+                ptree = dirs.get_ptree_from_rootdir(root_dir, False)
+                sizes = {
+                    os.path.basename(root_dir) + os.sep + os.path.relpath(p, root_dir): s
+                    for p, s in dirs.get_dir_sizes(root_dir).items()
+                }
+                def annotate(path):
+                    if path in sizes: return {'size': sizes[path]}
+                    abspath = os.path.join(os.path.dirname(root_dir), path)
+                    if os.path.isfile(abspath): 
+                        return {'size': os.path.getsize(abspath)}
+                    return None
+                ptree.writeExport(devnull, annotate=annotate)
+            measure("get_ptree + get_dir_sizes() + getsize()", annotate_after_walk)
+            measure("visualize_rootdir(with_sizes=True)",
+                    lambda: dirs.visualize_rootdir(
+                        root_dir, False, devnull, with_sizes=True))
+
+def bench_duplicates(file_number: int = 1_000, workers: tuple[int, ...] = (1, 4)):
+    """크기가 같은 파일들이 많고 그 중 일부만 내용이 같은 파일 file_number개에서 
+    중복 파일들을 찾는 시간을, 모든 파일 전체를 해시하는 방식과 비교. 
+    (파일 하나의 크기는 약 64KB ~ 1MB)"""
+    rand = random.Random(0)
+    with tempfile.TemporaryDirectory() as root_dir, \
+            tempfile.TemporaryDirectory() as cache_dir:
+        sizes = [rand.randint(64, 1024) * 1024 for _ in range(file_number // 10)]
+        originals = {}
+        for i in range(file_number):
+            size = rand.choice(sizes)
+            if size in originals and rand.random() < 0.2:
+                data = originals[size]
+            else:
+                data = rand.randbytes(size)
+                originals.setdefault(size, data)
+            with open(os.path.join(root_dir, f"file{i}.bin"), 'wb') as file:
+                file.write(data)
+        root_dir = os.path.abspath(root_dir)
+        total = sum(os.path.getsize(p) for p in dirs.get_all_in_rootdir(root_dir))
+        print(f"전체 파일 크기: {total / 1024**2:.1f} MB")
+
+        def hash_all_files():
+            groups = {}
+            for path in dirs.get_all_in_rootdir(root_dir):
+                groups.setdefault(dirs._hash_file(path), []).append(path)
+            return [paths for paths in groups.values() if len(paths) > 1]
+        measure("모든 파일 전체 해시", hash_all_files)
+        for max_workers in workers:
+            measure(f"find_duplicate_files(max_workers={max_workers})",
+                    lambda: dirs.find_duplicate_files(root_dir, max_workers=max_workers))
+        cache_path = os.path.join(cache_dir, 'hashes.json')
+        measure("find_duplicate_files(cache_path) 처음",
+                lambda: dirs.find_duplicate_files(root_dir, cache_path=cache_path))
+        measure("find_duplicate_files(cache_path) 다시",
+                lambda: dirs.find_duplicate_files(root_dir, cache_path=cache_path))
+
+def validate_with_listdir(
+        root_dir: str, 
+        include: list[str],
+        not_include_ok: bool = True,
+        dir_include_ok: bool = False
+    ) -> (tuple[bool, list[str]]):
+    """이전 validate_if_your_dir_with_ext()의 방식. 호출할 때마다 os.listdir() 후 
+    os.path.splitext()로 확장자를 구하고, include 매개변수를 다시 전처리한다."""
+    sub_entities = os.listdir(root_dir)
+    proce_exts = []
+    for entity in sub_entities:
+        ext = os.path.splitext(entity)[1]
+        if not ext:
+            ext = 'dir'
+        proce_exts.append(ext)
+    processed_include = []
+    for ext in include:
+        if not ext.startswith('.'):
+            ext = '.' + ext
+        processed_include.append(ext)
+    is_passed = True
+    failed_because = []
+    for entity, ext in zip(sub_entities, proce_exts):
+        if ((not dir_include_ok and ext == 'dir') or
+            (ext != 'dir' and ext not in processed_include)):
+            is_passed = False
+            failed_because.append(entity)
+    if not not_include_ok:
+        for inc in processed_include:
+            if inc not in proce_exts:
+                is_passed = False
+                failed_because.append(f'no {inc}')
+    return is_passed, failed_because
+
+def bench_validate(
+        dir_number: int = 10_000, 
+        files_per_dir: int = 20, 
+        latency: float = 0.0
+    ):
+    """로그 파일이 files_per_dir개씩 있는 날짜 디렉토리 dir_number개가 로그 
+    파일만 가졌는지 검사하는 시간을 디렉토리마다 이전 방식으로 검사하는 
+    방식과 validate_dirs()로 검사하는 방식으로 비교. 
+    latency(초)는 bench_parallel_walk() 참고."""
+    print(f"latency: {latency * 1000} ms")
+    original_scandir, original_listdir = os.scandir, os.listdir
+    def slow(func):
+        def wrapper(path):
+            time.sleep(latency)
+            return func(path)
+        return wrapper
+    with tempfile.TemporaryDirectory() as root_dir:
+        dirpaths = []
+        for i in range(dir_number):
+            dirpath = os.path.join(root_dir, f"2024-{i // 28 + 1:03d}-{i % 28 + 1:02d}")
+            os.mkdir(dirpath)
+            for name in ['debug', 'info', 'warning', 'error', 'critical']:
+                for j in range(files_per_dir // 5):
+                    open(os.path.join(dirpath, f"{name} ({j}).log"), 'w').close()
+            dirpaths.append(dirpath)
+
+        if latency:
+            os.scandir, os.listdir = slow(original_scandir), slow(original_listdir)
+        try:
+            measure(f"validate_with_listdir() x {dir_number}",
+                    lambda: [validate_with_listdir(d, ['.log'])[0] for d in dirpaths])
+            rule = dirs.DirRule(['.log'])
+            measure(f"validate_dirs() x {dir_number}",
+                    lambda: dirs.validate_dirs(dirpaths, rule))
+            measure(f"validate_dirs(max_workers=8) x {dir_number}",
+                    lambda: dirs.validate_dirs(dirpaths, rule, max_workers=8))
+        finally:
+            os.scandir, os.listdir = original_scandir, original_listdir
+
+def bench_rescan(file_number: int = 1_000_000, changes: int = 10):
+    """파일이 file_number개인 디렉토리 트리에서 changes개의 디렉토리에 
+    파일을 추가했을 때, 전체를 다시 탐색하여 PathTree를 만드는 시간과 
+    DirScanCache.rescan()으로 바뀐 부분만 반영하는 시간을 비교."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        make_dir_tree(root_dir, file_number, fanout=16)
+        root_dir = os.path.abspath(root_dir)
+        # 수정 시각이 현재와 가까운 디렉토리는 매번 다시 읽으므로 그 시간이 지나길 기다린다.
+        time.sleep(dirs._RACY_MTIME_NS / 10**9)
+        cache = dirs.DirScanCache(root_dir)
+        measure(f"DirScanCache.rescan() 처음 x {file_number}", cache.rescan)
+        measure("DirScanCache.rescan() 변경 없음", cache.rescan)
+
+        rand = random.Random(0)
+        dirpaths = [dp for dp, _, _ in os.walk(root_dir)]
+        for i, dirpath in enumerate(rand.sample(dirpaths, changes)):
+            open(os.path.join(dirpath, f"new{i}.log"), 'w').close()
+        def rebuild_ptree():
+            ptree = dirs.PathTree(delimiter=os.sep)
+            ptree.appendAll(
+                os.path.join('root', p) 
+                for p in dirs.iter_all_in_rootdir(root_dir, False)
+            )
+            return ptree
+        measure(f"get_all_in_rootdir() x {file_number}",
+                lambda: dirs.get_all_in_rootdir(root_dir))
+        measure(f"전체 탐색 + PathTree 생성 x {file_number}", rebuild_ptree)
+        delta = measure(f"DirScanCache.rescan() 디렉토리 {changes}개 변경", 
+                        cache.rescan)
+        print(f"추가된 경로 수: {len(delta['added'])}")
+
+def bench_watch(file_number: int = 1_000_000, changes: int = 100):
+    """파일이 file_number개인 디렉토리 트리에서 파일을 하나씩 추가할 때, 
+    DirWatcher.poll()이 이를 반영하기까지 걸리는 평균 시간을 
+    inotify 방식과 polling 방식(간격 0초)으로 비교."""
+    with tempfile.TemporaryDirectory() as root_dir:
+        make_dir_tree(root_dir, file_number, fanout=16)
+        root_dir = os.path.abspath(root_dir)
+        time.sleep(dirs._RACY_MTIME_NS / 10**9)
+        dirpaths = [dp for dp, _, _ in os.walk(root_dir)]
+        rand = random.Random(0)
+        for use_inotify in (True, False):
+            watcher = measure(
+                f"DirWatcher(use_inotify={use_inotify}) 생성 x {file_number}",
+                lambda: dirs.DirWatcher(
+                    root_dir, interval=0, batch_delay=0, use_inotify=use_inotify)
+            )
+            elapsed = 0
+            for i in range(changes):
+                new_path = os.path.join(rand.choice(dirpaths), f"new{i}_{use_inotify}.log")
+                start = time.perf_counter()
+                open(new_path, 'w').close()
+                while new_path not in watcher.poll()['added']: pass
+                elapsed += time.perf_counter() - start
+            print(f"{watcher.backend} 방식 반영 시간 (평균) {elapsed / changes * 1000:18.2f} ms")
+            watcher.close()
+
+
+if __name__ == '__main__':
+    bench_walk()
+    bench_filter()
+    bench_info()
+    bench_visualize()
+    bench_duplicates()
+    bench_validate()
+    bench_validate(1_000, latency=0.001)
+    bench_rescan()
+    bench_watch()
+    bench_parallel_walk()
+    bench_parallel_walk(100_000, latency=0.001)
@@ -0,0 +1,376 @@
+"""submodules/tree.py 모듈의 PathTree 클래스 성능 측정 모듈.
+
+pytest 등의 테스트 수집 대상이 되지 않도록 파일명을 bench_로 시작하게 함.
+해당 디렉토리에서 직접 실행하여 측정 결과를 확인한다.
+
+예)
+python bench_tree.py
+
+"""
+import io
+import heapq
+import os
+import fnmatch
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+from dirimporttool import get_super_dir_directly
+
+for i in range(1, 2+1):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from submodules.tree import Tree, PathTree, REMOVEALL, REMOVEONE, LENGTH
+from submodules.tree import TEXT, JSON, OUTLINE, DOT
+from submodules.tree import _sortLengthOrder, _iterLengthOrder
+
+def make_paths(
+        size: int,
+        fanout: int = 10,
+        depth: int = 5,
+        delimiter: str = '.'
+    ) -> (list[str]):
+    """측정에 쓰일 leaf 노드 절대경로들을 생성하는 함수.
+    로그 베이스 디렉토리처럼 같은 이름의 노드가 여러 경로에 존재하도록 
+    각 깊이의 노드 이름을 fanout개의 이름 중에서 고른다.
+    """
+    rand = random.Random(0)
+    paths = set()
+    while len(paths) < size:
+        nodes = ['root']
+        for d in range(rand.randint(1, depth)):
+            nodes.append(f"d{d}_{rand.randrange(fanout)}")
+        nodes.append(f"file{rand.randrange(size)}.log")
+        paths.add(delimiter.join(nodes))
+    return sorted(paths)
+
+def measure(title: str, func: callable):
+    """func를 한 번 실행하여 소요 시간을 출력하고 func의 반환값을 반환한다."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{title:<45} {elapsed * 1000:10.1f} ms")
+    return result
+
+def bench_name_lookup(sizes: tuple[int, ...] = (1_000, 10_000, 100_000)):
+    """appendAll()로 트리를 구성하는 시간과 노드 이름으로 
+    search(), getAbsPath(), getParent()를 호출하는 시간을 측정."""
+    for size in sizes:
+        paths = make_paths(size)
+        ptree = PathTree()
+        measure(f"appendAll() x {size}", lambda: ptree.appendAll(paths))
+
+        names = [f"d{d}_{i}" for d in range(5) for i in range(10)]
+        def lookup():
+            for name in names:
+                ptree.search(name)
+                ptree.getAbsPath(name)
+                ptree.getParent(name)
+        measure(f"search/getAbsPath/getParent x {len(names)}", lookup)
+
+def bench_bulk_build(
+        sizes: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000),
+        compare_limit: int = 10_000
+    ):
+    """제너레이터로 입력한 절대경로들로 appendAll()이 트리를 구성하는 시간을 측정.
+    compare_limit 이하의 크기에서는 절대경로마다 appendAbs()를 호출하는 
+    시간도 함께 측정하여 비교한다."""
+    for size in sizes:
+        paths = make_paths(size)
+        random.Random(1).shuffle(paths)
+        ptree = PathTree()
+        measure(
+            f"appendAll(generator) x {size}", 
+            lambda: ptree.appendAll(path for path in paths)
+        )
+        if size > compare_limit: continue
+
+        def append_each():
+            ptree = PathTree()
+            for path in paths:
+                ptree.appendAbs(path)
+        measure(f"appendAbs() x {size}", append_each)
+
+def measure_memory(title: str, func: callable):
+    """func를 한 번 실행하여 func 실행 후 늘어난 메모리 사용량을 출력하고 
+    func의 반환값을 반환한다. 반환값이 가리키는 객체들만 남도록 
+    func 실행 중 생긴 임시 객체들은 측정에서 제외된다."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{title:<45} {(after - before) / 2**20:10.1f} MiB")
+    return result
+
+def bench_memory(size: int = 1_000_000):
+    """노드 수가 약 size개인 PathTree의 메모리 사용량과, 같은 트리를 
+    절대경로를 key로 하는 인접리스트 딕셔너리와 노드 이름별 절대경로 색인으로 
+    저장했을 때의 메모리 사용량을 비교한다."""
+    paths = make_paths(size // 2)
+
+    def build():
+        ptree = PathTree()
+        ptree.appendAll(paths)
+        return ptree
+    ptree = measure_memory(f"PathTree (leaf {len(paths)})", build)
+    print(f"{'lenTree()':<45} {ptree.lenTree():10}")
+
+    def build_abs_path_storage():
+        adj_list = ptree.getAdjList()
+        name_index = {}
+        for path in adj_list:
+            name = ptree.basename(path)
+            try: name_index[name].add(path)
+            except KeyError: name_index[name] = {path}
+        return adj_list, name_index
+    measure_memory("dict[AbsPath, list[Child]] + name index", build_abs_path_storage)
+def bench_render(sizes: tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000)):
+    """getTreeStructure()로 트리 구조 문자열을 만드는 시간과 
+    writeTreeStructure()로 파일 객체에 바로 쓰는 시간을 측정."""
+    for size in sizes:
+        ptree = PathTree()
+        ptree.appendAll(make_paths(size))
+        measure(f"getTreeStructure() x {size}", ptree.getTreeStructure)
+        measure(
+            f"writeTreeStructure() x {size}", 
+            lambda: ptree.writeTreeStructure(io.StringIO())
+        )
+
+def measure_peak_memory(title: str, func: callable):
+    """func를 한 번 실행하는 동안 가장 많이 늘어났던 메모리 사용량을 출력하고 
+    func의 반환값을 반환한다."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{title:<45} {(peak - before) / 2**20:10.1f} MiB")
+    return result
+
+def bench_export(size: int = 1_000_000):
+    """leaf 노드가 size개인 트리를 writeExport()로 형식별로 파일에 쓰는 시간과, 
+    getTreeStructure()로 문자열 전체를 만들 때와 파일에 바로 쓸 때의 
+    최대 메모리 사용량을 비교한다. annotate 함수는 절대경로의 길이를 덧붙인다."""
+    ptree = PathTree()
+    ptree.appendAll(make_paths(size))
+    annotate = lambda path: {'len': len(path)}
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        for name, fmt in [('TEXT', TEXT), ('JSON', JSON), 
+                          ('OUTLINE', OUTLINE), ('DOT', DOT)]:
+            measure(f"writeExport({name}) x {size}", 
+                    lambda: ptree.writeExport(devnull, fmt))
+            measure(f"writeExport({name}, annotate) x {size}", 
+                    lambda: ptree.writeExport(devnull, fmt, annotate))
+        measure_peak_memory(f"getTreeStructure() x {size}", ptree.getTreeStructure)
+        measure_peak_memory(f"writeExport(TEXT) x {size}", 
+                            lambda: ptree.writeExport(devnull, TEXT))
+        measure_peak_memory(f"writeExport(JSON, annotate) x {size}", 
+                            lambda: ptree.writeExport(devnull, JSON, annotate))
+
+def bench_traversal(sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000)):
+    """iterBFS(), iterDFS()로 트리 전체를 탐색하는 시간과, 
+    max_depth 및 prune 인자로 일부만 탐색하는 시간을 측정."""
+    for size in sizes:
+        ptree = PathTree()
+        ptree.appendAll(make_paths(size))
+        measure(f"iterBFS() x {size}", lambda: sum(1 for _ in ptree.iterBFS()))
+        measure(f"iterDFS() x {size}", lambda: sum(1 for _ in ptree.iterDFS()))
+        measure(
+            f"iterBFS(max_depth=2) x {size}", 
+            lambda: sum(1 for _ in ptree.iterBFS(max_depth=2))
+        )
+        measure(
+            f"iterDFS(prune) x {size}", 
+            lambda: sum(1 for _ in ptree.iterDFS(
+                prune=lambda depth, path: path.endswith('.d0_0')))
+        )
+
+def bench_remove(sizes: tuple[int, ...] = (1_000, 100_000, 1_000_000)):
+    """노드 수가 약 size개인 트리에서 하위 트리를 삭제하는 시간을 측정. 
+    PathTree는 같은 트리에서 차례대로 root 노드의 자식 노드 하나와 
+    그 하위 노드들(REMOVEALL), root 노드의 다른 자식 노드 하나(REMOVEONE), 
+    같은 이름을 가지는 모든 노드들과 그 하위 노드들(REMOVEALL)을 삭제한다. 
+    Tree는 root 노드의 자식 노드 하나와 그 하위 노드들을 삭제한다."""
+    for size in sizes:
+        ptree = PathTree()
+        ptree.appendAll(make_paths(size * 2 // 5))
+        print(f"{'PathTree lenTree()':<45} {ptree.lenTree():10}")
+        measure(
+            "remove('root.d0_0', REMOVEALL)", 
+            lambda: ptree.remove('root.d0_0', REMOVEALL)
+        )
+        measure(
+            "remove('root.d0_1', REMOVEONE)", 
+            lambda: ptree.remove('root.d0_1', REMOVEONE)
+        )
+        measure("remove('d2_0', REMOVEALL)", lambda: ptree.remove('d2_0', REMOVEALL))
+
+        tree = Tree()
+        tree.append('n0')
+        for i in range(1, size):
+            tree.append(f"n{i}", f"n{(i-1) // 10}")
+        print(f"{'Tree lenTree()':<45} {tree.lenTree():10}")
+        measure("remove('n1', REMOVEALL)", lambda: tree.remove('n1', REMOVEALL))
+
+def bench_wide_append(sizes: tuple[int, ...] = (1_000, 10_000, 50_000)):
+    """자식 노드가 매우 많은 하나의 노드(예: 로테이팅된 로그 파일이 가득한 
+    날짜 디렉토리)에 append()로 자식 노드들을 하나씩 추가한 뒤, 
+    getChildren()을 반복 호출하는 시간을 측정."""
+    for size in sizes:
+        names = [f"debug ({i}).log" for i in range(size)]
+        random.Random(0).shuffle(names)
+
+        ptree = PathTree()
+        ptree.appendAbs('root.2024-01-01')
+        def append_path():
+            for name in names: ptree.append(name, 'root.2024-01-01')
+        measure(f"PathTree.append() x {size}", append_path)
+        measure(
+            "PathTree.getChildren() x 100", 
+            lambda: [ptree.getChildren('root.2024-01-01') for _ in range(100)]
+        )
+
+        tree = Tree()
+        tree.append('2024-01-01')
+        def append_node():
+            for name in names: tree.append(name, '2024-01-01')
+        measure(f"Tree.append() x {size}", append_node)
+
+def bench_snapshot(size: int = 1_000_000):
+    """노드 수가 약 size개인 PathTree를 appendAll()로 만드는 시간과, 
+    JSON 및 바이너리 스냅샷 파일로 저장하고 다시 읽어 복원하는 시간 및 
+    스냅샷 파일의 크기를 측정."""
+    paths = make_paths(size // 2)
+    ptree = PathTree()
+    measure(f"appendAll() x {len(paths)}", lambda: ptree.appendAll(paths))
+    print(f"{'lenTree()':<45} {ptree.lenTree():10}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for binary in (False, True):
+            kind = 'binary' if binary else 'json'
+            file_path = os.path.join(temp_dir, f"tree.{kind}")
+            measure(
+                f"saveSnapshot({kind})", 
+                lambda: ptree.saveSnapshot(file_path, binary)
+            )
+            print(f"{'file size (bytes)':<45} {os.path.getsize(file_path):10}")
+            measure(
+                f"loadSnapshot({kind})", 
+                lambda: PathTree().loadSnapshot(file_path)
+            )
+
+def bench_query(size: int = 1_000_000):
+    """노드 수가 약 size개인 트리에서 getAllLeafAbs()의 결과를 걸러내는 시간과, 
+    iterLeafAbs(), iterGlob()으로 일치하는 하위 트리만 탐색하는 시간을 비교."""
+    ptree = PathTree()
+    ptree.appendAll(make_paths(size // 2))
+    print(f"{'lenTree()':<45} {ptree.lenTree():10}")
+
+    prefix = 'root.d0_1.d1_2'
+    measure(
+        "getAllLeafAbs() + startswith()", 
+        lambda: [p for p in ptree.getAllLeafAbs() if p.startswith(prefix + '.')]
+    )
+    measure(f"iterLeafAbs('{prefix}')", lambda: list(ptree.iterLeafAbs(prefix)))
+    measure(
+        "getAllLeafAbs() + fnmatch()", 
+        lambda: [
+            p for p in ptree.getAllLeafAbs() 
+            if fnmatch.fnmatchcase(p, 'root.d0_1.*.d2_3.*')
+        ]
+    )
+    measure(
+        "iterGlob('root.d0_1.*.d2_3.**')", 
+        lambda: list(ptree.iterGlob('root.d0_1.*.d2_3.**', leaf_only=True))
+    )
+    measure(
+        "iterGlob('root.*.d1_[0-4]', max 1 result)", 
+        lambda: next(ptree.iterGlob('root.*.d1_[0-4]'))
+    )
+
+def bench_diff(size: int = 1_000_000):
+    """노드 수가 약 size개인 거의 같은 두 트리를 getAllLeafAbs()의 결과로 
+    비교하는 시간과 diff()로 비교하는 시간을 측정. diff()는 digest를 처음 계산하는 
+    첫 호출과, 한쪽 트리의 일부를 바꾼 뒤의 호출을 따로 측정한다."""
+    paths = make_paths(size // 2)
+    before = PathTree()
+    before.appendAll(paths)
+    after = PathTree()
+    after.appendAll(paths)
+    after.remove('root.d0_0.d1_0', REMOVEALL)
+    after.appendAbs('root.d0_1.new.file.log')
+    print(f"{'lenTree()':<45} {before.lenTree():10}")
+
+    def compare_leafs():
+        old_leafs = set(before.getAllLeafAbs())
+        new_leafs = set(after.getAllLeafAbs())
+        return old_leafs - new_leafs, new_leafs - old_leafs
+    measure("getAllLeafAbs() set difference", compare_leafs)
+    measure("diff() (first call)", lambda: before.diff(after))
+    after.replace('root.d0_2.d1_3', 'renamed')
+    after.appendAbs('root.d0_3.new.file.log')
+    measure("diff() (after 2 changes)", lambda: before.diff(after))
+
+
+def heap_length_order(strings: list[str], ascending: bool = True) -> (list[str]):
+    """(길이, 문자열) 튜플들의 힙에서 하나씩 꺼내 정렬하던 기존 방식."""
+    heap_list = [(len(s) if ascending else -len(s), s) for s in strings]
+    heapq.heapify(heap_list)
+    result = []
+    while heap_list:
+        result.append(heapq.heappop(heap_list)[1])
+    return result
+
+def bench_length_order(size: int = 1_000_000, k: int = 100):
+    """경로 size개를 길이 순으로 정렬하는 시간을 기존 힙 방식과 비교하고, 
+    앞의 k개만 필요한 경우와 PathTree.getAllLeafAbs(LENGTH)의 시간도 측정."""
+    paths = make_paths(size)
+    random.Random(0).shuffle(paths)
+    for ascending in (True, False):
+        order = '오름차순' if ascending else '내림차순'
+        expected = measure(
+            f"heap pop x {size} ({order})", 
+            lambda: heap_length_order(paths, ascending)
+        )
+        result = measure(
+            f"_sortLengthOrder() x {size} ({order})", 
+            lambda: _sortLengthOrder(paths, ascending)
+        )
+        assert result == expected
+        result = measure(
+            f"_sortLengthOrder(k={k}) x {size} ({order})", 
+            lambda: _sortLengthOrder(paths, ascending, k)
+        )
+        assert result == expected[:k]
+        measure(
+            f"next(_iterLengthOrder()) x {size} ({order})", 
+            lambda: next(_iterLengthOrder(paths, ascending))
+        )
+
+    ptree = PathTree()
+    ptree.appendAll(paths)
+    measure(
+        f"getAllLeafAbs(LENGTH) x {size}", lambda: ptree.getAllLeafAbs(LENGTH)
+    )
+    measure(
+        f"getAllLeafAbs(LENGTH, k={k}) x {size}", 
+        lambda: ptree.getAllLeafAbs(LENGTH, k=k)
+    )
+
+if __name__ == '__main__':
+    bench_name_lookup()
+    bench_bulk_build()
+    bench_render()
+    bench_export()
+    bench_traversal()
+    bench_remove()
+    bench_wide_append()
+    bench_memory()
+    bench_snapshot()
+    bench_query()
+    bench_diff()
+    bench_length_order()
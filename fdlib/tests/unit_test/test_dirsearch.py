@@ -1,6 +1,11 @@
 import unittest
 import sys
 import os
+import io
+import json
+import time
+import tempfile
+from unittest import mock
 
 from dirimporttool import get_super_dir_directly
 
@@ -9,7 +14,7 @@ for i in range(1, 2+1):
     sys.path.append(super_dir)
 
 import dirsearch as dirs
-from submodules.tree import PathTree, LENGTH
+from submodules.tree import PathTree, LENGTH, JSON, OUTLINE, DOT
 
 
 class TestLengthSort(unittest.TestCase):
@@ -46,6 +51,43 @@ class TestLengthSort(unittest.TestCase):
         for i, data in enumerate(actual_result2):
             self.assertEqual(data, expected_result2[i])
 
+    def testSortTies(self):
+        # 길이가 같은 문자열들은 입력 순서와 관계 없이 문자열 오름차순으로 정렬.
+        data = ['b/c', 'a', 'a/c', 'dd', 'a/b', 'c']
+        expected = ['a', 'c', 'dd', 'a/b', 'a/c', 'b/c']
+        self.assertEqual(dirs.sort_length_order(data), expected)
+        self.assertEqual(dirs.sort_length_order(data[::-1]), expected)
+        self.assertEqual(
+            dirs.sort_length_order(data, False),
+            ['a/b', 'a/c', 'b/c', 'dd', 'a', 'c']
+        )
+        self.assertEqual(list(dirs.iter_length_order(iter(data))), expected)
+        self.assertEqual(
+            list(dirs.iter_length_order(data, False)),
+            dirs.sort_length_order(data, False)
+        )
+
+    def testSortTopK(self):
+        for ascending in (True, False):
+            expected = dirs.sort_length_order(self.testdata_text, ascending)
+            for k in range(len(expected) + 2):
+                self.assertEqual(
+                    dirs.sort_length_order(self.testdata_text, ascending, k),
+                    expected[:k]
+                )
+        self.assertEqual(dirs.sort_length_order(self.testdata_text, k=-1), [])
+
+        ptree = PathTree()
+        ptree.appendAll(['r.bb.c', 'r.a', 'r.bb.a', 'r.d.e.f'])
+        self.assertEqual(
+            ptree.getAllLeafAbs(LENGTH, ascending=False, k=2),
+            ['r.d.e.f', 'r.bb.a']
+        )
+        self.assertEqual(ptree.getAllLeafAbs(k=2), ['r.a', 'r.bb.a'])
+        self.assertEqual(
+            ptree.getAllLeafAbs(ascending=False, k=1), ['r.d.e.f']
+        )
+
 
 class TestDirSearch(unittest.TestCase):
     def setUp(self):
@@ -84,8 +126,404 @@ class TestDirSearch(unittest.TestCase):
             self.test_root_dir_path, False)
         self.assertIsInstance(result, PathTree)
         leafpath = result.getAllLeafAbs(how_to_sort=LENGTH)
+        # 상대경로는 루트 디렉토리명으로 시작한다.
+        self.assertEqual(len(leafpath), len(self.testdata_path))
         for i, path in enumerate(leafpath):
-            self.assertEqual(path, self.testdata_path[i])
+            self.assertEqual(path, 'testpkg\\' + self.testdata_path[i])
+
+
+class TestIterDirSearch(unittest.TestCase):
+    """iter_all_in_rootdir() 함수 테스트."""
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        for dirpath in ['dir.v2', 'sub_dir1', 'emptydir']:
+            os.mkdir(os.path.join(self.root, dirpath))
+        for parts in [('Makefile',), ('dir.v2', 'file1.txt'), ('sub_dir1', 'README')]:
+            open(os.path.join(self.root, *parts), 'w').close()
+        self.expected = [
+            'Makefile',
+            os.path.join('dir.v2', 'file1.txt'),
+            'emptydir',
+            os.path.join('sub_dir1', 'README'),
+        ]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def testEntityKind(self):
+        """확장자가 없는 파일과 이름에 '.'이 있는 디렉토리를 구분하는지 테스트."""
+        results = dirs.iter_all_in_rootdir(self.root, False)
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(sorted(results), sorted(self.expected))
+        self.assertEqual(
+            sorted(dirs.get_all_in_rootdir(self.root)),
+            sorted(os.path.join(self.root, p) for p in self.expected)
+        )
+
+    def testSymlinkLoop(self):
+        """상위 디렉토리를 가리키는 심볼릭 링크가 있을 때 테스트."""
+        link_path = os.path.join(self.root, 'sub_dir1', 'loop')
+        try:
+            os.symlink(self.root, link_path, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            self.skipTest("심볼릭 링크를 만들 수 없는 환경.")
+        results = dirs.get_all_in_rootdir(self.root, False)
+        self.assertEqual(sorted(results), sorted(self.expected))
+        results = dirs.get_all_in_rootdir(self.root, False, follow_symlinks=False)
+        self.assertEqual(
+            sorted(results), 
+            sorted(self.expected + [os.path.join('sub_dir1', 'loop')])
+        )
+
+    def testParallel(self):
+        """iter_all_in_rootdir_parallel() 함수 테스트."""
+        expected = dirs.get_all_in_rootdir(self.root, False)
+        for max_workers in [2, 4]:
+            results = dirs.iter_all_in_rootdir_parallel(
+                self.root, False, max_workers=max_workers)
+            self.assertEqual(sorted(results), sorted(expected))
+            results = dirs.iter_all_in_rootdir_parallel(
+                self.root, False, max_workers=max_workers, ordered=True)
+            self.assertEqual(list(results), expected)
+            results = dirs.get_all_in_rootdir(
+                self.root, False, max_workers=max_workers)
+            self.assertEqual(results, expected)
+
+    def testParallelEarlyClose(self):
+        """iter_all_in_rootdir_parallel() 제너레이터를 중간에 닫으면 
+        남은 디렉토리들을 탐색하지 않는지 테스트."""
+        dir_number = 200
+        for i in range(dir_number):
+            dirpath = os.path.join(self.root, 'wide', f'dir{i}')
+            os.makedirs(dirpath)
+            open(os.path.join(dirpath, 'file.txt'), 'w').close()
+        scandir = os.scandir
+        scanned = []
+
+        def slow_scandir(path):
+            scanned.append(path)
+            time.sleep(0.005)
+            return scandir(path)
+
+        for ordered in [False, True]:
+            scanned.clear()
+            with mock.patch.object(dirs.os, 'scandir', slow_scandir):
+                results = dirs.iter_all_in_rootdir_parallel(
+                    self.root, False, max_workers=2, ordered=ordered)
+                for _ in results: break
+                results.close()
+            self.assertLess(len(scanned), dir_number // 4)
+
+    def testFilter(self):
+        """include, exclude, extensions, max_depth, predicate 인자 테스트."""
+        os.mkdir(os.path.join(self.root, '.git'))
+        open(os.path.join(self.root, '.git', 'config'), 'w').close()
+        opened = []
+        def predicate(entry: os.DirEntry) -> (bool):
+            opened.append(entry.name)
+            return True
+        results = dirs.get_all_in_rootdir(
+            self.root, False, exclude=['.git'], predicate=predicate)
+        self.assertEqual(sorted(results), sorted(self.expected))
+        # 제외된 디렉토리는 열지 않는다.
+        self.assertNotIn('config', opened)
+
+        results = dirs.get_all_in_rootdir(self.root, False, extensions=['txt'])
+        self.assertEqual(results, [os.path.join('dir.v2', 'file1.txt')])
+        results = dirs.get_all_in_rootdir(
+            self.root, False, include=['sub_dir1/*', 'Makefile'])
+        self.assertEqual(
+            sorted(results), ['Makefile', os.path.join('sub_dir1', 'README')])
+        results = dirs.get_all_in_rootdir(
+            self.root, False, exclude=['.git'], max_depth=1)
+        self.assertEqual(
+            sorted(results), ['Makefile', 'dir.v2', 'emptydir', 'sub_dir1'])
+        results = dirs.iter_all_in_rootdir_parallel(
+            self.root, False, max_workers=2, extensions=['.txt'])
+        self.assertEqual(list(results), [os.path.join('dir.v2', 'file1.txt')])
+
+    def testInfo(self):
+        """iter_info_in_rootdir(), get_dir_sizes() 함수 테스트."""
+        with open(os.path.join(self.root, 'dir.v2', 'file1.txt'), 'w') as file:
+            file.write('a' * 10)
+        with open(os.path.join(self.root, 'sub_dir1', 'README'), 'w') as file:
+            file.write('a' * 5)
+        infos = list(dirs.iter_info_in_rootdir(self.root, False))
+        self.assertEqual([info.path for info in infos],
+                         dirs.get_all_in_rootdir(self.root, False))
+        for info in infos:
+            path = os.path.join(self.root, info.path)
+            self.assertEqual(info.is_dir, os.path.isdir(path))
+            self.assertEqual(info.size, os.path.getsize(path))
+            self.assertEqual(info.mtime, os.path.getmtime(path))
+            self.assertEqual(info.ctime, os.path.getctime(path))
+            self.assertEqual(info.inode, os.stat(path).st_ino)
+        # 디렉토리의 정보는 그 안의 entity들 다음에 반환된다.
+        paths = [
+            info.path for info in
+            dirs.iter_info_in_rootdir(self.root, False, include_dirs=True)
+        ]
+        self.assertLess(paths.index(os.path.join('dir.v2', 'file1.txt')),
+                        paths.index('dir.v2'))
+
+        self.assertEqual(dirs.get_dir_sizes(self.root, False), {
+            'dir.v2': 10, 'emptydir': 0, 'sub_dir1': 5, '': 15
+        })
+        self.assertEqual(
+            dirs.get_dir_sizes(self.root, report_depth=0, extensions=['.txt']),
+            {os.path.abspath(self.root): 10}
+        )
+
+    def testInfoSymlink(self):
+        """심볼릭 링크를 따라갈 때 EntryInfo의 모든 정보가 링크 대상의 
+        정보인지 테스트."""
+        target = os.path.join(self.root, 'dir.v2', 'file1.txt')
+        with open(target, 'w') as file:
+            file.write('a' * 10)
+        link_path = os.path.join(self.root, 'link.txt')
+        try:
+            os.symlink(target, link_path)
+        except (OSError, NotImplementedError):
+            self.skipTest("심볼릭 링크를 만들 수 없는 환경.")
+        for follow_symlinks in [True, False]:
+            infos = {
+                info.path: info for info in dirs.iter_info_in_rootdir(
+                    self.root, False, follow_symlinks=follow_symlinks)
+            }
+            st = os.stat(link_path, follow_symlinks=follow_symlinks)
+            info = infos['link.txt']
+            self.assertEqual(
+                (info.size, info.mtime, info.inode), 
+                (st.st_size, st.st_mtime, st.st_ino)
+            )
+
+    def testDuplicates(self):
+        """find_duplicate_files() 함수 테스트."""
+        edge_size = dirs._HASH_EDGE_SIZE
+        data = os.urandom(edge_size * 3)
+        # 앞, 뒤 부분은 같고 가운데만 다른 파일.
+        changed = data[:edge_size] + bytes(edge_size) + data[-edge_size:]
+        for parts, content in [
+                (('a.bin',), data), (('dir.v2', 'b.bin'), data),
+                (('sub_dir1', 'c.bin'), changed), (('d.txt',), b'abc'),
+                (('sub_dir1', 'e.txt'), b'abc')]:
+            with open(os.path.join(self.root, *parts), 'wb') as file:
+                file.write(content)
+        expected = [
+            ['a.bin', os.path.join('dir.v2', 'b.bin')],
+            ['d.txt', os.path.join('sub_dir1', 'e.txt')],
+        ]
+        cache_path = os.path.join(self.root, 'emptydir', 'hashes.json')
+        for max_workers in (1, 2):
+            results = dirs.find_duplicate_files(
+                self.root, False, max_workers=max_workers, cache_path=cache_path)
+            self.assertEqual(results, expected)
+        self.assertEqual(
+            dirs.find_duplicate_files(self.root, extensions=['.bin']),
+            [[os.path.join(self.root, p) for p in expected[0]]]
+        )
+        # 빈 파일들은 min_size=0일 때만 비교한다.
+        results = dirs.find_duplicate_files(self.root, False, min_size=0)
+        self.assertEqual(results[-1], [
+            'Makefile', os.path.join('dir.v2', 'file1.txt'), 
+            os.path.join('sub_dir1', 'README')
+        ])
+
+    def testValidateDirs(self):
+        """DirRule 클래스와 validate_dirs() 함수 테스트."""
+        open(os.path.join(self.root, 'sub_dir1', 'debug.log'), 'w').close()
+        dirpaths = [
+            os.path.join(self.root, name)
+            for name in ['dir.v2', 'sub_dir1', 'emptydir', 'nodir']
+        ]
+        rule = dirs.DirRule(['txt', '.log'])
+        for max_workers in (1, 2):
+            results = dirs.validate_dirs(dirpaths, rule, max_workers)
+            self.assertEqual([r.is_valid for r in results[:3]], [True, False, True])
+            # 확장자가 없는 파일도 허용되지 않은 파일로 본다.
+            self.assertEqual(results[1].invalid_entities, ['README'])
+            self.assertIsNone(results[3])
+
+        rule = dirs.DirRule([], dir_include_ok=True, required_exts=['.log'])
+        results = dirs.validate_dirs([self.root, dirpaths[1]], rule)
+        # 이름에 '.'이 있는 디렉토리는 하위 디렉토리로 본다.
+        self.assertEqual(results[0].invalid_entities, ['Makefile'])
+        self.assertEqual(results[0].missing_exts, ['.log'])
+        self.assertEqual(results[1].invalid_entities, ['README'])
+        self.assertEqual(results[1].missing_exts, [])
+
+    def testVisualizeToFile(self):
+        """visualize_rootdir() 함수의 file 인자 테스트."""
+        expected = dirs.visualize_rootdir(self.root, False)
+        self.assertEqual(
+            expected.split('\n'),
+            [
+                os.path.basename(self.root),
+                '├ Makefile',
+                '├ dir.v2',
+                '│ └ file1.txt',
+                '├ emptydir',
+                '└ sub_dir1',
+                '  └ README',
+            ]
+        )
+        buffer = io.StringIO()
+        result = dirs.visualize_rootdir(self.root, False, buffer)
+        self.assertIsNone(result)
+        self.assertEqual(buffer.getvalue(), expected)
+
+    def testVisualizeFormats(self):
+        """visualize_rootdir() 함수의 fmt, with_sizes 인자 테스트."""
+        with open(os.path.join(self.root, 'dir.v2', 'file1.txt'), 'w') as f:
+            f.write('abc')
+        root_name = os.path.basename(self.root)
+        self.assertEqual(
+            dirs.visualize_rootdir(self.root, False, fmt=OUTLINE, with_sizes=True),
+            '\n'.join([
+                f'{root_name} (size=3, files=3)',
+                '  Makefile (size=0)',
+                '  dir.v2 (size=3, files=1)',
+                '    file1.txt (size=3)',
+                '  emptydir (size=0, files=0)',
+                '  sub_dir1 (size=0, files=1)',
+                '    README (size=0)',
+            ])
+        )
+        self.assertEqual(
+            dirs.visualize_rootdir(self.root, False, fmt=OUTLINE),
+            '\n'.join([
+                root_name, '  Makefile', '  dir.v2', '    file1.txt', 
+                '  emptydir', '  sub_dir1', '    README',
+            ])
+        )
+
+        tree = json.loads(
+            dirs.visualize_rootdir(self.root, False, fmt=JSON, with_sizes=True))
+        self.assertEqual(tree['name'], root_name)
+        self.assertEqual((tree['size'], tree['files']), (3, 3))
+        self.assertEqual(
+            [child['name'] for child in tree['children']],
+            ['Makefile', 'dir.v2', 'emptydir', 'sub_dir1']
+        )
+        self.assertEqual(tree['children'][1]['children'], 
+                         [{'name': 'file1.txt', 'size': 3}])
+        self.assertNotIn('children', tree['children'][2])
+
+        buffer = io.StringIO()
+        self.assertIsNone(dirs.visualize_rootdir(self.root, True, buffer, DOT))
+        lines = buffer.getvalue().split('\n')
+        self.assertEqual(lines[0], 'digraph tree {')
+        self.assertEqual(lines[-1], '}')
+        self.assertIn('    n0 [label="{}"];'.format(os.sep.replace('\\', '\\\\')), lines)
+
+        # 절대경로도 os.sep으로 나누어 루트 디렉토리까지의 디렉토리들이 노드가 된다.
+        lines = dirs.visualize_rootdir(self.root).split('\n')
+        depth = len(os.path.abspath(self.root).split(os.sep))
+        self.assertEqual(len(lines), depth + 6)
+        self.assertEqual(lines[-1], '  ' * depth + '└ README')
+        self.assertIsNone(dirs.visualize_rootdir(self.root, fmt=-1))
+
+    def testRescan(self):
+        """DirScanCache 클래스로 바뀐 디렉토리만 다시 탐색하는지 테스트."""
+        cache = dirs.DirScanCache(self.root, False)
+        self.assertEqual(cache.rescan(), {'added': self.expected, 'removed': []})
+        self.assertEqual(cache.rescan(), {'added': [], 'removed': []})
+
+        # 수정 시각이 현재와 가까운 디렉토리는 매번 다시 읽으므로,
+        # 수정 시각을 과거로 돌려 바뀌지 않은 디렉토리를 읽지 않는지 확인한다.
+        def set_past_mtime(seconds: int):
+            for dirpath in ['', 'dir.v2', 'sub_dir1', 'emptydir']:
+                os.utime(os.path.join(self.root, dirpath), (seconds, seconds))
+        set_past_mtime(1_000_000)
+        cache.rescan()
+        os.remove(os.path.join(self.root, 'dir.v2', 'file1.txt'))
+        open(os.path.join(self.root, 'emptydir', 'new.txt'), 'w').close()
+        set_past_mtime(2_000_000)
+        os.utime(os.path.join(self.root, 'sub_dir1'), (1_000_000, 1_000_000))
+        scandir = os.scandir
+        scanned = []
+
+        def recording_scandir(path):
+            scanned.append(os.path.relpath(path, self.root))
+            return scandir(path)
+
+        with mock.patch.object(dirs.os, 'scandir', recording_scandir):
+            result = cache.rescan()
+        self.assertEqual(result, {
+            'added': ['dir.v2', os.path.join('emptydir', 'new.txt')],
+            'removed': [os.path.join('dir.v2', 'file1.txt'), 'emptydir'],
+        })
+        self.assertNotIn('sub_dir1', scanned)
+
+        root_name = os.path.basename(self.root)
+        leafs = cache.getPathTree().getAllLeafAbs()
+        self.assertEqual(
+            sorted(leafs),
+            sorted(os.path.join(root_name, p) for p in cache.getAllLeafs())
+        )
+
+        cache_path = os.path.join(self.root, 'cache.json')
+        cache.saveCache(cache_path)
+        loaded = dirs.DirScanCache(self.root, False)
+        self.assertTrue(loaded.loadCache(cache_path))
+        self.assertEqual(sorted(loaded.getPathTree().getAllLeafAbs()), sorted(leafs))
+        self.assertEqual(loaded.rescan(), {'added': ['cache.json'], 'removed': []})
+        self.assertFalse(dirs.DirScanCache(os.path.join(self.root, 'sub_dir1'))
+                         .loadCache(cache_path))
+
+    def testWatch(self):
+        """DirWatcher 클래스로 변경 사항을 PathTree에 반영하는지 테스트."""
+        for use_inotify in (True, False):
+            with dirs.DirWatcher(self.root, False, interval=0.01,
+                                 use_inotify=use_inotify) as watcher:
+                if use_inotify and watcher.backend != 'inotify':
+                    continue
+                self.assertEqual(sorted(watcher.getAllLeafs()), sorted(self.expected))
+                self.assertEqual(watcher.poll(0), {'added': [], 'removed': []})
+
+                new_dir = os.path.join(self.root, 'emptydir', f"new{use_inotify}")
+                os.mkdir(new_dir)
+                open(os.path.join(new_dir, 'new.log'), 'w').close()
+                os.remove(os.path.join(self.root, 'Makefile'))
+                added, removed = set(), set()
+                while True:
+                    result = watcher.poll(0.5)
+                    if not result['added'] and not result['removed']: break
+                    added.update(result['added'])
+                    removed.update(result['removed'])
+                new_log = os.path.join('emptydir', f"new{use_inotify}", 'new.log')
+                self.assertEqual(added, {new_log})
+                self.assertEqual(removed, {'Makefile', 'emptydir'})
+                self.assertIn(
+                    os.path.join(os.path.basename(self.root), new_log),
+                    watcher.getPathTree().getAllLeafAbs()
+                )
+            # 다음 방식의 테스트를 위해 되돌린다.
+            os.remove(os.path.join(new_dir, 'new.log'))
+            os.rmdir(new_dir)
+            open(os.path.join(self.root, 'Makefile'), 'w').close()
+
+    def testWatchMoveOut(self):
+        """감시 중인 디렉토리를 루트 디렉토리 밖으로 옮기면 그 하위 디렉토리들도 
+        감시 대상에서 제외되는지 테스트."""
+        os.makedirs(os.path.join(self.root, 'a', 'b', 'c'))
+        with tempfile.TemporaryDirectory() as outside, \
+                dirs.DirWatcher(self.root, False) as watcher:
+            if watcher.backend != 'inotify':
+                self.skipTest("inotify를 쓸 수 없는 환경.")
+            self.assertIn(os.path.join('a', 'b', 'c'), watcher._wd_to_dir.values())
+            os.rename(os.path.join(self.root, 'a'), os.path.join(outside, 'a'))
+            while True:
+                result = watcher.poll(0.5)
+                if not result['added'] and not result['removed']: break
+            self.assertEqual(
+                sorted(watcher._wd_to_dir.values()), sorted(watcher._cache._dirs)
+            )
+            self.assertEqual(
+                {relpath: wd for wd, relpath in watcher._wd_to_dir.items()},
+                watcher._dir_to_wd
+            )
 
 
 class TestValidateIfDir(unittest.TestCase):
@@ -0,0 +1,144 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+from dirimporttool import get_super_dir_directly
+
+for i in range(1, 2+1):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+from submodules.tree import PathTree
+
+
+class TestPathTreeSnapshot(unittest.TestCase):
+    """PathTree.saveSnapshot(), loadSnapshot() 메서드 테스트."""
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'tree.snapshot')
+        self.tree = PathTree(delimiter='/')
+        self.tree.appendAll([
+            'root/살 것들/마트/당근',
+            'root/할 일/공부/과목/자료구조',
+            'root/할 일/공부/과목/프로그래밍 언어/파이썬',
+            'root/할 일/집안일/설거지/접시',
+            'root/café/naïve.txt',
+            'root/마트/당근',
+        ])
+
+        # 손상된 파일을 읽으려 할 트리. 읽기에 실패하면 그대로 남아있어야 한다.
+        self.target = PathTree()
+        self.target.appendAll(['기존.트리.노드', '기존.노드'])
+        self.target_snapshot = self.target.getSnapshot()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assertTargetUntouched(self):
+        self.assertEqual(self.target.getSnapshot(), self.target_snapshot)
+        self.assertEqual(self.target.delimiter, '.')
+        self.assertEqual(self.target.getRoot(), '기존')
+        self.assertEqual(self.target.search('노드'), ['기존.노드', '기존.트리.노드'])
+
+    def writeBytes(self, data: bytes):
+        with open(self.file_path, 'wb') as f:
+            f.write(data)
+
+    def testRoundTrip(self):
+        """JSON 파일과 바이너리 파일 모두 저장한 트리를 그대로 복원하는지 테스트."""
+        for binary in [False, True]:
+            with self.subTest(binary=binary):
+                self.tree.saveSnapshot(self.file_path, binary)
+                self.assertTrue(self.target.loadSnapshot(self.file_path))
+                self.assertEqual(self.target.getSnapshot(), self.tree.getSnapshot())
+                self.assertEqual(self.target.delimiter, '/')
+                self.assertEqual(self.target.lenTree(), self.tree.lenTree())
+                self.assertEqual(
+                    self.target.getAllLeafAbs(),
+                    self.tree.getAllLeafAbs()
+                )
+                self.assertEqual(
+                    self.target.search('당근'),
+                    ['root/마트/당근', 'root/살 것들/마트/당근']
+                )
+                self.assertEqual(
+                    self.target.getChildren('root/café'), ['naïve.txt']
+                )
+
+    def testJsonFormat(self):
+        """JSON 파일이 비ASCII 이름을 그대로 담는지 테스트."""
+        self.tree.saveSnapshot(self.file_path)
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.tree.getSnapshot())
+
+    def testTruncatedFile(self):
+        """잘린 스냅샷 파일을 읽으면 False를 반환하고 트리를 바꾸지 않는지 테스트."""
+        for binary in [False, True]:
+            self.tree.saveSnapshot(self.file_path, binary)
+            with open(self.file_path, 'rb') as f:
+                data = f.read()
+            for size in range(len(data)):
+                with self.subTest(binary=binary, size=size):
+                    self.writeBytes(data[:size])
+                    self.assertFalse(self.target.loadSnapshot(self.file_path))
+                    self.assertTargetUntouched()
+
+    def testCorruptedFile(self):
+        """형식이 잘못된 스냅샷 파일을 읽으면 False를 반환하고 트리를 바꾸지 않는지 테스트."""
+        snapshot = self.tree.getSnapshot()
+        self.tree.saveSnapshot(self.file_path, binary=True)
+        with open(self.file_path, 'rb') as f:
+            binary_data = f.read()
+
+        corrupted = {
+            'garbage': '스냅샷 아님'.encode('utf-8'),
+            'invalid utf-8': b'\xff\xfe\xfd',
+            'json list': b'[1, 2, 3]',
+            'wrong version': {**snapshot, 'version': -1},
+            'missing key': {k: v for k, v in snapshot.items() if k != 'parents'},
+            'forward parent': {**snapshot, 'parents': [-1, 2, *snapshot['parents'][2:]]},
+            'name id out of range': {**snapshot, 'name_ids': [*snapshot['name_ids'][:-1], 999]},
+            'length mismatch': {**snapshot, 'parents': snapshot['parents'][:-1]},
+            'duplicated child': {
+                **snapshot,
+                'name_ids': [0, 1, 1],
+                'parents': [-1, 0, 0],
+            },
+            # 바이너리 파일 내 노드 이름 영역의 한 바이트를 바꿔 UTF-8로 읽을 수 없게 한다.
+            'broken name bytes': binary_data.replace(
+                '당근'.encode('utf-8'), b'\xff' + '당근'.encode('utf-8')[1:]
+            ),
+            'broken header': binary_data[:8] + b'\xff' * 8,
+        }
+        for case, content in corrupted.items():
+            with self.subTest(case=case):
+                if isinstance(content, dict):
+                    content = json.dumps(content, ensure_ascii=False).encode('utf-8')
+                self.writeBytes(content)
+                self.assertFalse(self.target.loadSnapshot(self.file_path))
+                self.assertTargetUntouched()
+
+
+if __name__ == '__main__':
+    def test_only(casename):
+        """
+        Parameters
+        ----------
+        casename : callable
+            테스트 하고자 하는 테스트 클래스명 또는 메서드명
+
+        """
+        suite_obj = unittest.TestSuite()
+        try:
+            suite_obj.addTest(unittest.makeSuite(casename))
+        except TypeError:
+            suite_obj.addTest(casename)
+
+        runner = unittest.TextTestRunner()
+        runner.run(suite_obj)
+
+    # 테스트하고자 하는 코드만 주석 해제하여 진행.
+    unittest.main()
+    #test_only(TestPathTreeSnapshot)
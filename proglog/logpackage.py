@@ -9,12 +9,19 @@
 """
 
 import os
+import re
 import inspect
 import logging
+import collections
+import io
+import gzip
+import heapq
 import shutil
 import zipfile
 import datetime
-from typing import Literal, TypeAlias
+from typing import Literal, TypeAlias, TextIO
+from collections.abc import Iterable, Iterator
+from operator import itemgetter
 
 import logexc
 import tools
@@ -59,6 +66,9 @@ DEFAULT_LEVEL_LOG_FILE_NAMES = {
     LOGGERTREE: 'logger_tree.log',
 }
 
+# 로그 파일 요약 시 한 번에 읽어들이는 최대 바이트 수.
+SUMMARY_CHUNK_SIZE = 1024 * 1024
+
 # 로깅 관련 데코레이터 클래스들.
 class LogFuncEndPoint():
     def __init__(self, logger_obj: logging.Logger):
@@ -175,9 +185,6 @@ class _LoggerPathTree(PathTree):
         ):
         default_root = True  # 강제로 True로 전환하여 항상 트리에 <root>가 있게 함.
         super().__init__(default_root, delimiter, always_raise_error)
-        self._adj_list = {}
-        self._root = 'root'
-        self._adj_list[self._root] = []
 
     def appendAbs(self, new_path: AbsPath, raise_error: bool = False):
         if not self.isAbsPath(new_path):
@@ -236,6 +243,13 @@ class _LoggerHierarchy():
         """
         return self._ptree.getTreeStructure()
 
+    def writeLoggerTree(self, file: TextIO):
+        """현재까지 등록된 로거 객체들의 계층 트리를 한 줄씩 file 객체에 씀. 
+        중간에 새로운 로거 객체들을 생성한 경우, updateLoggerInfo() 메서드 
+        호출로 새로고침 필요. 
+        """
+        self._ptree.writeTreeStructure(file)
+
     def getLeafLoggersName(self):
         """현재까지 등록된 모든 로거 객체들의 계층 트리에서 
         leaf 로거 이름만을 반환. 
@@ -675,23 +689,8 @@ class LogFileEnvironment():
         if not os.path.isdir(self.base_dir):
             raise logexc.NotInitConfigError(logexc.NO_BASE_DIR)
         
-        if self.date_type == tools.DateOptions.DAY:
-            today = self.datetool.getDateStr(
-                tools.DateOptions.DAY, True
-            )
-        elif self.date_type == tools.DateOptions.WEEK:
-            today = self.datetool.getDateStr(
-                tools.DateOptions.WEEK, True
-            )
-        elif self.date_type == tools.DateOptions.MONTH:
-            today = self.datetool.getDateStr(
-                tools.DateOptions.MONTH, True
-            )
-        elif self.date_type == tools.DateOptions.YEAR:
-            today = self.datetool.getDateStr(
-                tools.DateOptions.YEAR, True
-            )
-        else:
+        today = self.datetool.getDateStr(self.date_type, True)
+        if today is None:
             # self.date_type 변수에 tools.DateOptions 클래스에 정의된
             # 상수값들 중 어디에도 포함되지 않는 비정상적인 경우.
             return None
@@ -733,8 +732,6 @@ class LogFileEnvironment():
                 return new_filter
             
             def get_file_handler(level: LoggerLevel):
-                date_dir = self.generateDateDirPath()
-                os.makedirs(date_dir, exist_ok=True)
                 log_file_name = self.level_log_file_names[level]
                 if not log_file_name.endswith('.log'):
                     log_file_name = '.'.join([log_file_name, 'log'])
@@ -749,6 +746,10 @@ class LogFileEnvironment():
                     file_handler = self._getCustomHandler(filename=target_file)
                 return file_handler
 
+            # 모든 수준의 로그 파일들은 같은 날짜 디렉토리에 저장되므로 
+            # 날짜 디렉토리 경로는 한 번만 생성한다.
+            date_dir = self.generateDateDirPath()
+            os.makedirs(date_dir, exist_ok=True)
             for level in DEFAULT_TOPLEVEL_LOGGERS:
                 formatter_obj = get_formatter(level)
                 filter_obj = get_filter(level)
@@ -1149,10 +1150,191 @@ class PackageLogger():
             DEFAULT_TOPLEVEL_LOGGERS[LOGGERTREE]
         )
         hierarchy_logger.setLevel(logging.INFO)
-        tree_str = self.getCurrentHierarchy()
-        all_leaf = self.getCurrentAllLeafLoggers()
-        all_leaf = '\n'.join(all_leaf)
-        hierarchy_logger.info(f"{tree_str}\n\n{all_leaf}")
+        self._log_hier.updateLoggerInfo()
+        # 트리 구조의 줄들과 leaf 로거 이름들을 하나의 버퍼에 바로 써서 
+        # 줄 리스트와 중간 문자열들을 따로 만들지 않도록 함.
+        message = io.StringIO()
+        self._log_hier.writeLoggerTree(message)
+        message.write('\n')
+        for leaf in self._log_hier.getLeafLoggersName():
+            message.write('\n')
+            message.write(leaf)
+        hierarchy_logger.info(message.getvalue())
+
+
+# 로그 기록의 첫 줄 여부를 판별하는 정규표현식.
+# logging.Formatter의 기본 asctime 형태('YYYY-MM-DD HH:MM:SS,mmm')로 
+# 시작하는 줄을 새 로그 기록의 시작으로 본다. 
+# 그 외의 줄은 이전 로그 기록의 메시지 일부로 간주한다.
+_LOG_RECORD_HEAD = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}')
+_LOG_LEVEL_NAME = re.compile(r'\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b')
+_TOPLEVEL_LOGGER_NAME = re.compile(r'__\w+?__')
+# CustomRotatingFileHandler로 생성된 로그 파일명의 넘버링 부분. 
+# 예) 'debug (1).log', 'debug (1).log.gz'
+_ROTATED_FILE_NUMBER = re.compile(r' \(\d+\)(?=\.log(?:\.gz)?$)')
+# 로그 파일만 가진 날짜 디렉토리인지 검사하는 조건.
+_LOG_DIR_RULE = dirs.DirRule(['.log'])
+
+
+def _parseAsctime(asctime: str) -> (datetime.datetime):
+    """'YYYY-MM-DD HH:MM:SS,mmm' 형태의 로그 기록 시각 문자열을 
+    datetime.datetime 객체로 변환한다. 
+    형태가 고정되어 있으므로 strptime()을 쓰지 않고 직접 자른다.
+    """
+    return datetime.datetime(
+        int(asctime[0:4]), int(asctime[5:7]), int(asctime[8:10]),
+        int(asctime[11:13]), int(asctime[14:16]), int(asctime[17:19]),
+        int(asctime[20:23]) * 1000
+    )
+
+
+def _iterLogRecords(
+        lines: Iterable[str],
+        source: str
+    ) -> (Iterator[tuple[str, str, str]]):
+    """로그 파일의 줄들을 로그 기록 단위로 묶어 
+    (기록 시각 문자열, source, 로그 기록 문자열) 튜플로 하나씩 반환하는 제너레이터.
+
+    로그 기록의 시작 줄 판별 기준은 _LOG_RECORD_HEAD를 따르며, 
+    첫 로그 기록 이전에 있는 줄들은 기록 시각 문자열이 빈 문자열인 
+    하나의 로그 기록으로 묶는다. 
+    한 번에 하나의 로그 기록만 메모리에 보관한다.
+    """
+    asctime = ''
+    buffer = []
+    for line in lines:
+        matched = _LOG_RECORD_HEAD.match(line)
+        if matched is not None:
+            if buffer:
+                yield asctime, source, ''.join(buffer)
+            asctime = matched.group()
+            buffer = []
+        buffer.append(line)
+    if buffer:
+        yield asctime, source, ''.join(buffer)
+
+
+def _getRotationKey(file_name: FileName) -> (tuple[str, int]):
+    """CustomRotatingFileHandler로 생성된 로그 파일들을 
+    오래된 순서대로 정렬하기 위한 키. 
+    넘버링 숫자가 클수록 오래된 파일이며, 넘버링이 없는 파일이 가장 최신이다.
+    예) 'debug (2).log' -> ('debug.log', -2)
+    """
+    matched = _ROTATED_FILE_NUMBER.search(file_name)
+    if matched is None:
+        return file_name, 0
+    number = int(matched.group().strip()[1:-1])
+    return _ROTATED_FILE_NUMBER.sub('', file_name), -number
+
+
+def _openLogText(file: io.IOBase) -> (io.TextIOWrapper):
+    """바이너리 모드로 열린 로그 파일을 텍스트 모드로 읽을 수 있도록 감싼다."""
+    return io.TextIOWrapper(file, encoding='utf-8', errors='replace')
+
+
+def _iterLogFileRecords(
+        file_path: FilePath,
+        source: str,
+        member: str | None = None
+    ) -> (Iterator[tuple[str, str, str]]):
+    """로그 파일 하나를 열어 _iterLogRecords()로 로그 기록을 하나씩 반환하는 
+    제너레이터. '.gz' 파일은 gzip으로, member가 주어지면 zip 파일 내 
+    해당 파일을 읽는다. 로그 파일은 모든 로그 기록을 반환하거나 
+    제너레이터가 닫힐 때 닫힌다.
+    """
+    if member is not None:
+        with zipfile.ZipFile(file_path) as zf:
+            with _openLogText(zf.open(member)) as file:
+                yield from _iterLogRecords(file, source)
+    elif file_path.endswith('.gz'):
+        with _openLogText(gzip.open(file_path, 'rb')) as file:
+            yield from _iterLogRecords(file, source)
+    else:
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+            yield from _iterLogRecords(file, source)
+
+
+class _LogFileSummary():
+    """LogFileManager 클래스에서 사용하는 로그 파일 하나에 대한 요약 정보 클래스.
+
+    마지막으로 읽은 위치를 기억하여, 로그 파일에 기록이 추가된 경우 
+    추가된 부분만 읽어 요약 정보를 갱신한다. 
+    로그 파일의 내용이 지워졌거나 삭제 후 다시 생성된 경우에는 처음부터 다시 읽는다.
+
+    """
+    def __init__(self, file_path: FilePath):
+        self.file_path = file_path
+
+        # 로그 기록에 최상위 로거 이름이 없을 때 사용할 최상위 로거 이름. 
+        # 기본 로그 파일명으로부터 정한다. 예) 'error (1).log' -> '__error__'
+        file_name = _ROTATED_FILE_NUMBER.sub('', os.path.basename(file_path))
+        self.default_logger = None
+        for level, name in DEFAULT_LEVEL_LOG_FILE_NAMES.items():
+            if file_name == name:
+                self.default_logger = DEFAULT_TOPLEVEL_LOGGERS[level]
+                break
+        self.clear()
+
+    def clear(self):
+        """요약 정보를 초기화한다."""
+        self.file_id: tuple[int, int] | None = None
+        self.offset = 0
+        self.size = 0
+        self.records = 0
+        self.levels = collections.Counter()
+        self.loggers = collections.Counter()
+        # 'YYYY-MM-DD HH:MM:SS,mmm' 형태의 시각 문자열.
+        self.first: str | None = None
+        self.last: str | None = None
+
+    def update(self):
+        """로그 파일에서 아직 읽지 않은 부분만 읽어 요약 정보를 갱신한다.
+
+        Raises
+        ------
+        FileNotFoundError
+            로그 파일이 존재하지 않는 경우.
+
+        """
+        stat = os.stat(self.file_path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self.file_id or stat.st_size < self.offset:
+            self.clear()
+            self.file_id = file_id
+        self.size = stat.st_size
+        if self.size == self.offset: return
+
+        with open(self.file_path, 'rb') as file:
+            file.seek(self.offset)
+            rest = b''
+            while chunk := file.read(SUMMARY_CHUNK_SIZE):
+                chunk = rest + chunk
+                # 아직 줄바꿈 문자가 기록되지 않은 마지막 줄은 
+                # 다음 갱신 때 읽는다.
+                end = chunk.rfind(b'\n') + 1
+                rest = chunk[end:]
+                self._countRecords(chunk[:end].decode('utf-8', 'replace'))
+                self.offset += end
+
+    def _countRecords(self, text: str):
+        for line in text.splitlines():
+            matched = _LOG_RECORD_HEAD.match(line)
+            if matched is None: continue
+            self.records += 1
+
+            level = _LOG_LEVEL_NAME.search(line, matched.end())
+            self.levels[level.group(1) if level else None] += 1
+
+            logger = _TOPLEVEL_LOGGER_NAME.search(line, matched.end())
+            self.loggers[
+                logger.group() if logger else self.default_logger
+            ] += 1
+
+            asctime = matched.group()
+            if self.first is None or asctime < self.first:
+                self.first = asctime
+            if self.last is None or asctime > self.last:
+                self.last = asctime
 
 
 class LogFileManager():
@@ -1191,6 +1373,9 @@ class LogFileManager():
         self.txthandler = fdh.TextFileHandler(create_dir_ok=False)
         self.dtool = tools.DateTools()
 
+        # summarizeDateDir() 메서드에서 사용하는 로그 파일별 요약 정보.
+        self._file_summaries: dict[FilePath, _LogFileSummary] = {}
+
     def setBaseDirPath(self, new_basedir_path: DirPath):
         """로그 파일들을 하나로 모아 저장, 관리하고 있는 
         베이스 디렉토리 경로 설정.
@@ -1256,7 +1441,8 @@ class LogFileManager():
             logfile_name = '.'.join([logfile_name, 'log'])
         
         if find_all_files:
-            all_leaf_fds = dirs.get_all_in_rootdir(self.base_dir_path)
+            all_leaf_fds = dirs.get_all_in_rootdir(
+                self.base_dir_path, extensions=['.log'])
             count_removed = 0
             for fd in all_leaf_fds:
                 filename = os.path.basename(fd)
@@ -1302,7 +1488,8 @@ class LogFileManager():
         date_dir_fullpath = os.path.join(self.base_dir_path, date_dirname)
         if not os.path.isdir(date_dir_fullpath): return False
 
-        all_leaf_fds = dirs.get_all_in_rootdir(date_dir_fullpath)
+        all_leaf_fds = dirs.get_all_in_rootdir(
+            date_dir_fullpath, extensions=['.log'])
         count_removed = 0
         for fd in all_leaf_fds:
             if os.path.basename(fd).endswith('.log'):
@@ -1351,7 +1538,8 @@ class LogFileManager():
         if not logfile_name.endswith('.log'):
             logfile_name = '.'.join([logfile_name, 'log'])
         if find_all_files:
-            all_leaf_fds = dirs.get_all_in_rootdir(self.base_dir_path)
+            all_leaf_fds = dirs.get_all_in_rootdir(
+                self.base_dir_path, extensions=['.log'])
             count_removed = 0
             for fd in all_leaf_fds:
                 if os.path.basename(fd) == logfile_name:
@@ -1409,13 +1597,13 @@ class LogFileManager():
         if not os.path.isdir(date_dir_fullpath): return False
 
         if delete_dir:
-            if dirs.validate_if_your_dir_with_ext(
-                date_dir_fullpath, ['.log'])[0]:
+            if _LOG_DIR_RULE.validate(date_dir_fullpath).is_valid:
                 shutil.rmtree(date_dir_fullpath)
                 return True
             return False
 
-        all_leaf_fds = dirs.get_all_in_rootdir(date_dir_fullpath)
+        all_leaf_fds = dirs.get_all_in_rootdir(
+            date_dir_fullpath, extensions=['.log'])
         count_removed = 0
         for fd in all_leaf_fds:
             if os.path.basename(fd).endswith('.log'):
@@ -1467,11 +1655,12 @@ class LogFileManager():
             """
             raise logexc.NotInitConfigError(err_msg)
         
-        temp = []
-        for dtype, dtime, dpath in data:
-            if dirs.validate_if_your_dir_with_ext(dpath, ['.log'])[0]:
-                temp.append((dtype, dtime, dpath))
-        data = temp.copy()
+        results = dirs.validate_dirs(
+            [dpath for _, _, dpath in data], _LOG_DIR_RULE)
+        data = [
+            item for item, result in zip(data, results) 
+            if result is not None and result.is_valid
+        ]
         
         diff = maxdir - len(data)
         if diff < 0:
@@ -1479,6 +1668,277 @@ class LogFileManager():
                 dirpath = data[i][-1]
                 shutil.rmtree(dirpath)
 
+    def summarizeDateDir(
+            self,
+            date_dirname: DirName | None
+        ) -> (dict | None):
+        """특정 날짜 디렉토리 내 로그 파일들의 요약 정보를 반환하는 메서드.
+
+        로그 수준별, 최상위 로거별 로그 기록 수와 파일 크기, 
+        가장 처음과 마지막 로그 기록 시각을 집계한다. 
+        각 로그 파일별로 마지막으로 읽은 위치를 기억하므로, 다시 호출할 때는 
+        그 사이에 새로 추가된 로그 기록만 읽는다. 
+
+        로그 기록은 logging.Formatter의 기본 asctime 형태
+        ('YYYY-MM-DD HH:MM:SS,mmm')로 시작하는 줄부터 시작되는 것으로 보며, 
+        해당 줄에서 로그 수준 이름과 최상위 로거 이름(예: '__error__')을 찾는다. 
+        최상위 로거 이름이 없는 경우, DEFAULT_LEVEL_LOG_FILE_NAMES에 정의된 
+        기본 로그 파일명으로부터 최상위 로거 이름을 정하며, 
+        그 외의 로그 파일에서는 None으로 집계된다.
+
+        Parameters
+        ----------
+        date_dirname : DirName(str) | None
+            요약하고자 하는 날짜 디렉토리명. 
+            날짜 디렉토리명은 tools.DateTools().getDateStr() 메서드의 
+            반환 형태 중 하나와 맞아야 함. 
+            날짜 디렉토리가 아닌 베이스 디렉토리 바로 안의 로그 파일들을 
+            요약하고자 한다면 None을 입력.
+
+        Returns
+        -------
+        dict
+            다음의 키를 가지는 딕셔너리.
+            'records' : int
+                전체 로그 기록 수.
+            'levels' : dict[str | None, int]
+                로그 수준 이름별 로그 기록 수. 예) {'ERROR': 3, 'INFO': 10}
+            'loggers' : dict[str | None, int]
+                최상위 로거 이름별 로그 기록 수. 예) {'__error__': 3}
+            'size' : int
+                모든 로그 파일 크기의 합. (바이트)
+            'files' : dict[FileName, int]
+                로그 파일명별 파일 크기. (바이트)
+            'first' : datetime.datetime | None
+                가장 처음의 로그 기록 시각. 로그 기록이 없으면 None.
+            'last' : datetime.datetime | None
+                가장 마지막의 로그 기록 시각. 로그 기록이 없으면 None.
+        None
+            date_dirname 매개변수로 입력한 디렉토리명이 날짜 문자열이 아니거나, 
+            해당 디렉토리가 존재하지 않는 경우.
+
+        See Also
+        --------
+        summarizeAllDateDirs
+
+        """
+        if date_dirname is None:
+            dir_fullpath = self.base_dir_path
+        else:
+            if self.dtool.isDateStr(date_dirname) is None: return None
+            dir_fullpath = os.path.join(self.base_dir_path, date_dirname)
+        if not dir_fullpath or not os.path.isdir(dir_fullpath): return None
+
+        result = {
+            'records': 0,
+            'levels': collections.Counter(),
+            'loggers': collections.Counter(),
+            'size': 0,
+            'files': {},
+            'first': None,
+            'last': None,
+        }
+        first, last = None, None
+        current_files = set()
+        with os.scandir(dir_fullpath) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.log'): continue
+                if not entry.is_file(): continue
+                current_files.add(entry.path)
+                try:
+                    summary = self._file_summaries[entry.path]
+                except KeyError:
+                    summary = _LogFileSummary(entry.path)
+                    self._file_summaries[entry.path] = summary
+                try:
+                    summary.update()
+                except FileNotFoundError:
+                    # 요약 도중 로그 파일이 삭제된 경우.
+                    current_files.discard(entry.path)
+                    continue
+
+                result['records'] += summary.records
+                result['levels'].update(summary.levels)
+                result['loggers'].update(summary.loggers)
+                result['size'] += summary.size
+                result['files'][entry.name] = summary.size
+                if summary.first is not None:
+                    if first is None or summary.first < first:
+                        first = summary.first
+                    if last is None or summary.last > last:
+                        last = summary.last
+        
+        # 삭제된 로그 파일들의 요약 정보는 더 이상 보관하지 않는다.
+        for file_path in list(self._file_summaries):
+            if (os.path.dirname(file_path) == dir_fullpath
+                    and file_path not in current_files):
+                del self._file_summaries[file_path]
+
+        result['levels'] = dict(result['levels'])
+        result['loggers'] = dict(result['loggers'])
+        if first is not None:
+            result['first'] = datetime.datetime.strptime(
+                first, '%Y-%m-%d %H:%M:%S,%f'
+            )
+            result['last'] = datetime.datetime.strptime(
+                last, '%Y-%m-%d %H:%M:%S,%f'
+            )
+        return result
+
+    def summarizeAllDateDirs(self) -> (dict[DirName, dict]):
+        """베이스 디렉토리 내 모든 날짜 디렉토리들의 요약 정보를 반환하는 메서드.
+
+        각 날짜 디렉토리의 요약 정보는 summarizeDateDir() 메서드의 
+        반환값과 같다. 
+        예를 들어 ERROR 수준의 로그 기록이 가장 많은 날짜 디렉토리는 
+        다음과 같이 찾을 수 있다.
+
+            summaries = lfm.summarizeAllDateDirs()
+            max(summaries, key=lambda d: summaries[d]['levels'].get('ERROR', 0))
+
+        Returns
+        -------
+        dict[DirName, dict]
+            날짜 디렉토리명을 키로, 해당 디렉토리의 요약 정보를 값으로 가지는 
+            딕셔너리. 베이스 디렉토리가 설정되지 않았거나 날짜 디렉토리가 
+            없는 경우 빈 딕셔너리를 반환.
+
+        See Also
+        --------
+        summarizeDateDir
+
+        """
+        results = {}
+        if not self.base_dir_path or not os.path.isdir(self.base_dir_path):
+            return results
+        with os.scandir(self.base_dir_path) as entries:
+            date_dirnames = [
+                entry.name for entry in entries 
+                if entry.is_dir() and self.dtool.isDateStr(entry.name)
+            ]
+        for date_dirname in sorted(date_dirnames):
+            summary = self.summarizeDateDir(date_dirname)
+            if summary is not None:
+                results[date_dirname] = summary
+        return results
+
+    def readMergedLogs(
+            self,
+            date_dirname: DirName | None,
+            logfile_names: list[FileName] | None = None
+        ) -> (Iterator[tuple[datetime.datetime | None, str, str]]):
+        """특정 날짜 디렉토리 내 여러 로그 파일들의 로그 기록들을 
+        기록 시각 순으로 합쳐서 하나씩 반환하는 제너레이터 메서드.
+
+        로그 수준별로 나뉘어 저장된 로그 파일들(debug.log, info.log, error.log 등)과 
+        CustomRotatingFileHandler로 생성된 'debug (1).log' 형태의 로그 파일들, 
+        '.log.gz' 형태로 압축된 로그 파일들, zipAllDateDirs() 등으로 생성된 
+        zip 파일 내 로그 파일들을 모두 읽어 하나의 흐름으로 합친다. 
+        단, zip 파일 내 로그 파일과 같은 이름의 로그 파일이 날짜 디렉토리에 
+        있다면 zip 파일 내 로그 파일은 읽지 않는다.
+
+        각 로그 파일은 이미 기록 시각 순으로 정렬되어 있으므로 heapq.merge()를 
+        이용해 k-way 병합하며, 각 로그 파일마다 하나의 로그 기록만 
+        메모리에 보관한다. 따라서 로그 파일들의 크기가 커도 
+        메모리 사용량이 늘어나지 않는다.
+
+        로그 기록의 시작 줄 판별 기준은 summarizeDateDir() 메서드와 같다. 
+        기록 시각이 같은 로그 기록들은 오래된 로그 파일의 것이 먼저 반환된다.
+
+        Parameters
+        ----------
+        date_dirname : DirName(str) | None
+            로그 파일들이 있는 날짜 디렉토리명. 
+            날짜 디렉토리명은 tools.DateTools().getDateStr() 메서드의 
+            반환 형태 중 하나와 맞아야 함. 
+            베이스 디렉토리 바로 안의 로그 파일들을 읽고자 한다면 None을 입력.
+        logfile_names : list[FileName(str)] | None, default None
+            읽고자 하는 로그 파일명들. 예) ['debug.log', 'error.log'] 
+            넘버링된 로그 파일과 압축된 로그 파일들도 원래의 로그 파일명으로 
+            비교한다. None이면 모든 로그 파일들을 읽는다.
+
+        Yields
+        ------
+        tuple[datetime.datetime | None, str, str]
+            (로그 기록 시각, 로그 파일명, 로그 기록 문자열) 튜플. 
+            로그 기록 문자열은 여러 줄일 수 있으며 로그 파일에 기록된 
+            그대로 줄바꿈 문자를 포함한다. 
+            zip 파일 내 로그 파일의 경우 로그 파일명은 
+            'zip 파일명/zip 파일 내 경로' 형태이다. 
+            로그 파일의 첫 로그 기록 이전에 시각 없이 기록된 줄들은 
+            로그 기록 시각이 None인 하나의 로그 기록으로 가장 먼저 반환된다.
+
+        Raises
+        ------
+        FileNotFoundError
+            date_dirname 매개변수로 입력한 디렉토리명이 날짜 문자열이 아니거나, 
+            해당 디렉토리가 존재하지 않는 경우.
+
+        Examples
+        --------
+        >>> lfm = LogFileManager(log_basedir)
+        >>> for dt, source, record in lfm.readMergedLogs('2024-01-17'):
+        ...     print(source, record, end='')
+
+        """
+        if date_dirname is None:
+            dir_fullpath = self.base_dir_path
+        elif self.dtool.isDateStr(date_dirname) is None:
+            dir_fullpath = ''
+        else:
+            dir_fullpath = os.path.join(self.base_dir_path, date_dirname)
+        if not dir_fullpath or not os.path.isdir(dir_fullpath):
+            err_msg = f"""날짜 디렉토리를 찾을 수 없습니다: {date_dirname}"""
+            raise FileNotFoundError(err_msg)
+
+        def is_target(file_name: FileName) -> (bool):
+            if logfile_names is None: return True
+            original = _getRotationKey(os.path.basename(file_name))[0]
+            return original.removesuffix('.gz') in logfile_names
+
+        # (정렬 키, 로그 파일 경로, 로그 파일명, zip 파일 내 경로)
+        sources = []
+        zip_paths = []
+        with os.scandir(dir_fullpath) as entries:
+            for entry in entries:
+                if not entry.is_file(): continue
+                if entry.name.endswith('.zip'):
+                    zip_paths.append(entry.path)
+                elif (entry.name.endswith(('.log', '.log.gz'))
+                        and is_target(entry.name)):
+                    sources.append((
+                        _getRotationKey(entry.name), entry.path, 
+                        entry.name, None
+                    ))
+        plain_names = {name for _, _, name, _ in sources}
+        for zip_path in zip_paths:
+            with zipfile.ZipFile(zip_path) as zf:
+                members = zf.namelist()
+            for member in members:
+                member_name = os.path.basename(member.replace('\\', '/'))
+                if (not member_name.endswith('.log')
+                        or member_name in plain_names
+                        or not is_target(member_name)):
+                    continue
+                source = '/'.join([os.path.basename(zip_path), member])
+                sources.append((
+                    _getRotationKey(member_name), zip_path, source, member
+                ))
+        sources.sort(key=itemgetter(0))
+
+        merged = heapq.merge(
+            *[
+                _iterLogFileRecords(file_path, source, member)
+                for _, file_path, source, member in sources
+            ],
+            key=itemgetter(0)
+        )
+        for asctime, source, record in merged:
+            yield (
+                _parseAsctime(asctime) if asctime else None, 
+                source, record
+            )
+
     def zipAllDateDirs(self, left_original: bool = True):
         """오늘 날짜 디렉토리를 포함한 모든 날짜들의 로그 디렉토리들에 대해 
         로그 파일들을 일괄적으로 zip 파일로 만들어 각각의 디렉토리 내부에 저장하는 
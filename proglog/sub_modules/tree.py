@@ -1,15 +1,20 @@
 """
 개체들과 그 개체들의 트리 구조의 연결관계를 트리 구조로 표현. 
 """
-from typing import Literal
+from typing import Literal, TextIO
+from collections.abc import Iterable, Iterator, Callable
+from collections import deque
+from itertools import accumulate
 import heapq
-try:
-    from sub_modules.my_queue import DynamicQueue
-except ModuleNotFoundError:
-    try:
-        from my_queue import DynamicQueue
-    except ModuleNotFoundError:
-        from .my_queue import DynamicQueue
+import bisect
+import gc
+import re
+import sys
+import fnmatch
+import json
+import struct
+import hashlib
+from array import array
 
 
 # type aliases
@@ -21,6 +26,8 @@ AbsPath = str
 EmptyList = list
 EmptyDict = dict
 EmptyStr = str
+# iterBFS(), iterDFS()의 prune 인자. (depth, 노드 또는 절대경로)를 받는다.
+PruneFunc = Callable[[Depth, Node], bool]
 
 # 상수 정의
 # Tree().remove() 인자에 들어갈 수 있는 상수들.
@@ -32,6 +39,22 @@ RemoveMode = Literal[1, 2, 3] # type alias
 ALPHABET = 4
 LENGTH = 5
 SortMode = Literal[4, 5] # type alias
+# Tree().iterExport(), writeExport()의 fmt 인자에 들어갈 수 있는 상수들.
+TEXT = 6  # getTreeStructure()와 같은 상자 그리기 문자 트리.
+JSON = 7  # {"name": ..., "children": [...]} 형태의 중첩된 JSON 객체.
+OUTLINE = 8  # 깊이만큼 들여쓴 개요.
+DOT = 9  # Graphviz DOT 그래프.
+ExportFormat = Literal[6, 7, 8, 9] # type alias
+# iterExport(), writeExport()의 annotate 인자. 
+# 노드(PathTree는 절대경로)를 받아 해당 노드에 덧붙일 {이름: 값} 딕셔너리 또는 None을 반환.
+AnnotateFunc = Callable[[Node], dict[str, object] | None]
+# PathTree().iterGlob()의 패턴에서 0개 이상의 계층과 대응되는 부분.
+GLOBSTAR = '**'
+# PathTree 스냅샷 파일 형식 관련 상수들.
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_MAGIC = b'PTSN'
+# (매직 바이트, 버전, 구분 기호 바이트 수, 노드 이름 수, 노드 수, 이어 붙인 노드 이름들의 바이트 수)
+_SNAPSHOT_HEADER = struct.Struct('<4sHIIII')
 
 
 # 사용자 정의 예외 클래스 모음
@@ -73,6 +96,81 @@ class RootNotUniqueError(Exception):
 # 사용자 정의 예외 클래스 모음 끝.
 
 
+def _removeSorted(items: list, item: object) -> (None):
+    """오름차순으로 정렬된 리스트에서 item을 이분 탐색으로 찾아 삭제. 
+    item이 리스트에 없으면 ValueError 발생."""
+    i = bisect.bisect_left(items, item)
+    if i == len(items) or items[i] != item: 
+        raise ValueError(f"{item!r} is not in list")
+    del items[i]
+
+def _formatAnnotation(info: dict[str, object] | None) -> (str):
+    """annotate 함수의 반환값을 노드 이름 뒤에 덧붙일 ' (이름=값, ...)' 문자열로 변환."""
+    if not info: return ""
+    return " (" + ', '.join(f"{name}={value}" for name, value in info.items()) + ")"
+
+def _escapeDOT(label: str) -> (str):
+    """Graphviz DOT의 큰따옴표 문자열 안에 쓸 수 있도록 역슬래시와 큰따옴표를 이스케이프."""
+    return label.replace('\\', '\\\\').replace('"', '\\"')
+
+def _groupByLength(
+        items: Iterable,
+        key: Callable[[object], str] | None = None
+    ) -> (dict[int, list]):
+    """item(key가 주어지면 key(item))의 문자열 길이별로 item들을 묶은 딕셔너리 반환.
+    같은 길이 안에서는 입력 순서를 유지한다."""
+    groups = {}
+    if key is None:
+        for item in items:
+            length = len(item)
+            try: groups[length].append(item)
+            except KeyError: groups[length] = [item]
+    else:
+        for item in items:
+            length = len(key(item))
+            try: groups[length].append(item)
+            except KeyError: groups[length] = [item]
+    return groups
+
+def _iterLengthOrder(
+        items: Iterable,
+        ascending: bool = True,
+        key: Callable[[object], str] | None = None
+    ) -> (Iterator):
+    """문자열 길이 순으로 item들을 하나씩 반환하는 제너레이터.
+    길이가 같은 item들은 ascending과 관계 없이 항상 문자열 오름차순으로 반환된다.
+
+    item마다 (길이, 문자열) 튜플을 만들어 힙에서 하나씩 꺼내는 대신,
+    길이별로 묶은 뒤 반환할 차례가 된 묶음만 정렬한다. 따라서 앞의 일부만
+    꺼내 쓰면 나머지 묶음들은 정렬하지 않는다."""
+    groups = _groupByLength(items, key)
+    for length in sorted(groups, reverse=not ascending):
+        group = groups.pop(length)
+        group.sort(key=key)
+        yield from group
+
+def _sortLengthOrder(
+        items: Iterable,
+        ascending: bool = True,
+        k: int | None = None,
+        key: Callable[[object], str] | None = None
+    ) -> (list):
+    """_iterLengthOrder()와 같은 순서로 정렬한 리스트 반환.
+    k가 주어지면 앞에서부터 k개만 반환하며, 경계에 걸친 길이의 묶음에서는
+    heapq.nsmallest()로 필요한 개수만 골라낸다."""
+    groups = _groupByLength(items, key)
+    result = []
+    if k is not None and k <= 0: return result
+    for length in sorted(groups, reverse=not ascending):
+        group = groups[length]
+        if k is not None and len(result) + len(group) >= k:
+            result.extend(heapq.nsmallest(k - len(result), group, key=key))
+            break
+        group.sort(key=key)
+        result.extend(group)
+    return result
+
+
 class Tree():
     def __init__(
             self,
@@ -107,6 +205,8 @@ class Tree():
         self._node_number = 0
         self._delimiter = delimiter
         self._adj_list: dict[Parent, list[Child]] = {}
+        # 자식 노드별 부모 노드. 노드가 추가, 삭제, 변경될 때마다 함께 갱신되어 
+        # getParent(), search() 호출 시 인접리스트 전체를 뒤집지 않도록 함. 
         self._r_adj_list: dict[Child, Parent] = {}
         if default_root: 
             self._root = 'root'
@@ -128,6 +228,7 @@ class Tree():
             new_k = k.replace(self._delimiter, new_delimiter)
             temp_adjl[new_k] = v
         self._adj_list = temp_adjl.copy()
+        self._r_adj_list = self._reverseAdjList()
         self._delimiter = new_delimiter
 
     def getRaiseErrorMode(self) -> (bool): 
@@ -163,18 +264,102 @@ class Tree():
         트리 내 모든 노드들을 depth 순으로 하여 리스트로 반환. 
         depth는 루트 노드에서 0부터 시작함. 
         """
-        if self._root is None: return []
-        all_nodes = []
-        queue = DynamicQueue()
-        # (depth, node)
-        queue.enqueue((0, self._root))
-        while not queue.isEmpty():
-            depth, node = queue.dequeue()
-            all_nodes.append((depth, node))
-            children = self.getChildren(node)
-            if children is not None:
-                for c in children: queue.enqueue((depth+1, c))
-        return all_nodes
+        return list(self.iterBFS())
+
+    def iterBFS(
+            self,
+            start: Node | None = None,
+            max_depth: int | None = None,
+            prune: PruneFunc | None = None
+        ) -> (Iterator[tuple[Depth, Node]]):
+        """
+        start 노드부터 너비 우선 탐색(BFS) 순서로 (depth, 노드)를 하나씩 반환하는 
+        제너레이터. 같은 깊이의 노드들은 오름차순으로 반환된다. 
+        PathTree에서는 노드 이름 대신 노드의 절대경로를 반환한다. 
+        모든 노드들을 리스트로 모으지 않으므로, 필요한 만큼만 탐색하고 
+        중단할 수 있다. 
+
+        매개변수
+        -------
+        start: 탐색을 시작할 노드. None이면 root 노드부터 탐색한다. 
+        depth는 start 노드에서 0부터 시작한다. 
+        PathTree에서는 절대경로 또는 노드 이름을 입력하며, 노드 이름으로 
+        입력 시 같은 이름을 가지는 모든 노드들에서 각각 탐색을 시작한다. 
+        (단, 그 중 다른 시작 노드의 하위 노드인 노드는 제외한다.)
+        max_depth: 해당 depth까지만 탐색한다. None이면 깊이 제한 없이 탐색한다. 
+        prune: (depth, 노드)를 인자로 받아 True를 반환하면 해당 노드와 
+        그 하위 노드들을 모두 건너뛰는 함수. 
+
+        반환값
+        -----
+        start 노드가 트리 내에 없으면 아무것도 반환하지 않는다. 
+
+        예)
+        >>> tree_obj = Tree()
+        >>> for parent, child in [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'e')]:
+        ...     tree_obj.append(child, parent)
+        >>> list(tree_obj.iterBFS())
+        [(0, 'a'), (1, 'b'), (1, 'c'), (2, 'd'), (2, 'e')]
+        >>> list(tree_obj.iterBFS('b'))
+        [(0, 'b'), (1, 'd')]
+        >>> list(tree_obj.iterBFS(max_depth=1))
+        [(0, 'a'), (1, 'b'), (1, 'c')]
+        >>> list(tree_obj.iterBFS(prune=lambda depth, node: node == 'c'))
+        [(0, 'a'), (1, 'b'), (2, 'd')]
+
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['a.b.c', 'a.d.c.e'])
+        >>> list(tree_obj.iterBFS('c'))
+        [(0, 'a.b.c'), (0, 'a.d.c'), (1, 'a.d.c.e')]
+        """
+        return self._iterTraversal(start, max_depth, prune, True)
+
+    def iterDFS(
+            self,
+            start: Node | None = None,
+            max_depth: int | None = None,
+            prune: PruneFunc | None = None
+        ) -> (Iterator[tuple[Depth, Node]]):
+        """
+        start 노드부터 깊이 우선 탐색(DFS, 전위 순회) 순서로 (depth, 노드)를 
+        하나씩 반환하는 제너레이터. 형제 노드들은 오름차순으로 방문한다. 
+        매개변수와 반환값은 iterBFS() 메서드와 같다. 
+
+        예)
+        >>> tree_obj = Tree()
+        >>> for parent, child in [('a', 'b'), ('a', 'c'), ('b', 'd'), ('c', 'e')]:
+        ...     tree_obj.append(child, parent)
+        >>> list(tree_obj.iterDFS())
+        [(0, 'a'), (1, 'b'), (2, 'd'), (1, 'c'), (2, 'e')]
+
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['a.b.c', 'a.d.c.e'])
+        >>> list(tree_obj.iterDFS(max_depth=1))
+        [(0, 'a'), (1, 'a.b'), (1, 'a.d')]
+        """
+        return self._iterTraversal(start, max_depth, prune, False)
+
+    def _iterTraversal(
+            self,
+            start: Node | None,
+            max_depth: int | None,
+            prune: PruneFunc | None,
+            breadth_first: bool
+        ) -> (Iterator[tuple[Depth, Node]]):
+        """iterBFS(), iterDFS()의 구현. breadth_first가 True면 BFS, False면 DFS."""
+        if start is None: start = self._root
+        if start is None or start not in self._adj_list: return
+        pending = deque([(0, start)])
+        pop = pending.popleft if breadth_first else pending.pop
+        while pending:
+            depth, node = pop()
+            if prune is not None and prune(depth, node): continue
+            yield depth, node
+            if max_depth is not None and depth >= max_depth: continue
+            children = self._adj_list.get(node)
+            if not children: continue
+            if not breadth_first: children = reversed(children)
+            pending.extend((depth+1, c) for c in children)
     
     def __repr__(self):
         """
@@ -218,56 +403,296 @@ class Tree():
             └ 집안일
                 └ 설거지
                     └ 접시
+
+        트리 구조를 한 줄씩 받거나 파일 등에 바로 쓰려면 
+        iterTreeStructure(), writeTreeStructure() 메서드를 사용. 
         """
         if self._root is None: return "<빈 트리>"
+        return '\n'.join(self.iterTreeStructure())
+
+    def iterTreeStructure(
+            self, 
+            annotate: AnnotateFunc | None = None
+        ) -> (Iterator[str]):
+        """
+        getTreeStructure()가 반환하는 트리 구조 문자열을 한 줄씩 반환하는 
+        제너레이터. 트리 구조 전체를 하나의 문자열로 만들지 않으므로 
+        노드가 매우 많은 트리도 메모리를 많이 쓰지 않고 출력할 수 있다. 
+        빈 트리면 아무 줄도 반환하지 않는다. 
+        annotate 인자는 iterExport() 참고.
 
+        예)
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> tree_obj.append('c', 'a')
+        >>> tree_obj.append('d', 'b')
+        >>> for line in tree_obj.iterTreeStructure(): print(line)
+        a
+        ├ b
+        │ └ d
+        └ c
+        """
         extension = "│"
         sub_dir_line = "└"
         sub_and_extension = "├"
         whitespace = " "
         one_tab_length = 2
 
-        struct_str = []
-        stack = [(0, self._root)]
-        
-        # depth가 같은 두 노드 a, b 노드가 있다고 가정하고, 두 노드에
-        # 하위 트리가 존재할 경우, a 노드의 하위 트리가 구성될 동안 각 라인 
-        # 앞에는 b 노드가 a 노드와 이어지는 것을 표현하기 위한 문자 "│"을 
-        # 계속 하위 노드들의 맨 앞에 출력해야한다. 이를 위해선 a 노드의 하위 
-        # 트리들이 한 줄씩 구성될 떄동안 b 노드가 아직 남아있음을 기록해야 한다.
-        # 연결선 "│"으로 같은 깊이의 노드들을 연결하기 위해 시작 노드와 끝 노드
-        # 를 기록하는 변수. 
-        branch_stack = []
+        root = self._getStructureRoot()
+        if root is None: return
+        with_keys = annotate is not None
+        root_key = self._getStructureKey(None, root) if with_keys else None
+
+        label = self._getStructureLabel(root)
+        if with_keys: label += _formatAnnotation(annotate(root_key))
+        yield label
+        # 각 깊이마다 해당 깊이의 노드가 형제 노드들 중 마지막 노드인지에 따라 
+        # 그 하위 노드들의 줄 앞에 붙일 문자열("│ " 또는 "  ")을 기록. 
+        # 마지막 노드가 아니면 아직 같은 깊이의 노드가 남아있으므로 
+        # 연결선 "│"으로 이어준다. 
+        prefixes: list[str] = []
+        # (정렬된 자식 노드 리스트, 다음에 출력할 자식 노드의 인덱스, 부모 노드의 key)
+        stack = [(self._getStructureChildren(root), 0, root_key)]
+        while stack:
+            children, i, parent_key = stack[-1]
+            if i == len(children):
+                stack.pop()
+                if prefixes: prefixes.pop()
+                continue
+            stack[-1] = (children, i+1, parent_key)
+            node = children[i]
+            is_last = i == len(children) - 1
+            line_head = sub_dir_line if is_last else sub_and_extension
+            label = self._getStructureLabel(node)
+            key = None
+            if with_keys:
+                key = self._getStructureKey(parent_key, node)
+                label += _formatAnnotation(annotate(key))
+            yield ''.join(prefixes) + line_head + whitespace + label
+            grand_children = self._getStructureChildren(node)
+            if grand_children:
+                if is_last: prefixes.append(whitespace * one_tab_length)
+                else: prefixes.append(extension + whitespace*(one_tab_length-1))
+                stack.append((grand_children, 0, key))
+
+    def writeTreeStructure(self, file: TextIO) -> (None):
+        """
+        getTreeStructure()가 반환하는 트리 구조 문자열을 
+        한 줄씩 file 객체에 쓴다. 
+        file에는 write() 메서드를 가지는 텍스트 파일 객체
+        (open()으로 연 파일, sys.stdout, io.StringIO 등)를 입력한다. 
+
+        예)
+        >>> import io
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> buffer = io.StringIO()
+        >>> tree_obj.writeTreeStructure(buffer)
+        >>> buffer.getvalue()
+        'a\\n└ b'
+        """
+        self.writeExport(file, TEXT)
 
+    def iterExport(
+            self, 
+            fmt: ExportFormat = TEXT, 
+            annotate: AnnotateFunc | None = None
+        ) -> (Iterator[str] | None):
+        """
+        트리 구조를 fmt 형식의 문자열로 한 줄씩 반환하는 이터레이터를 반환한다. 
+        트리 구조 전체를 하나의 문자열로 만들지 않으므로 노드가 매우 많은 
+        트리도 메모리를 많이 쓰지 않고 출력할 수 있다. 
+        같은 깊이의 노드들은 getTreeStructure()와 같이 오름차순으로 나타난다. 
+
+        매개변수
+        -------
+        fmt: 출력 형식. 
+            1. TEXT: getTreeStructure()와 같은 상자 그리기 문자 트리. 
+            빈 트리면 아무 줄도 반환하지 않는다.
+            2. JSON: {"name": 노드, "children": [하위 노드 객체들]} 형태로 
+            중첩된 JSON 객체. leaf 노드는 "children"을 가지지 않는다. 
+            빈 트리면 null.
+            3. OUTLINE: 노드마다 깊이 x 2칸만큼 들여쓴 개요.
+            4. DOT: Graphviz DOT 형식의 방향 그래프(digraph).
+        annotate: 노드(PathTree는 노드의 절대경로)를 받아 그 노드에 덧붙일 
+        {이름: 값} 딕셔너리를 반환하는 함수. None을 반환한 노드에는 아무것도 
+        덧붙이지 않는다. JSON 형식에서는 노드 객체의 키로, 그 외 형식에서는 
+        노드 이름 뒤에 '(이름=값, ...)' 형태로 덧붙는다.
+
+        반환값
+        -----
+        Iterator[str]: 줄 단위 문자열들의 이터레이터. 
+        None: fmt가 위의 상수들이 아닌 경우.
+
+        예)
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> tree_obj.append('c', 'b')
+        >>> sizes = {'a': 2, 'b': 1}
+        >>> annotate = lambda node: {'size': sizes[node]} if node in sizes else None
+        >>> for line in tree_obj.iterExport(OUTLINE, annotate): print(line)
+        a (size=2)
+          b (size=1)
+            c
+        >>> for line in tree_obj.iterExport(JSON): print(line)
+        {"name": "a", "children": [
+          {"name": "b", "children": [
+            {"name": "c"}
+          ]}
+        ]}
+        >>> for line in tree_obj.iterExport(DOT): print(line)
+        digraph tree {
+            n0 [label="a"];
+            n1 [label="b"];
+            n0 -> n1;
+            n2 [label="c"];
+            n1 -> n2;
+        }
+        """
+        if fmt == TEXT: return self.iterTreeStructure(annotate)
+        elif fmt == JSON: return self._iterJSON(annotate)
+        elif fmt == OUTLINE: return self._iterOutline(annotate)
+        elif fmt == DOT: return self._iterDOT(annotate)
+        return None
+
+    def writeExport(
+            self, 
+            file: TextIO, 
+            fmt: ExportFormat = TEXT, 
+            annotate: AnnotateFunc | None = None
+        ) -> (bool):
+        """
+        iterExport()가 반환하는 줄들을 한 줄씩 file 객체에 쓴다. 
+        file에는 write() 메서드를 가지는 텍스트 파일 객체
+        (open()으로 연 파일, sys.stdout, io.StringIO 등)를 입력한다. 
+        fmt가 TEXT이고 빈 트리면 getTreeStructure()와 같이 "<빈 트리>"를 쓴다. 
+
+        반환값
+        -----
+        True: file에 쓴 경우. 
+        False: fmt가 iterExport()에서 지원하지 않는 형식이라 쓰지 않은 경우.
+
+        예)
+        >>> import io
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> buffer = io.StringIO()
+        >>> tree_obj.writeExport(buffer, OUTLINE)
+        True
+        >>> buffer.getvalue()
+        'a\\n  b'
+        """
+        lines = self.iterExport(fmt, annotate)
+        if lines is None: return False
+        if fmt == TEXT and self._getStructureRoot() is None:
+            file.write("<빈 트리>")
+            return True
+        first_line = next(lines, None)
+        if first_line is None: return True
+        file.write(first_line)
+        for line in lines:
+            file.write('\n')
+            file.write(line)
+        return True
+
+    def _iterStructure(
+            self, 
+            with_keys: bool = False
+        ) -> (Iterator[tuple[Depth, Node, object, bool, bool]]):
+        """
+        출력할 노드들을 (깊이, 노드, key, 형제 노드들 중 마지막 노드인지 여부, 
+        자식 노드가 있는지 여부) 형태로 깊이 우선(전위) 순서대로 반환한다. 
+        key는 annotate 함수에 넘길 값으로, with_keys가 False면 항상 None이다.
+        """
+        root = self._getStructureRoot()
+        if root is None: return
+        root_key = self._getStructureKey(None, root) if with_keys else None
+        root_children = self._getStructureChildren(root)
+        yield 0, root, root_key, True, bool(root_children)
+        # (정렬된 자식 노드 리스트, 다음에 출력할 자식 노드의 인덱스, 부모 노드의 key)
+        stack = [(root_children, 0, root_key)]
         while stack:
-            depth, node = stack.pop()
-            line = ""
-            for iter_depth in range(depth+1):
-                if iter_depth == depth:
-                    line += f"{node}"
-                elif iter_depth == (depth-1):
-                    try:
-                        branch_stack.remove((depth, node))
-                    except ValueError:
-                        if not branch_stack: line += sub_dir_line
-                        elif iter_depth in dict(branch_stack): line += sub_and_extension
-                    else:
-                        if (iter_depth+1) in dict(branch_stack): line += sub_and_extension
-                        else: line += sub_dir_line
-                    line += whitespace
-                else:
-                    if (iter_depth+1) in dict(branch_stack): line += extension + (whitespace*(one_tab_length-1))
-                    else: line += whitespace * one_tab_length
-
-            struct_str.append(line)
-            # 현재 노드의 자식 노드들을 스택에 삽입.
-            children = self.getChildren(node)
-            if children == [] or children is None: continue
-            children.sort(reverse=True)
-            for c in children: 
-                stack.append((depth+1, c))
-                branch_stack.append((depth+1, c))
-        return "\n".join(struct_str)
+            children, i, parent_key = stack[-1]
+            if i == len(children):
+                stack.pop()
+                continue
+            stack[-1] = (children, i+1, parent_key)
+            node = children[i]
+            key = self._getStructureKey(parent_key, node) if with_keys else None
+            grand_children = self._getStructureChildren(node)
+            yield len(stack), node, key, i == len(children) - 1, bool(grand_children)
+            if grand_children: stack.append((grand_children, 0, key))
+
+    def _iterOutline(self, annotate: AnnotateFunc | None) -> (Iterator[str]):
+        indent = "  "
+        for depth, node, key, _, _ in self._iterStructure(annotate is not None):
+            label = self._getStructureLabel(node)
+            if annotate is not None: label += _formatAnnotation(annotate(key))
+            yield indent * depth + label
+
+    def _iterJSON(self, annotate: AnnotateFunc | None) -> (Iterator[str]):
+        indent = "  "
+        # 아직 "]}"로 닫지 않은, 자식 노드를 가지는 노드들의 
+        # 형제 노드들 중 마지막 노드인지 여부. 인덱스가 곧 그 노드의 깊이이다.
+        open_nodes: list[bool] = []
+        # json.dumps()는 기본값이 아닌 인자를 주면 호출할 때마다 인코더를 새로 만든다.
+        encode = json.JSONEncoder(ensure_ascii=False, default=str).encode
+        is_empty = True
+        for depth, node, key, is_last, has_children in \
+                self._iterStructure(annotate is not None):
+            is_empty = False
+            while len(open_nodes) > depth:
+                yield indent * (len(open_nodes) - 1) + "]}" \
+                    + ("" if open_nodes.pop() else ",")
+            parts = [indent * depth, '{"name": ', encode(self._getStructureLabel(node))]
+            if annotate is not None:
+                for name, value in (annotate(key) or {}).items():
+                    parts.append(f', {encode(str(name))}: {encode(value)}')
+            if has_children:
+                parts.append(', "children": [')
+                open_nodes.append(is_last)
+            else:
+                parts.append("}" if is_last else "},")
+            yield ''.join(parts)
+        if is_empty: 
+            yield "null"
+            return
+        while open_nodes:
+            yield indent * (len(open_nodes) - 1) + "]}" \
+                + ("" if open_nodes.pop() else ",")
+
+    def _iterDOT(self, annotate: AnnotateFunc | None) -> (Iterator[str]):
+        indent = "    "
+        yield "digraph tree {"
+        # 깊이별로 가장 최근에 출력한 노드의 id. 
+        # 자식 노드의 부모 노드 id는 ids[자식 노드의 깊이 - 1]이다.
+        ids: list[str] = []
+        for number, (depth, node, key, _, _) in \
+                enumerate(self._iterStructure(annotate is not None)):
+            node_id = f"n{number}"
+            del ids[depth:]
+            ids.append(node_id)
+            label = _escapeDOT(self._getStructureLabel(node))
+            if annotate is not None:
+                info = annotate(key)
+                if info:
+                    label += "\\n" + _escapeDOT(
+                        ', '.join(f"{name}={value}" for name, value in info.items())
+                    )
+            yield f'{indent}{node_id} [label="{label}"];'
+            if depth > 0: yield f"{indent}{ids[depth-1]} -> {node_id};"
+        yield "}"
+
+    def _getStructureRoot(self) -> (Node | None): return self._root
+
+    def _getStructureChildren(self, node: Node) -> (list[Node]):
+        children = self.getChildren(node)
+        if not children: return []
+        return children
+
+    def _getStructureLabel(self, node: Node) -> (str): return f"{node}"
+
+    def _getStructureKey(self, parent_key: object, node: Node) -> (Node): return node
 
     def _reverseAdjList(self) -> (dict[Child, Parent] | EmptyDict):
         """
@@ -284,18 +709,7 @@ class Tree():
         인자로 대입한 노드를 트리 내에서 찾아 이를 반환한다. 
         찾고자 하는 노드가 트리 내에 없다면 None을 반환.
         """
-        if len(self._adj_list) == 0: return
-        if len(self._adj_list) == 1:
-            if self._adj_list[self._root] == []:
-                if self._root == target_node: return self._root
-                else: return
-        
-        self._r_adj_list = self._reverseAdjList()
-        for node in self._r_adj_list.keys():
-            while True:
-                if node == target_node: return node
-                try: node = self._r_adj_list[node]
-                except KeyError: break
+        if target_node in self._adj_list: return target_node
     
     def getChildren(self, parent: Node) -> (list[Child] | EmptyList | None):
         """
@@ -312,9 +726,7 @@ class Tree():
         주어진 노드가 트리 내에 존재하지 않거나 
         주어진 노드의 부모 노드가 존재하지 않을 경우, None을 반환. 
         """
-        self._r_adj_list = self._reverseAdjList()
-        try: return self._r_adj_list[child]
-        except KeyError: return
+        return self._r_adj_list.get(child)
 
     def append(
             self, 
@@ -357,6 +769,7 @@ class Tree():
                 self._root = parent
                 self._adj_list[parent] = [new_node]
                 self._adj_list[new_node] = []
+                if new_node != parent: self._r_adj_list[new_node] = parent
                 self._node_number += 2
                 return
         elif parent is None:
@@ -370,17 +783,18 @@ class Tree():
             if self.always_raise_error or raise_error: raise NodeNotFoundError() 
             else: return
 
+        # 자식 노드 리스트는 항상 오름차순으로 정렬된 상태를 유지하므로 
+        # 이분 탐색으로 찾은 위치에 새 노드를 삽입한다. 
         try: 
-            self._adj_list[parent].append(new_node)
+            bisect.insort(self._adj_list[parent], new_node)
         except KeyError: 
             self._adj_list[parent] = [new_node] 
-        else: 
-            self._adj_list[parent].sort()
         finally:
             # leaf 노드는 그 부모 노드의 자식 노드로 등록됨과 동시에, 
             # 인접리스트 딕셔너리에 {'leaf': []}와 같은 형태로 
             # value가 빈 리스트 형태로 삽입된다.
             self._adj_list[new_node] = []
+        self._r_adj_list[new_node] = parent
         self._node_number += 1
     
     def appendAll(self, structure: list[str], raise_error: bool = False):
@@ -520,9 +934,11 @@ class Tree():
         대입하여 처리한다.
 
         REMOVEALL: 삭제하고자 하는 노드와 함께 그 자식 노드들도 모두 삭제한다. 
+        root 노드를 삭제하려는 경우, 트리 내 모든 노드들이 삭제된다. 
 
         REMOVEONE: 삭제하고자 하는 노드만 삭제하고, 그 하위 트리들은 모두 
         삭제한 노드의 부모 노드에 종속시킨다. 
+        해당 모드에서는 root 노드를 삭제할 수 없다. 
 
         DONTREMOVE: 만약 삭제하고자 하는 노드가 자식 노드를 가지면 해당 노드와 
         그 자식 노드 모두 삭제하지 않는다. 오로지 자식 노드가 없는 leaf 노드일 
@@ -532,32 +948,49 @@ class Tree():
         -----
         True: 트리 내 해당 노드를 삭제한 경우. 
         False: 트리 내 해당 노드를 삭제하지 않은 경우.
+
+        예) root 노드 삭제.
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> tree_obj.append('c', 'b')
+        >>> tree_obj.remove('a', REMOVEONE)
+        False
+        >>> tree_obj.lenTree()
+        3
+        >>> tree_obj.remove('a', REMOVEALL)
+        True
+        >>> tree_obj.getRoot() is None, tree_obj.lenTree(), tree_obj.getAdjList()
+        (True, 0, {})
+        >>> print(tree_obj.getTreeStructure())
+        <빈 트리>
         """
         if self.search(target_node) is None: return False
         if mode == REMOVEALL:
-            parent_node = self.getParent(target_node)
-            queue = DynamicQueue()
-            queue.enqueue(target_node)
-            while not queue.isEmpty():
-                node = queue.dequeue()
-                children = self.getChildren(node)
-                if children is not None:
-                    for n in children: queue.enqueue(n)
-                p = self.getParent(node)
-                try: self._adj_list[p].remove(node)
-                except KeyError: pass
-                del self._adj_list[node]
+            if target_node == self._root:
+                self.clear()
+                return True
+            # 부모 노드에서 한 번만 떼어낸 뒤, 하위 노드들은 
+            # 인접리스트와 부모 노드 색인에서 바로 삭제한다. 
+            _removeSorted(self._adj_list[self._r_adj_list[target_node]], target_node)
+            queue = deque([target_node])
+            while queue:
+                node = queue.popleft()
+                queue.extend(self._adj_list.pop(node))
+                del self._r_adj_list[node]
                 self._node_number -= 1
-            if parent_node is not None: self._adj_list[parent_node].sort()
             return True
         elif mode == REMOVEONE:
-            parent_node = self.getParent(target_node)
-            children = self.getChildren(target_node)
-            if children != [] and children is not None:
-                self._adj_list[parent_node].extend(children)
-            self._adj_list[parent_node].remove(target_node)
-            self._adj_list[parent_node].sort()
-            del self._adj_list[target_node]
+            if target_node == self._root: return False
+            parent_node = self._r_adj_list.pop(target_node)
+            children = self._adj_list.pop(target_node)
+            for c in children: self._r_adj_list[c] = parent_node
+            siblings = self._adj_list[parent_node]
+            _removeSorted(siblings, target_node)
+            if children:
+                # 정렬된 두 리스트를 이어붙인 뒤의 정렬은 두 리스트를 병합하는 
+                # 선형 시간만 걸린다.
+                siblings.extend(children)
+                siblings.sort()
             self._node_number -= 1
             return True
         else:
@@ -568,10 +1001,9 @@ class Tree():
                     del self._adj_list[target_node]
                     self._root = None
                 else:
-                    parent = self.getParent(target_node)
-                    if parent is not None:
-                        self._adj_list[parent].remove(target_node)
-                        del self._adj_list[target_node]
+                    parent = self._r_adj_list.pop(target_node)
+                    _removeSorted(self._adj_list[parent], target_node)
+                    del self._adj_list[target_node]
                 self._node_number -= 1
                 return True
             return False
@@ -596,6 +1028,19 @@ class Tree():
         -----
         True: 성공적으로 노드를 바꿨을 경우. 
         False: 노드를 바꾸지 못한 경우. 
+
+        예) root 노드 바꾸기.
+        >>> tree_obj = Tree()
+        >>> tree_obj.append('b', 'a')
+        >>> tree_obj.append('c', 'b')
+        >>> tree_obj.replace('a', 'r')
+        True
+        >>> tree_obj.getRoot(), tree_obj.getParent('b')
+        ('r', 'r')
+        >>> print(tree_obj.getTreeStructure())
+        r
+        └ b
+          └ c
         """
         if self.search(old_node) is None: 
             if self.always_raise_error or raise_error: raise NodeNotFoundError()
@@ -604,13 +1049,15 @@ class Tree():
             if self.always_raise_error or raise_error: raise NodeAlreadyExistsError()
             else: return False
         # 새로 삽입할 노드의 자식 노드들을 기존 노드의 자식 노드들로 설정.
-        self._adj_list[new_node] = self._adj_list[old_node]
-        parent = self.getParent(old_node)
-        if parent:
-            self._adj_list[parent].remove(old_node)
-            self._adj_list[parent].append(new_node)
-            self._adj_list[parent].sort()
-        del self._adj_list[old_node]
+        self._adj_list[new_node] = self._adj_list.pop(old_node)
+        for c in self._adj_list[new_node]: self._r_adj_list[c] = new_node
+        parent = self._r_adj_list.pop(old_node, None)
+        if parent is None:
+            self._root = new_node
+        else:
+            self._r_adj_list[new_node] = parent
+            _removeSorted(self._adj_list[parent], old_node)
+            bisect.insort(self._adj_list[parent], new_node)
         return True
         
     def clear(self):
@@ -625,6 +1072,102 @@ class Tree():
         self.always_raise_error = False
 
 
+class _PathNode():
+    """
+    PathTree 내 노드 하나를 나타내는 클래스. 
+    노드 이름, 부모 노드, 자식 노드 이름별 자식 노드만을 가지며, 
+    절대경로는 따로 저장하지 않는다. 
+    노드 이름이 문자열이면 sys.intern()으로 같은 이름의 노드들이 
+    하나의 문자열 객체를 공유하도록 한다. 
+    자식 노드가 없으면 children은 None이다. 
+
+    자식 노드가 두 개 이상이면 자식 노드 이름들을 오름차순으로 정렬된 
+    리스트(order)로도 가지고 있어, 자식 노드를 추가, 삭제할 때 이분 탐색으로 
+    위치를 찾고, 정렬된 순서로 자식 노드들을 순회할 때 다시 정렬하지 않는다. 
+    자식 노드가 하나 이하면 order는 None이다. 
+
+    digest는 노드의 하위 노드들의 이름과 구조로 계산한 해시값(머클 트리)으로, 
+    PathTree.diff()에서 처음 필요할 때 계산하여 보관한다. 노드 자신의 이름은 
+    포함하지 않으므로, 이름만 바뀐 하위 트리는 같은 digest를 가진다. 
+    하위 노드가 추가, 삭제되면 해당 노드와 상위 노드들의 digest는 None으로 초기화된다. 
+    """
+    __slots__ = ('name', 'parent', 'children', 'order', 'digest')
+
+    def __init__(self, name: Node, parent: '_PathNode | None' = None):
+        if type(name) == str: name = sys.intern(name)
+        self.name = name
+        self.parent = parent
+        self.children: dict[Node, _PathNode] | None = None
+        self.order: list[Node] | None = None
+        self.digest: bytes | None = None
+
+    def __repr__(self):
+        return f"_PathNode({self.name!r})"
+
+    def addChild(self, child: '_PathNode') -> (None):
+        """같은 이름의 자식 노드가 없는 상태에서 child를 자식 노드로 연결."""
+        child.parent = self
+        self.resetDigest()
+        if self.children is None:
+            self.children = {child.name: child}
+            return
+        if self.order is None: 
+            self.order = sorted([*self.children, child.name])
+        else: 
+            bisect.insort(self.order, child.name)
+        self.children[child.name] = child
+
+    def removeChild(self, name: Node) -> ('_PathNode'):
+        """해당 이름의 자식 노드를 떼어내고 반환. 
+        떼어낸 노드의 하위 노드들은 그대로 연결되어 있다."""
+        child = self.children.pop(name)
+        child.parent = None
+        self.resetDigest()
+        if not self.children:
+            self.children = None
+        elif len(self.children) == 1:
+            self.order = None
+        else:
+            _removeSorted(self.order, name)
+        return child
+
+    def getChildNames(self) -> (list[Node]):
+        """자식 노드 이름들을 오름차순으로 반환. 
+        반환된 리스트는 노드 내부의 리스트일 수 있으므로 수정하면 안 된다."""
+        if self.children is None: return []
+        if self.order is None: return list(self.children)
+        return self.order
+
+    def resetDigest(self) -> (None):
+        """노드와 상위 노드들의 digest를 None으로 초기화. 
+        digest가 있는 노드의 하위 노드들은 모두 digest가 있으므로, 
+        이미 None인 노드를 만나면 그 상위 노드들도 None이다."""
+        node = self
+        while node is not None and node.digest is not None:
+            node.digest = None
+            node = node.parent
+
+    def getDigest(self) -> (bytes):
+        """노드의 digest를 반환. 없으면 digest가 없는 하위 노드들부터 계산한다."""
+        if self.digest is not None: return self.digest
+        # (노드, 자식 노드들의 digest가 모두 계산되었는지 여부)
+        stack = [(self, False)]
+        while stack:
+            node, ready = stack.pop()
+            children = node.children
+            if not ready and children is not None:
+                stack.append((node, True))
+                stack.extend((c, False) for c in children.values() if c.digest is None)
+                continue
+            h = hashlib.blake2b(digest_size=16)
+            if children is not None:
+                for name in node.getChildNames():
+                    h.update(repr(name).encode('utf-8'))
+                    h.update(children[name].digest)
+            node.digest = h.digest()
+        return self.digest
+
+
 class PathTree(Tree):
     def __init__(
             self, 
@@ -660,31 +1203,196 @@ class PathTree(Tree):
         예외 상황 발생 시 예외를 일으킨다. always_raise_error를 False로 지정해야 
         raise_error 인자값을 따른다. 
         """
-        super().__init__(default_root, delimiter, always_raise_error)
-        self._adj_list: dict[AbsPath, list[Child]] = {}
-        self._r_adj_list: dict[Child, list[AbsPath]] = {}
-        if default_root:
-            self._root = 'root'
-            self._adj_list[self._root] = []
-        else:
-            self._root = None
+        super().__init__(False, delimiter, always_raise_error)
+        # 노드들은 절대경로 문자열 대신 _PathNode 객체로 저장하며, 
+        # 절대경로는 필요할 때마다 부모 노드를 따라 올라가며 계산한다. 
+        self._root_node: _PathNode | None = None
+        # 노드 이름으로 해당 이름을 가지는 모든 노드들을 찾기 위한 색인. 
+        # search(), getAbsPath(), getParent() 등에서 노드 이름으로 검색 시 
+        # 트리 내 모든 노드를 탐색하지 않도록 함. 
+        # 트리에 노드가 추가, 삭제, 변경될 때마다 함께 갱신된다. 
+        # 이름이 같은 노드가 하나뿐이면 집합 대신 노드를 그대로 저장한다. 
+        self._name_index: dict[Node, _PathNode | set[_PathNode]] = {}
+        if default_root: self._setRoot('root')
+
+    @Tree.delimiter.setter
+    def delimiter(self, new_delimiter: str) -> (None):
+        # 절대경로는 저장하지 않고 필요할 때 계산하므로 구분 기호만 바꾸면 된다.
+        self._delimiter = new_delimiter
 
-    def _bfs(self):
-        if self._root is None: return []
-        all_nodes = []
-        queue = DynamicQueue()
-        # (depth, abspath)
-        queue.enqueue((0, self._root))
-        while not queue.isEmpty():
-            depth, path = queue.dequeue()
-            all_nodes.append((depth, path))
-            if path == self._root: children = self._adj_list[self._root].copy()
-            else: children = self.getChildren(path)
-            if children != [] and children is not None:
-                for c in children:
-                    c = self.combineNodesToAbsPath(path, c)
-                    queue.enqueue((depth+1, c))
-        return all_nodes
+    def getAdjList(self) -> (dict[AbsPath, list[Child]]):
+        """
+        현재 트리를 dict[절대경로, 자식 노드 리스트] 형태의 인접리스트로 
+        만들어 반환. 호출할 때마다 트리 내 노드들로부터 새로 만든다. 
+
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['a.b.c', 'a.d'])
+        >>> tree_obj.getAdjList()
+        {'a': ['b', 'd'], 'a.b': ['c'], 'a.b.c': [], 'a.d': []}
+        """
+        return {path: self._childNames(node) for path, node in self._iterNodes()}
+
+    def _setRoot(self, name: Node) -> (_PathNode):
+        """빈 트리에 root 노드를 만든다."""
+        self._root_node = _PathNode(name)
+        self._root = self._root_node.name
+        self._indexNode(self._root_node)
+        self._node_number += 1
+        return self._root_node
+
+    def _addChild(self, parent: _PathNode, name: Node) -> (_PathNode):
+        """parent 노드에 새 자식 노드를 연결하고 색인에 추가한다."""
+        node = _PathNode(name)
+        parent.addChild(node)
+        self._indexNode(node)
+        self._node_number += 1
+        return node
+
+    def _detach(self, node: _PathNode) -> (None):
+        """node를 부모 노드의 자식 노드들에서 떼어낸다. 
+        node의 하위 노드들은 그대로 node에 연결되어 있다."""
+        node.parent.removeChild(node.name)
+
+    def _indexNode(self, node: _PathNode) -> (None):
+        """노드 이름 색인에 노드를 추가."""
+        nodes = self._name_index.get(node.name)
+        if nodes is None: self._name_index[node.name] = node
+        elif type(nodes) == set: nodes.add(node)
+        else: self._name_index[node.name] = {nodes, node}
+
+    def _unindexNode(self, node: _PathNode) -> (None):
+        """노드 이름 색인에서 노드를 삭제."""
+        nodes = self._name_index.get(node.name)
+        if nodes is None: return
+        if type(nodes) == set:
+            nodes.discard(node)
+            if len(nodes) == 1: self._name_index[node.name] = nodes.pop()
+        elif nodes is node:
+            del self._name_index[node.name]
+
+    def _getNodesByName(self, name: Node) -> (list[_PathNode]):
+        """노드 이름 색인에서 해당 이름을 가지는 모든 노드들을 반환."""
+        nodes = self._name_index.get(name)
+        if nodes is None: return []
+        if type(nodes) == set: return list(nodes)
+        return [nodes]
+
+    def _dropSubtree(self, node: _PathNode) -> (None):
+        """이미 떼어낸 node와 그 하위 노드들을 모두 색인에서 삭제한다."""
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            self._unindexNode(n)
+            self._node_number -= 1
+            if n.children: stack.extend(n.children.values())
+
+    def _getNode(self, node_abs: AbsPath) -> (_PathNode | None):
+        """절대경로에 해당하는 노드를 반환. 없으면 None을 반환."""
+        if self._root_node is None: return None
+        names = node_abs.split(self._delimiter)
+        if names[0] != self._root: return None
+        node = self._root_node
+        for name in names[1:]:
+            if node.children is None: return None
+            node = node.children.get(name)
+            if node is None: return None
+        return node
+
+    def _getAbsPathOf(self, node: _PathNode) -> (AbsPath):
+        """노드에서 root 노드까지 거슬러 올라가며 절대경로를 만든다."""
+        names = []
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        names.reverse()
+        return self._delimiter.join(names)
+
+    def _childNames(self, node: _PathNode) -> (list[Child]):
+        """노드의 자식 노드 이름들을 오름차순으로 정렬한 리스트로 반환."""
+        return list(node.getChildNames())
+
+    def _searchNodes(
+            self, 
+            target_node: Node | AbsPath
+        ) -> (list[tuple[AbsPath, _PathNode]] | None):
+        """search()와 같은 방식으로 노드들을 찾아 
+        (절대경로, 노드)들을 절대경로 오름차순으로 반환. 
+        찾지 못하면 None을 반환."""
+        if self.isAbsPath(target_node):
+            node = self._getNode(target_node)
+            if node is None: return None
+            return [(target_node, node)]
+        nodes = self._getNodesByName(target_node)
+        if not nodes: return None
+        return sorted((self._getAbsPathOf(n), n) for n in nodes)
+
+    def _iterNodes(self) -> (Iterable[tuple[AbsPath, _PathNode]]):
+        """트리 내 모든 (절대경로, 노드)를 자식 노드 이름 오름차순의 깊이 우선으로 반환."""
+        if self._root_node is None: return
+        stack = [(self._root, self._root_node)]
+        while stack:
+            path, node = stack.pop()
+            yield path, node
+            if node.children is None: continue
+            for name in reversed(node.getChildNames()):
+                stack.append((path + self._delimiter + name, node.children[name]))
+
+    def _iterTraversal(
+            self,
+            start: Node | AbsPath | None,
+            max_depth: int | None,
+            prune: PruneFunc | None,
+            breadth_first: bool
+        ) -> (Iterator[tuple[Depth, AbsPath]]):
+        for depth, path, _ in self._iterTraversalNodes(
+                start, max_depth, prune, breadth_first):
+            yield depth, path
+
+    def _iterTraversalNodes(
+            self,
+            start: Node | AbsPath | None,
+            max_depth: int | None,
+            prune: PruneFunc | None,
+            breadth_first: bool
+        ) -> (Iterator[tuple[Depth, AbsPath, _PathNode]]):
+        """_iterTraversal()과 같되, (depth, 절대경로, 노드)를 반환."""
+        if start is None:
+            if self._root_node is None: return
+            starts = [(self._root, self._root_node)]
+        else:
+            starts = self._searchNodes(start)
+            if starts is None: return
+            # 다른 시작 노드의 하위 노드인 시작 노드는 제외.
+            start_nodes = {node for _, node in starts}
+            def is_nested(node: _PathNode) -> (bool):
+                node = node.parent
+                while node is not None:
+                    if node in start_nodes: return True
+                    node = node.parent
+                return False
+            starts = [(path, node) for path, node in starts if not is_nested(node)]
+
+        # (depth, abspath, node)
+        if breadth_first:
+            pending = deque((0, path, node) for path, node in starts)
+            pop = pending.popleft
+        else:
+            pending = deque((0, path, node) for path, node in reversed(starts))
+            pop = pending.pop
+        delimiter = self._delimiter
+        while pending:
+            depth, path, node = pop()
+            if prune is not None and prune(depth, path): continue
+            yield depth, path, node
+            if node.children is None: continue
+            if max_depth is not None and depth >= max_depth: continue
+            names = node.getChildNames()
+            if not breadth_first: names = reversed(names)
+            children = node.children
+            pending.extend(
+                (depth+1, path + delimiter + name, children[name]) for name in names
+            )
 
     def __repr__(self):
         all_nodes = self._bfs()
@@ -768,7 +1476,7 @@ class PathTree(Tree):
         AbsPath는 부모 노드의 절대경로를 의미한다. 
         """
         new_dict: dict[Child, list[Parent]] = {}
-        for p, c_list in self._adj_list.items():
+        for p, c_list in self.getAdjList().items():
             for c in c_list:
                 try: new_dict[c].append(p)
                 except KeyError: new_dict[c] = [p]
@@ -801,13 +1509,11 @@ class PathTree(Tree):
         ['a.c', 'a.c.c']
 
         만약 target_node가 트리 내에 존재하지 않으면 None을 반환.
+        절대경로들은 오름차순으로 정렬되어 반환된다. 
         """
-        results = []
-        for ab in self._adj_list.keys():
-            if target_node == self.splitAbsPath(ab)[1]:
-                results.append(ab)
-        if results == []: return None
-        return results
+        nodes = self._getNodesByName(target_node)
+        if not nodes: return None
+        return sorted(self._getAbsPathOf(n) for n in nodes)
 
     def getChildren(
             self, 
@@ -844,21 +1550,36 @@ class PathTree(Tree):
         >>> tree_obj.getChildren('a.b.c')
         ['d', 'e']
 
-        parent 매개변수로 대입받은 노드 절대경로는 존재하나 그 자식 노드가 없으면 
+        자식 노드들은 삽입 순서와 관계없이 항상 오름차순으로 반환되며,
+        replace()로 이름이 바뀌거나 remove()의 REMOVEONE 모드로 자식 노드들이
+        부모 노드에 합쳐진 경우에도 오름차순을 유지한다.
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.append('r')
+        >>> for node in ['d', 'b', 'e', 'a']:
+        ...     tree_obj.append(node, 'r')
+        >>> for node in ['z', 'c', 'a2']:
+        ...     tree_obj.append(node, 'r.e')
+        >>> tree_obj.getChildren('r')
+        {'r': ['a', 'b', 'd', 'e']}
+        >>> tree_obj.replace('r.b', 'f')
+        True
+        >>> tree_obj.getChildren('r')
+        {'r': ['a', 'd', 'e', 'f']}
+        >>> tree_obj.remove('r.e', REMOVEONE)
+        True
+        >>> tree_obj.getChildren('r')
+        {'r': ['a', 'a2', 'c', 'd', 'f', 'z']}
+
+        parent 매개변수로 대입받은 노드 절대경로는 존재하나 그 자식 노드가 없으면
         빈 리스트를 반환.
-        만약 parent 매개변수로 입력된 절대경로가 트리 내에 존재하지 않으면 
-        None을 반환. 
+        만약 parent 매개변수로 입력된 절대경로가 트리 내에 존재하지 않으면
+        None을 반환.
         """
-        if self.isAbsPath(parent):
-            try: return self._adj_list[parent].copy()
-            except KeyError: return None
-        else:
-            results = {}
-            t_node_abs = self.getAbsPath(parent)
-            if t_node_abs is None: return None
-            for ab, c_list in self._adj_list.items():
-                if ab in t_node_abs: results[ab] = c_list
-            return results
+        found = self._searchNodes(parent)
+        if found is None: return None
+        if self.isAbsPath(parent): return self._childNames(found[0][1])
+        return {ab: self._childNames(node) for ab, node in found}
 
     def getParent(self, child: Node | AbsPath) -> (list[AbsPath] | AbsPath | None):
         """
@@ -911,12 +1632,9 @@ class PathTree(Tree):
             if self.search(child): return self.dirname(child)
             else: return None
         else:
-            results = []
-            for key in self._adj_list.keys():
-                parent_abs, base_node = self.splitAbsPath(key)
-                if base_node == child: results.append(parent_abs)
-            if results == []: return None
-            return results
+            t_node_abs = self.getAbsPath(child)
+            if t_node_abs is None: return None
+            return [self.dirname(ab) for ab in t_node_abs]
 
     def search(self, target_node: Node | AbsPath) -> (AbsPath | list[AbsPath] | None):
         """
@@ -940,8 +1658,35 @@ class PathTree(Tree):
         >>> tree_obj.appendAll(data)
         >>> tree_obj.search('a')
         ['a', 'a.a']
-        
-        트리 내에 존재하지 않는 노드라면 None을 반환. 
+
+        예3) 같은 이름의 노드들은 삽입 순서와 관계없이 절대경로 오름차순으로 반환되며,
+        remove(), replace() 이후에도 그 결과가 반영된다.
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['r.z.x', 'r.b.x', 'r.a.x.x'])
+        >>> tree_obj.search('x')
+        ['r.a.x', 'r.a.x.x', 'r.b.x', 'r.z.x']
+        >>> tree_obj.getParent('x')
+        ['r.a', 'r.a.x', 'r.b', 'r.z']
+        >>> tree_obj.getChildren('x')
+        {'r.a.x': ['x'], 'r.a.x.x': [], 'r.b.x': [], 'r.z.x': []}
+        >>> tree_obj.remove('r.b.x')
+        True
+        >>> tree_obj.search('x')
+        ['r.a.x', 'r.a.x.x', 'r.z.x']
+        >>> tree_obj.replace('r.z.x', 'y')
+        True
+        >>> tree_obj.getAbsPath('x')
+        ['r.a.x', 'r.a.x.x']
+        >>> tree_obj.search('y')
+        ['r.z.y']
+        >>> tree_obj.replace('r.a.x', 'z')
+        True
+        >>> tree_obj.search('x')
+        ['r.a.z.x']
+        >>> tree_obj.search('z')
+        ['r.a.z', 'r.z']
+
+        트리 내에 존재하지 않는 노드라면 None을 반환.
 
         만약 절대경로로 입력 시, 트리 내에 존재하는 절대경로라면 그 절대경로를 그대로 반환. 
         예) 
@@ -953,14 +1698,10 @@ class PathTree(Tree):
         트리 내에 존재하지 않는 노드라면 None을 반환. 
         """
         if self.isAbsPath(target_node):
-            if target_node in self._adj_list: return target_node
+            if self._getNode(target_node) is not None: return target_node
             else: return None
         else:
-            results = []
-            for key in self._adj_list.keys():
-                if self.splitAbsPath(key)[1] == target_node: results.append(key)
-            if results == []: return None
-            return sorted(results)
+            return self.getAbsPath(target_node)
         
     def append(
             self,
@@ -1031,36 +1772,23 @@ class PathTree(Tree):
         """
         if self._root is None:
             if parent is None or self.isAbsPath(parent):
-                self._root = new_node
-                self._adj_list[new_node] = []
-                self._node_number += 1
-                return
+                self._setRoot(new_node)
             else:
-                self._root = parent
-                self._adj_list[parent] = [new_node]
-                new_node_abs = self.combineNodesToAbsPath(parent, new_node)
-                self._adj_list[new_node_abs] = []
-                self._node_number += 2
-                return
+                self._addChild(self._setRoot(parent), new_node)
+            return
         elif parent is None:
             if self.always_raise_error or raise_error: raise ParentNoneError()
             else: return
         
-        parents = self.search(parent)
+        parents = self._searchNodes(parent)
         if parents is None:
             if self.always_raise_error or raise_error: raise NodeNotFoundError()
             else: return
-        if type(parents) == str: parents = [parents]
-        for p in parents:
-            new_node_abs = self.combineNodesToAbsPath(p, new_node)
-            if self.search(new_node_abs):
+        for _, p in parents:
+            if p.children is not None and new_node in p.children:
                 if self.always_raise_error or raise_error: raise PathAlreadyExistsError()
                 else: return
-            try: self._adj_list[p].append(new_node)
-            except KeyError: self._adj_list[p] = [new_node]
-            else: self._adj_list[p].sort()
-            self._adj_list[new_node_abs] = []
-            self._node_number += 1
+            self._addChild(p, new_node)
 
     def appendAbs(self, new_path: AbsPath, raise_error: bool = False) -> (None):
         """
@@ -1089,26 +1817,24 @@ class PathTree(Tree):
             if self.always_raise_error or raise_error: raise PathAlreadyExistsError()
             else: return
         path_split = new_path.split(self._delimiter)
-        for i in range(len(path_split)):
-            if i == 0:
-                if self._root is None:
-                    self._root = path_split[i]
-                    self._adj_list[path_split[i]] = []
-                    self._node_number += 1
-                elif self._root != path_split[i]:
-                    if self.always_raise_error or raise_error: raise RootNotUniqueError()
-                    else: return
-                continue
-            path = self._delimiter.join(path_split[:i+1])
-            if self.search(path): continue
-            p_path, cur_node = self.splitAbsPath(path)
-            try: self._adj_list[p_path].append(cur_node)
-            except KeyError: self._adj_list[p_path] = [cur_node]
-            else: self._adj_list[p_path].sort()
-            if path not in self._adj_list: self._adj_list[path] = []
-            self._node_number += 1
-
-    def appendAll(self, structure: list[str], raise_error: bool = False) -> (None):
+        if self._root is None:
+            node = self._setRoot(path_split[0])
+        elif self._root != path_split[0]:
+            if self.always_raise_error or raise_error: raise RootNotUniqueError()
+            else: return
+        else:
+            node = self._root_node
+        for name in path_split[1:]:
+            child = None
+            if node.children is not None: child = node.children.get(name)
+            if child is None: child = self._addChild(node, name)
+            node = child
+
+    def appendAll(
+            self, 
+            structure: Iterable[AbsPath], 
+            raise_error: bool = False
+        ) -> (None):
         """
         트리 구조를 나타낸 리스트를 입력하면 해당 구조 내 모든 노드들을 
         트리 구조에 맞게 트리에 추가함. 
@@ -1140,7 +1866,27 @@ class PathTree(Tree):
 
         트리가 존재하고, 특정 leaf 노드들에 새 노드들을 삽입하는 경우에도 
         새 노드의 절대경로로 입력해야함. 
-        
+
+        structure에는 리스트뿐만 아니라 제너레이터 등 절대경로 문자열들을 
+        반환하는 어떠한 iterable이든 입력할 수 있다. 
+        입력된 절대경로들은 한 번만 정렬한 뒤, 바로 이전 절대경로와 
+        겹치는 상위 경로는 다시 탐색하지 않고 이어서 삽입한다.
+        순서가 뒤섞이거나 중복된 절대경로, 이미 트리에 존재하는 상위 경로를
+        가지는 절대경로도 입력할 수 있다.
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(
+        ...     p for p in ['a.c.e', 'a.b', 'a.c.d', 'a.b', 'a.c'])
+        >>> tree_obj.getAllLeafAbs()
+        ['a.b', 'a.c.d', 'a.c.e']
+        >>> tree_obj.lenTree()
+        5
+        >>> tree_obj.appendAll(['a.c.d.f', 'a.b.g', 'a.c'])
+        >>> tree_obj.getAllLeafAbs()
+        ['a.b.g', 'a.c.d.f', 'a.c.e']
+        >>> tree_obj.lenTree()
+        7
+
         매개변수
         ------
         raise_error: 발생할 수 있는 각종 에러에 대해, raise_error 인자를 True로 설정 시,
@@ -1151,39 +1897,55 @@ class PathTree(Tree):
         -----
         RootNotUniqueError(): structure 인자 속 정보에 root 노드가 두 개 이상 존재할 경우. 
         """
-        # 빈 트리에 노드들을 삽입하는 경우와 
-        # 이미 구성되어있는 트리에 노드들을 추가하는 경우로 나눠서 코드 작성. 
+        structure = sorted(structure)
+        if not structure: return
+        split_paths = [path.split(self._delimiter) for path in structure]
 
-        def check_root() -> (Node | None):
-            """
-            root 노드가 단 한 개만 있는지 테스트하는 함수. 
-            둘 이상 존재하면 None, 하나만 존재하면 그 root 노드를 반환. 
-            (root 노드가 둘 이상 존재하면, 만약 트리에 이미 노드들이 존재하는 경우, 
-            root 노드가 아니라 그저 기존 트리에 추가할 노드들이다.)
-            """
-            root = structure[0].split(self._delimiter)[0]
-            for i in range(1, len(structure)):
-                r = structure[i].split(self._delimiter)[0]
-                if root != r: return None
-            return root
-        
-        def insert_nodes(root: Node | None):
-            if root and self._root is None:
-                self.append(root, raise_error=raise_error)
-            for data in structure:
-                nodes = data.split(self._delimiter)
-                for i in range(1, len(nodes)):
-                    parent_abs = self._delimiter.join(nodes[:i])
-                    current_node = nodes[i]
-                    current_node_abs = self.combineNodesToAbsPath(parent_abs, current_node)
-                    if self.search(current_node_abs) is None:
-                        self.append(current_node, parent_abs, raise_error)
-
-        root = check_root()
-        if root is None and self._root is None:
-            if self.always_raise_error or raise_error: raise RootNotUniqueError()
-            else: return
-        insert_nodes(root)
+        if self._root is None:
+            # root 노드가 단 한 개만 있는지 확인.
+            root = split_paths[0][0]
+            for nodes in split_paths:
+                if nodes[0] != root:
+                    if self.always_raise_error or raise_error: 
+                        raise RootNotUniqueError()
+                    else: return
+            self._setRoot(root)
+
+        def insert_one(nodes: list[Node]):
+            """root 노드 이름으로 시작하지 않는 절대경로를 삽입. 
+            append() 메서드의 규칙을 그대로 따른다."""
+            for i in range(1, len(nodes)):
+                parent_abs = self._delimiter.join(nodes[:i])
+                current_node_abs = self.combineNodesToAbsPath(
+                    parent_abs, nodes[i]
+                )
+                if self.search(current_node_abs) is None:
+                    self.append(nodes[i], parent_abs, raise_error)
+
+        # 바로 이전에 삽입한 절대경로의 각 깊이별 노드 이름과 노드. 
+        prev_names: list[Node] = []
+        prev_chain: list[_PathNode] = []
+        for nodes in split_paths:
+            if nodes[0] != self._root:
+                insert_one(nodes)
+                prev_names, prev_chain = [], []
+                continue
+
+            # 이전 절대경로와 겹치는 상위 경로는 건너뛴다.
+            common = 1
+            limit = min(len(nodes), len(prev_names))
+            while common < limit and nodes[common] == prev_names[common]:
+                common += 1
+            chain = prev_chain[:common] if prev_chain else [self._root_node]
+
+            for i in range(common, len(nodes)):
+                parent = chain[i-1]
+                child = None
+                if parent.children is not None: 
+                    child = parent.children.get(nodes[i])
+                if child is None: child = self._addChild(parent, nodes[i])
+                chain.append(child)
+            prev_names, prev_chain = nodes, chain
 
     def remove(
             self,
@@ -1226,8 +1988,20 @@ class PathTree(Tree):
             └ d
               ├ f
               └ h
-        
-        해당 모드에서는 root 노드를 삭제할 수 없다. 
+
+        이름이 겹치는 노드들의 하위 노드들도 같은 방식으로 모두 합쳐진다.
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['r.a.c.d.e', 'r.c.d.f'])
+        >>> tree_obj.remove('r.a')
+        True
+        >>> print(tree_obj.getTreeStructure())
+        r
+        └ c
+          └ d
+            ├ e
+            └ f
+
+        해당 모드에서는 root 노드를 삭제할 수 없다.
 
         DONTREMOVE: 만약 삭제하고자 하는 노드가 자식 노드를 가지면 해당 노드와 
         그 자식 노드 모두 삭제하지 않는다. 오로지 자식 노드가 없는 leaf 노드일 
@@ -1245,107 +2019,63 @@ class PathTree(Tree):
         True: 트리 내 해당 노드를 삭제한 경우. 
         False: 트리 내 해당 노드를 삭제하지 않은 경우.
         """
-        if self.search(target_node) is None: return False
+        t_nodes = self._searchNodes(target_node)
+        if t_nodes is None: return False
         if mode == REMOVEALL:
-            queue = DynamicQueue()  # 노드의 절대경로를 원소로 함. 
-            if not self.isAbsPath(target_node):
-                if target_node == self._root:
-                    self.clear()
-                    return True
-                first_nodes = self.search(target_node)
-                for node in first_nodes: queue.enqueue(node)
-            else:
-                queue.enqueue(target_node)
-            while not queue.isEmpty():
-                node = queue.dequeue()
-                children = self.getChildren(node)
-                if children is not None:
-                    for n in children:
-                        queue.enqueue(self.combineNodesToAbsPath(node, n))
-                p = self.getParent(node)
-                try: self._adj_list[p].remove(self.basename(node))
-                except KeyError: pass
-                try: del self._adj_list[node]
-                except KeyError: pass
-                else: self._node_number -= 1
+            if target_node == self._root:
+                self.clear()
+                return True
+            for _, node in t_nodes:
+                # 같은 이름의 상위 노드와 함께 이미 삭제된 노드는 건너뛴다.
+                top = node
+                while top.parent is not None: top = top.parent
+                if top is not self._root_node: continue
+                self._detach(node)
+                self._dropSubtree(node)
             return True
         elif mode == REMOVEONE:
             if target_node == self._root: return False
-            if self.isAbsPath(target_node):
-                t_nodes_abs = [target_node]
-            else:
-                t_nodes_abs: list[AbsPath] = self.search(target_node)
-                # 예를 들어 삭제하고자 하는 노드로 'g'가 입력되었고, 
-                # search('g') 결과 ['a.g', 'a.g.g']로 나온 경우, 
-                # 상대적으로 더 하위 계층에 존재하는 노드('a.g.g')부터 삭제하도록 
-                # 하기 위해 search() 결과를 절대경로 문자열의 길이가 가장 긴 순서대로 정렬. 
-                temp_list: list[tuple[int, AbsPath]] = []
-                for v in t_nodes_abs: heapq.heappush(temp_list, (-len(v), v))
-                t_nodes_abs.clear()
-                while temp_list:
-                    t_nodes_abs.append(heapq.heappop(temp_list)[1])
-            for t_node in t_nodes_abs:
-                t_parent_abs: AbsPath = self.getParent(t_node)
-                if t_parent_abs == self._root:
-                    t_parent_children = self._adj_list[self._root].copy()
-                else:
-                    t_parent_children: list[Child] = self.getChildren(t_parent_abs)
-                t_parent_children.remove(self.basename(t_node))
-                t_children = self.getChildren(t_node)
-                self._adj_list[t_parent_abs].remove(self.basename(t_node))
-                self._adj_list[t_parent_abs].extend(self._adj_list[t_node])
-                before_len = len(self._adj_list[t_parent_abs])
-                self._adj_list[t_parent_abs] = list(set(self._adj_list[t_parent_abs]))
-                after_len = len(self._adj_list[t_parent_abs])
-                self._node_number -= before_len - after_len
-                self._adj_list[t_parent_abs].sort()
-                del self._adj_list[t_node]
+            # 예를 들어 삭제하고자 하는 노드로 'g'가 입력되었고, 
+            # search('g') 결과 ['a.g', 'a.g.g']로 나온 경우, 
+            # 상대적으로 더 하위 계층에 존재하는 노드('a.g.g')부터 삭제하도록 
+            # 하기 위해 절대경로 문자열의 길이가 가장 긴 순서대로 정렬. 
+            t_nodes = _sortLengthOrder(
+                t_nodes, ascending=False, key=lambda item: item[0]
+            )
+            for _, t_node in t_nodes:
+                t_parent = t_node.parent
+                self._detach(t_node)
+                self._unindexNode(t_node)
                 self._node_number -= 1
+                if t_node.children is None: continue
                 # 삭제당한 노드의 자식 노드들이 삭제된 노드의 부모 노드에 편입될 때, 
                 # 기존에 부모 노드에 같은 이름의 노드가 있을 경우, 그 노드로 해당 자식 노드의 
-                # 자식 노드들을 편입시킨다. 자세한 예시는 이 메서드의 독스트링의 예시 참조. 
-                for tc in t_children:
-                    if tc in t_parent_children:
-                        tpc_abs = self.combineNodesToAbsPath(t_parent_abs, tc)
-                        tc_abs = self.combineNodesToAbsPath(t_node, tc)
-                        self._adj_list[tpc_abs].extend(self._adj_list[tc_abs])
-                        # 자식 노드들의 합병 이후 이름이 중복되는 노드 삭제.
-                        before_len = len(self._adj_list[tpc_abs])
-                        self._adj_list[tpc_abs] = list(set(self._adj_list[tpc_abs]))
-                        after_len = len(self._adj_list[tpc_abs])
-                        self._node_number -= before_len - after_len
-                        self._adj_list[tpc_abs].sort()
-                        del self._adj_list[tc_abs]
-                # adj_list 변수의 key에 삭제한 노드가 경로 내에 포함되어 있는 경우, 
-                # 해당 경로에서 해당 노드만 삭제한다. 
-                t_node_split = t_node.split(self._delimiter)
-                t_node_split_len = len(t_node_split)
-                adjl = self._adj_list.copy()
-                for key in adjl.keys():
-                    key_split = key.split(self._delimiter)
-                    if key_split[:t_node_split_len] == t_node_split:
-                        temp_children = self._adj_list[key].copy()
-                        del key_split[t_node_split_len-1]
-                        new_key = self._delimiter.join(key_split)
-                        self._adj_list[new_key] = temp_children
-                        del self._adj_list[key]
+                # 자식 노드들을 편입시킨다. 편입되는 자식 노드들도 같은 방식으로 합쳐진다. 
+                # 자세한 예시는 이 메서드의 독스트링의 예시 참조. 
+                stack = [(t_parent, c) for c in t_node.children.values()]
+                while stack:
+                    parent, child = stack.pop()
+                    same = None
+                    if parent.children is not None: 
+                        same = parent.children.get(child.name)
+                    if same is None:
+                        parent.addChild(child)
+                        continue
+                    if child.children is not None:
+                        stack.extend((same, c) for c in child.children.values())
+                    self._unindexNode(child)
+                    self._node_number -= 1
             return True
         else:
             # DONTREMOVE
-            if self.isAbsPath(target_node):
-                t_nodes_abs = [target_node]
-            else:
-                t_nodes_abs: list[AbsPath] = self.search(target_node)
-            if self._root in t_nodes_abs and self._node_number == 1:
+            if self._root_node in [n for _, n in t_nodes] and self._node_number == 1:
                 self.clear()
                 return True
             is_removed = False
-            for t_node in t_nodes_abs:
-                if self.getChildren(t_node) == []:
-                    t_parent = self.getParent(t_node)
-                    self._adj_list[t_parent].remove(self.basename(t_node))
-                    self._adj_list[t_parent].sort()
-                    del self._adj_list[t_node]
+            for _, t_node in t_nodes:
+                if t_node.children is None and t_node.parent is not None:
+                    self._detach(t_node)
+                    self._unindexNode(t_node)
                     self._node_number -= 1
                     is_removed = True
             return is_removed
@@ -1381,83 +2111,62 @@ class PathTree(Tree):
         True: 성공적으로 노드를 바꿨을 경우. 
         False: 노드를 바꾸지 못한 경우. 
         """
-        old_nodes_abs = self.search(old_node)
-        if old_nodes_abs is None:
+        old_nodes = self._searchNodes(old_node)
+        if old_nodes is None:
             if self.always_raise_error or raise_error: raise NodeNotFoundError()
             else: return False
-        if type(old_nodes_abs) == str: old_nodes_abs = [old_nodes_abs]
-        for o_node in old_nodes_abs:
-            o_node_dir = self.dirname(o_node)
-            new_node_abs = self.combineNodesToAbsPath(o_node_dir, new_node)
-            if self.search(new_node_abs):
+        for _, o_node in old_nodes:
+            o_parent = o_node.parent
+            if o_parent is None: 
+                siblings = {self._root: o_node}
+            else:
+                siblings = o_parent.children
+            if new_node in siblings:
                 if self.always_raise_error or raise_error: raise PathAlreadyExistsError()
                 else: return False
-            self._adj_list[new_node_abs] = self._adj_list[o_node]
-            o_parent = self.getParent(o_node)
-            if o_parent == ['']: o_parent = self._root
-            self._adj_list[o_parent].remove(self.basename(o_node))
-            self._adj_list[o_parent].append(new_node)
-            self._adj_list[o_parent].sort()
-            del self._adj_list[o_node]
+            # 하위 노드들은 부모 노드를 통해 절대경로를 계산하므로 
+            # 바꾸고자 하는 노드의 이름만 바꾸면 된다.
+            self._unindexNode(o_node)
+            if o_parent is not None: o_parent.removeChild(o_node.name)
+            o_node.name = _PathNode(new_node).name
+            if o_parent is not None: o_parent.addChild(o_node)
+            else: self._root = o_node.name
+            self._indexNode(o_node)
         return True
 
-    def getTreeStructure(self) -> (str):
-        if self._root is None: return "<빈 트리>"
+    def clear(self):
+        """
+        트리를 모두 비우고, 트리 설정도 모두 초기화된다. 
+        always_raise_error 속성도 False로 초기화된다. 
+        """
+        super().clear()
+        self._root_node = None
+        self._name_index.clear()
 
-        extension = "│"
-        sub_dir_line = "└"
-        sub_and_extension = "├"
-        whitespace = " "
-        one_tab_length = 2
+    def _getStructureRoot(self) -> (_PathNode | None): return self._root_node
 
-        struct_str = []
-        stack = [(0, self._root)]
-        
-        # depth가 같은 두 노드 a, b 노드가 있다고 가정하고, 두 노드에
-        # 하위 트리가 존재할 경우, a 노드의 하위 트리가 구성될 동안 각 라인 
-        # 앞에는 b 노드가 a 노드와 이어지는 것을 표현하기 위한 문자 "│"을 
-        # 계속 하위 노드들의 맨 앞에 출력해야한다. 이를 위해선 a 노드의 하위 
-        # 트리들이 한 줄씩 구성될 떄동안 b 노드가 아직 남아있음을 기록해야 한다.
-        # 연결선 "│"으로 같은 깊이의 노드들을 연결하기 위해 시작 노드와 끝 노드
-        # 를 기록하는 변수. 
-        branch_stack = []
+    def _getStructureChildren(self, node: _PathNode) -> (list[_PathNode]):
+        return [node.children[name] for name in node.getChildNames()]
 
-        while stack:
-            depth, path = stack.pop()
-            node = self.basename(path)
-            line = ""
-            for iter_depth in range(depth+1):
-                if iter_depth == depth:
-                    line += f"{node}"
-                elif iter_depth == (depth-1):
-                    try:
-                        branch_stack.remove((depth, path))
-                    except ValueError:
-                        if not branch_stack: line += sub_dir_line
-                        elif iter_depth in dict(branch_stack): line += sub_and_extension
-                    else:
-                        if (iter_depth+1) in dict(branch_stack): line += sub_and_extension
-                        else: line += sub_dir_line
-                    line += whitespace
-                else:
-                    if (iter_depth+1) in dict(branch_stack): line += extension + (whitespace*(one_tab_length-1))
-                    else: line += whitespace * one_tab_length
-            
-            struct_str.append(line)
-            if path == self._root: children = self._adj_list[self._root]
-            else: children = self.getChildren(path)
-            if children == [] or children is None: continue
-            children.sort(reverse=True)
-            for c in children:
-                c = self.combineNodesToAbsPath(path, c)
-                stack.append((depth+1, c))
-                branch_stack.append((depth+1, c))
-        return '\n'.join(struct_str)
+    def _getStructureLabel(self, node: _PathNode) -> (str):
+        # '/home/user'처럼 구분 기호로 시작하는 절대경로들의 root 노드 이름은 
+        # 빈 문자열이므로 구분 기호로 나타낸다.
+        if node.parent is None and node.name == '': return self._delimiter
+        return f"{node.name}"
+
+    def _getStructureKey(
+            self, 
+            parent_key: AbsPath | None, 
+            node: _PathNode
+        ) -> (AbsPath):
+        if parent_key is None: return node.name
+        return f"{parent_key}{self._delimiter}{node.name}"
 
     def getAllLeafAbs(
             self, 
             how_to_sort: SortMode = ALPHABET, 
-            ascending: bool = True
+            ascending: bool = True,
+            k: int | None = None
         ) -> (list[AbsPath]):
         """
         트리 내 모든 leaf 노드들의 절대경로들을 리스트로 모아 반환한다. 
@@ -1468,29 +2177,545 @@ class PathTree(Tree):
         how_to_sort: leaf 노드들의 절대경로들을 리스트에 저장하고 반환할 때 
         리스트의 정렬방식. 
             1. ALPHABET: 알파벳, 가나다, 숫자 오름 또는 내림차순으로 정렬.
-            2. LENGTH: 절대경로의 길이가 길거나 짧은 순대로 정렬.
+            2. LENGTH: 절대경로의 길이가 길거나 짧은 순대로 정렬. 
+            길이가 같은 절대경로들은 ascending과 관계 없이 알파벳 오름차순으로 정렬.
         ascending: True 시 오름차순, False 시 내림차순으로 정렬.
+        k: 정렬 결과 중 앞에서부터 k개만 필요할 때 입력. 
+        전체를 정렬하지 않고 heapq.nsmallest(), heapq.nlargest()로 k개만 골라낸다. 
+        None 시 모든 leaf 노드들의 절대경로들을 반환.
+
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['r.bb.c', 'r.a', 'r.bb.a', 'r.d.e.f'])
+        >>> tree_obj.getAllLeafAbs(LENGTH)
+        ['r.a', 'r.bb.a', 'r.bb.c', 'r.d.e.f']
+        >>> tree_obj.getAllLeafAbs(LENGTH, ascending=False, k=2)
+        ['r.d.e.f', 'r.bb.a']
         """
         if self._root is None: return []
-        leaf_nodes = []
-        for k, v_list in self._adj_list.items():
-            if v_list == []: leaf_nodes.append(k)
+        leaf_nodes = [
+            path for path, node in self._iterNodes() if node.children is None
+        ]
         if how_to_sort == ALPHABET:
+            if k is not None:
+                if ascending: return heapq.nsmallest(k, leaf_nodes)
+                return heapq.nlargest(k, leaf_nodes)
             if ascending: leaf_nodes.sort()
             else: leaf_nodes.sort(reverse=True)
         elif how_to_sort == LENGTH:
-            temp_list = []
-            if ascending:
-                for element in leaf_nodes:
-                    heapq.heappush(temp_list, (len(element), element))
-            else:
-                for element in leaf_nodes:
-                    heapq.heappush(temp_list, (-len(element), element))
-            leaf_nodes.clear()
-            while temp_list:
-                leaf_nodes.append(heapq.heappop(temp_list)[1])
+            return _sortLengthOrder(leaf_nodes, ascending, k)
         return leaf_nodes
 
+    def iterLeafAbs(
+            self,
+            start: Node | AbsPath | None = None,
+            max_depth: int | None = None
+        ) -> (Iterator[AbsPath]):
+        """
+        start 노드의 하위 트리 내 leaf 노드들의 절대경로를 하나씩 반환하는 제너레이터. 
+        start 노드의 하위 트리만 탐색하며, 깊이 우선 탐색(iterDFS()) 순서로 반환한다. 
+
+        매개변수
+        -------
+        start: 탐색을 시작할 노드의 절대경로 또는 노드 이름. 
+        None이면 root 노드부터 탐색한다. 
+        노드 이름으로 입력 시 같은 이름을 가지는 모든 노드들의 하위 트리를 탐색한다. 
+        max_depth: start 노드로부터 해당 depth 이내의 leaf 노드들만 반환한다. 
+        해당 depth보다 깊은 노드들은 탐색하지 않는다. None이면 깊이 제한이 없다. 
+
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['log.2024-01.a.log', 'log.2024-01.b', 'log.2024-02.c.log'])
+        >>> list(tree_obj.iterLeafAbs('log.2024-01'))
+        ['log.2024-01.a.log', 'log.2024-01.b']
+        >>> list(tree_obj.iterLeafAbs(max_depth=2))
+        ['log.2024-01.b']
+        """
+        for depth, path, node in self._iterTraversalNodes(start, max_depth, None, False):
+            if node.children is None: yield path
+
+    def iterGlob(self, pattern: str, leaf_only: bool = False) -> (Iterator[AbsPath]):
+        """
+        절대경로가 glob 패턴과 일치하는 노드들의 절대경로를 하나씩 반환하는 제너레이터. 
+        패턴은 트리의 구분 기호로 계층을 나누며, root 노드부터 계층별로 비교한다. 
+        패턴의 각 계층에는 fnmatch 모듈의 와일드카드('*', '?', '[seq]')를 쓸 수 있고, 
+        계층 전체가 GLOBSTAR('**')이면 0개 이상의 계층과 일치한다. 
+        패턴과 일치할 수 있는 노드들만 탐색하며, 와일드카드가 없는 계층은 
+        자식 노드를 이름으로 바로 찾는다. 
+        깊이 우선 탐색(iterDFS()) 순서로 반환한다. 
+
+        매개변수
+        -------
+        pattern: glob 패턴. 
+        leaf_only: True 시 패턴과 일치하는 노드들 중 leaf 노드들만 반환한다. 
+
+        예)
+        >>> tree_obj = PathTree(delimiter='/')
+        >>> tree_obj.appendAll(['log/2024-01/error.log', 'log/2024-01/debug.log', 
+        ...     'log/2024-02/sub/error.log'])
+        >>> list(tree_obj.iterGlob('log/*/error.log'))
+        ['log/2024-01/error.log']
+        >>> list(tree_obj.iterGlob('**/error.log'))
+        ['log/2024-01/error.log', 'log/2024-02/sub/error.log']
+        >>> list(tree_obj.iterGlob('log/2024-0[2-9]/**', leaf_only=True))
+        ['log/2024-02/sub/error.log']
+        """
+        if self._root_node is None: return
+        # 계층별 비교 함수. GLOBSTAR는 None, 와일드카드가 없는 계층은 문자열 그대로.
+        segments: list[str | Callable | None] = []
+        for segment in pattern.split(self._delimiter):
+            if segment == GLOBSTAR:
+                if segments and segments[-1] is None: continue
+                segments.append(None)
+            elif not any(char in segment for char in '*?['):
+                segments.append(segment)
+            else:
+                segments.append(re.compile(fnmatch.translate(segment)).match)
+        end = len(segments)
+
+        def close(states: set[int]) -> (frozenset[int]):
+            """GLOBSTAR 계층이 0개의 계층과 일치하는 경우를 상태에 추가."""
+            for i in list(states):
+                while i < end and segments[i] is None:
+                    i += 1
+                    states.add(i)
+            return frozenset(states)
+
+        def step(states: frozenset[int], name: Node) -> (frozenset[int]):
+            """states 상태의 부모 노드 다음 계층의 노드 이름 name을 비교한 후의 상태."""
+            next_states = set()
+            for i in states:
+                if i == end: continue
+                segment = segments[i]
+                if segment is None: next_states.add(i)
+                elif type(segment) == str:
+                    if name == segment: next_states.add(i+1)
+                elif type(name) == str and segment(name): next_states.add(i+1)
+            return close(next_states)
+
+        def iter_children(
+                node: _PathNode, 
+                states: frozenset[int]
+            ) -> (Iterable[Node]):
+            """states 상태에서 비교할 자식 노드 이름들을 오름차순으로 반환."""
+            names = set()
+            for i in states:
+                if i == end: continue
+                if type(segments[i]) != str: return node.getChildNames()
+                names.add(segments[i])
+            return sorted(name for name in names if name in node.children)
+
+        root_states = step(close({0}), self._root_node.name)
+        if not root_states: return
+        delimiter = self._delimiter
+        stack = [(self._root, self._root_node, root_states)]
+        while stack:
+            path, node, states = stack.pop()
+            if end in states and (not leaf_only or node.children is None):
+                yield path
+            if node.children is None: continue
+            children = []
+            for name in iter_children(node, states):
+                child_states = step(states, name)
+                if child_states:
+                    children.append(
+                        (path + delimiter + name, node.children[name], child_states)
+                    )
+            stack.extend(reversed(children))
+
+    def getSnapshot(self) -> (dict):
+        """
+        트리를 JSON으로 저장할 수 있는 딕셔너리 형태의 스냅샷으로 만들어 반환. 
+        노드 이름은 문자열이어야 한다. 
+
+        스냅샷은 다음의 key들로 구성된다. 
+        version: 스냅샷 형식의 버전(SNAPSHOT_VERSION). 
+        delimiter: 트리의 계층 구분 기호. 
+        names: 트리 내 노드 이름들을 중복 없이 모은 리스트. 
+        name_ids: 각 노드의 이름의 names 내 인덱스. 
+        parents: 각 노드의 부모 노드의 인덱스. root 노드는 -1. 
+        노드들은 깊이 우선 순서(iterDFS() 순서)로 나열되며, 
+        부모 노드는 항상 자식 노드보다 앞에 나온다. 
+
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['a.b.c', 'a.c'])
+        >>> tree_obj.getSnapshot()
+        {'version': 1, 'delimiter': '.', 'names': ['a', 'b', 'c'], 'name_ids': [0, 1, 2, 2], 'parents': [-1, 0, 1, 0]}
+        """
+        names: list[Node] = []
+        name_table: dict[Node, int] = {}
+        name_ids: list[int] = []
+        parents: list[int] = []
+        if self._root_node is not None:
+            # (노드, 부모 노드의 인덱스)
+            stack = [(self._root_node, -1)]
+            while stack:
+                node, parent_id = stack.pop()
+                name_id = name_table.get(node.name)
+                if name_id is None:
+                    name_id = name_table[node.name] = len(names)
+                    names.append(node.name)
+                node_id = len(name_ids)
+                name_ids.append(name_id)
+                parents.append(parent_id)
+                if node.children is None: continue
+                for name in reversed(node.getChildNames()):
+                    stack.append((node.children[name], node_id))
+        return {
+            'version': SNAPSHOT_VERSION,
+            'delimiter': self._delimiter,
+            'names': names,
+            'name_ids': name_ids,
+            'parents': parents,
+        }
+
+    def setSnapshot(self, snapshot: dict) -> (bool):
+        """
+        getSnapshot()으로 만든 스냅샷으로 트리를 복원한다. 
+        기존 트리 내 노드들은 모두 삭제되며, 계층 구분 기호도 스냅샷의 것으로 바뀐다. 
+        append() 메서드를 노드마다 호출하지 않고, 스냅샷의 노드들을 
+        순서대로 한 번만 읽어 트리를 구성한다. 
+
+        예)
+        >>> tree_obj = PathTree()
+        >>> tree_obj.appendAll(['a.b.c', 'a.c'])
+        >>> new_tree = PathTree()
+        >>> new_tree.setSnapshot(tree_obj.getSnapshot())
+        True
+        >>> print(new_tree.getTreeStructure())
+        a
+        ├ b
+        │ └ c
+        └ c
+
+        반환값
+        -----
+        True: 트리를 복원한 경우. 
+        False: 스냅샷의 형식이 잘못되어 트리를 복원하지 못한 경우. 
+        이 때 기존 트리는 바뀌지 않는다. 
+        """
+        try:
+            if snapshot['version'] != SNAPSHOT_VERSION: return False
+            delimiter = snapshot['delimiter']
+            names = [sys.intern(name) for name in snapshot['names']]
+            name_ids = snapshot['name_ids']
+            parents = snapshot['parents']
+        except (KeyError, TypeError):
+            return False
+        if len(name_ids) != len(parents): return False
+        if name_ids and parents[0] != -1: return False
+
+        # 새로 만드는 노드 객체들은 모두 트리에 연결되어 있어 쓰레기 수집 대상이 
+        # 아니므로, 노드를 만드는 동안 순환 참조 쓰레기 수집을 멈춘다.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            built = self._buildSnapshotNodes(names, name_ids, parents)
+        finally:
+            if gc_enabled: gc.enable()
+        if built is None: return False
+        nodes, name_index = built
+
+        self._delimiter = delimiter
+        self._node_number = len(nodes)
+        self._name_index = name_index
+        if nodes:
+            self._root_node = nodes[0]
+            self._root = self._root_node.name
+        else:
+            self._root_node = None
+            self._root = None
+        return True
+
+    def _buildSnapshotNodes(
+            self, 
+            names: list[Node], 
+            name_ids: Iterable[int], 
+            parents: Iterable[int]
+        ) -> (tuple[list[_PathNode], dict[Node, _PathNode | set[_PathNode]]] | None):
+        """
+        스냅샷의 노드 이름 표, 노드별 이름 번호, 부모 노드 번호로 
+        노드 객체들을 만들어 연결하고, (노드 리스트, 노드 이름별 색인)을 반환. 
+        스냅샷이 잘못된 경우 None을 반환. 
+        """
+        nodes: list[_PathNode] = []
+        name_index: dict[Node, _PathNode | set[_PathNode]] = {}
+        try:
+            for i, (name_id, parent_id) in enumerate(zip(name_ids, parents)):
+                if name_id < 0: return None
+                name = names[name_id]
+                if i == 0:
+                    node = _PathNode(name)
+                else:
+                    # 부모 노드는 항상 자식 노드보다 앞에 있어야 한다.
+                    if not 0 <= parent_id < i: return None
+                    parent = nodes[parent_id]
+                    node = _PathNode(name, parent)
+                    # addChild()를 거치지 않고 자식 노드 딕셔너리에 바로 추가한 뒤, 
+                    # 자식 노드 이름 리스트는 모든 노드를 추가한 뒤에 한 번만 정렬한다.
+                    siblings = parent.children
+                    if siblings is None: parent.children = {name: node}
+                    elif name in siblings: return None
+                    else: siblings[name] = node
+                nodes.append(node)
+                same = name_index.get(name)
+                if same is None: name_index[name] = node
+                elif type(same) == set: same.add(node)
+                else: name_index[name] = {same, node}
+        except (IndexError, TypeError):
+            return None
+        for node in nodes:
+            if node.children is not None and len(node.children) > 1:
+                node.order = sorted(node.children)
+        return nodes, name_index
+
+    def saveSnapshot(self, file_path: str, binary: bool = False) -> (None):
+        """
+        트리의 스냅샷을 파일로 저장한다. 
+
+        매개변수
+        -------
+        file_path: 스냅샷을 저장할 파일 경로. 
+        binary: False 시 getSnapshot()의 결과를 JSON 파일로 저장한다. 
+        True 시 노드 이름들과 인덱스 배열들을 그대로 담은 바이너리 파일로 저장한다. 
+        바이너리 파일이 JSON 파일보다 작고 더 빨리 읽힌다. 
+        """
+        snapshot = self.getSnapshot()
+        if not binary:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+            return
+
+        # 노드 이름들은 하나의 문자열로 이어 붙여 저장하고, 
+        # 각 이름의 글자 수를 따로 저장하여 읽을 때 나눈다.
+        delimiter = snapshot['delimiter'].encode('utf-8')
+        name_lengths = array('I', map(len, snapshot['names']))
+        name_bytes = ''.join(snapshot['names']).encode('utf-8')
+        name_ids = array('I', snapshot['name_ids'])
+        parents = array('i', snapshot['parents'])
+        if sys.byteorder == 'big':
+            for arr in (name_lengths, name_ids, parents): arr.byteswap()
+        with open(file_path, 'wb') as f:
+            f.write(_SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(delimiter),
+                len(name_lengths), len(name_ids), len(name_bytes)
+            ))
+            f.write(delimiter)
+            name_lengths.tofile(f)
+            f.write(name_bytes)
+            name_ids.tofile(f)
+            parents.tofile(f)
+
+    def loadSnapshot(self, file_path: str) -> (bool):
+        """
+        saveSnapshot()으로 저장한 스냅샷 파일을 읽어 트리를 복원한다. 
+        JSON 파일인지 바이너리 파일인지는 파일 내용으로 판단한다. 
+        복원 방식과 반환값은 setSnapshot() 메서드와 같으며, 
+        파일의 형식이 잘못된 경우에도 False를 반환한다. 
+
+        예)
+        >>> import os, tempfile
+        >>> tree_obj = PathTree(delimiter='/')
+        >>> tree_obj.appendAll(['a/b/c', 'a/d'])
+        >>> with tempfile.TemporaryDirectory() as temp_dir:
+        ...     file_path = os.path.join(temp_dir, 'tree.snapshot')
+        ...     tree_obj.saveSnapshot(file_path, binary=True)
+        ...     new_tree = PathTree()
+        ...     new_tree.loadSnapshot(file_path)
+        True
+        >>> new_tree.delimiter
+        '/'
+        >>> new_tree.getAllLeafAbs()
+        ['a/b/c', 'a/d']
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(_SNAPSHOT_MAGIC):
+            try: snapshot = json.loads(data.decode('utf-8'))
+            except (UnicodeDecodeError, ValueError): return False
+            return self.setSnapshot(snapshot)
+
+        try:
+            magic, version, delimiter_len, name_count, node_count, names_len \
+                = _SNAPSHOT_HEADER.unpack_from(data)
+        except struct.error:
+            return False
+        offset = _SNAPSHOT_HEADER.size
+
+        def read_array(typecode: str, count: int) -> (array):
+            nonlocal offset
+            arr = array(typecode)
+            end = offset + arr.itemsize * count
+            if end > len(data): raise ValueError("스냅샷 파일이 잘렸습니다.")
+            arr.frombytes(data[offset:end])
+            if sys.byteorder == 'big': arr.byteswap()
+            offset = end
+            return arr
+
+        try:
+            delimiter = data[offset:offset+delimiter_len].decode('utf-8')
+            offset += delimiter_len
+            name_lengths = read_array('I', name_count)
+            names_text = data[offset:offset+names_len].decode('utf-8')
+            offset += names_len
+            ends = list(accumulate(name_lengths))
+            if ends and ends[-1] != len(names_text): return False
+            names = [
+                names_text[start:end] 
+                for start, end in zip([0, *ends], ends)
+            ]
+            name_ids = read_array('I', node_count)
+            parents = read_array('i', node_count)
+        except (ValueError, UnicodeDecodeError):
+            return False
+        return self.setSnapshot({
+            'version': version,
+            'delimiter': delimiter,
+            'names': names,
+            'name_ids': name_ids.tolist(),
+            'parents': parents.tolist(),
+        })
+
+    def diff(self, other: 'PathTree') -> (dict):
+        """
+        현재 트리(이전 트리)에서 other 트리(이후 트리)로 바뀐 부분을 
+        하위 트리 단위로 찾아 반환한다. 
+        두 트리를 root 노드부터 함께 내려가며 비교하되, 하위 노드들의 구조가 같은 
+        노드(digest가 같은 노드)는 더 내려가지 않는다. 각 노드의 digest는 
+        한 번 계산되면 보관되고 트리가 바뀐 부분만 다시 계산되므로, 
+        같은 트리들을 반복해서 비교할 때는 바뀐 부분에 비례하는 시간만 걸린다. 
+
+        반환값
+        -----
+        다음의 key들로 구성된 딕셔너리. 반환되는 절대경로들은 모두 
+        현재 트리의 구분 기호로 표현된다. 
+        removed: 삭제된 하위 트리들의 최상위 노드 절대경로 리스트. (이전 트리 기준)
+        added: 추가된 하위 트리들의 최상위 노드 절대경로를 key로, 
+        그 하위 트리의 leaf 노드 절대경로 리스트를 value로 하는 딕셔너리. (이후 트리 기준)
+        renamed: 하위 노드들은 그대로이고 이름만 바뀐 노드들의 
+        (이전 절대경로, 이후 절대경로) 리스트. 같은 부모 노드 아래에서 
+        이름이 바뀐, 자식 노드가 있는 노드만 해당된다. 
+        root 노드의 이름이 다르면 전체 트리가 삭제되고 추가된 것으로 본다. 
+
+        예)
+        >>> before = PathTree()
+        >>> before.appendAll(['log.2024-01.a', 'log.2024-01.b', 'log.tmp.c', 'log.old.d'])
+        >>> after = PathTree()
+        >>> after.appendAll(['log.2024-01.a', 'log.2024-02.e', 'log.temp.c', 'log.old.d'])
+        >>> before.diff(after)
+        {'removed': ['log.2024-01.b'], 'added': {'log.2024-02': ['log.2024-02.e']}, 'renamed': [('log.tmp', 'log.temp')]}
+        """
+        removed: list[AbsPath] = []
+        added: dict[AbsPath, list[AbsPath]] = {}
+        renamed: list[tuple[AbsPath, AbsPath]] = []
+        result = {'removed': removed, 'added': added, 'renamed': renamed}
+        delimiter = self._delimiter
+
+        def collect_leafs(path: AbsPath, node: _PathNode) -> (list[AbsPath]):
+            """other 트리의 node 하위 트리의 leaf 노드 절대경로들을 반환."""
+            leafs = []
+            stack = [(path, node)]
+            while stack:
+                path, node = stack.pop()
+                if node.children is None:
+                    leafs.append(path)
+                    continue
+                for name in reversed(node.getChildNames()):
+                    stack.append((path + delimiter + name, node.children[name]))
+            return leafs
+
+        old_root, new_root = self._root_node, other._root_node
+        if old_root is None and new_root is None: return result
+        if old_root is None or new_root is None or old_root.name != new_root.name:
+            if old_root is not None: removed.append(self._root)
+            if new_root is not None:
+                added[f"{new_root.name}"] = collect_leafs(f"{new_root.name}", new_root)
+            return result
+
+        # (절대경로, 이전 트리의 노드, 이후 트리의 노드)
+        stack = [(self._root, old_root, new_root)]
+        while stack:
+            path, old_node, new_node = stack.pop()
+            if old_node.getDigest() == new_node.getDigest(): continue
+            old_children = old_node.children or {}
+            new_children = new_node.children or {}
+            removed_names = [n for n in old_node.getChildNames() if n not in new_children]
+            added_names = [n for n in new_node.getChildNames() if n not in old_children]
+
+            # 자식 노드가 있는 노드들 중 하위 노드들의 구조가 같은 노드들을 
+            # 이름만 바뀐 노드로 본다.
+            added_by_digest: dict[bytes, list[Node]] = {}
+            renamed_names: set[Node] = set()
+            for name in added_names:
+                child = new_children[name]
+                if child.children is not None:
+                    added_by_digest.setdefault(child.getDigest(), []).append(name)
+            for name in removed_names:
+                child = old_children[name]
+                same = None
+                if child.children is not None:
+                    same = added_by_digest.get(child.getDigest())
+                if same:
+                    new_name = same.pop(0)
+                    renamed.append((path + delimiter + name, path + delimiter + new_name))
+                    renamed_names.add(new_name)
+                else:
+                    removed.append(path + delimiter + name)
+            for name in added_names:
+                if name in renamed_names: continue
+                child_path = path + delimiter + name
+                added[child_path] = collect_leafs(child_path, new_children[name])
+
+            common = [
+                name for name in reversed(old_node.getChildNames()) 
+                if name in new_children
+            ]
+            for name in common:
+                stack.append(
+                    (path + delimiter + name, old_children[name], new_children[name])
+                )
+        return result
+
+    def patch(self, diff: dict) -> (bool):
+        """
+        diff() 메서드의 결과를 현재 트리에 적용하여 이후 트리와 같게 만든다. 
+        removed의 하위 트리들을 삭제하고, renamed의 노드들의 이름을 바꾼 뒤, 
+        added의 하위 트리들을 추가한다. 
+
+        예)
+        >>> before = PathTree()
+        >>> before.appendAll(['log.2024-01.a', 'log.2024-01.b', 'log.tmp.c'])
+        >>> after = PathTree()
+        >>> after.appendAll(['log.2024-01.a', 'log.2024-02.e', 'log.temp.c'])
+        >>> before.patch(before.diff(after))
+        True
+        >>> before.getAllLeafAbs() == after.getAllLeafAbs()
+        True
+
+        반환값
+        -----
+        True: diff를 적용한 경우. 
+        False: removed, renamed의 절대경로가 트리 내에 없거나 형식이 잘못되어 
+        diff를 적용하지 못한 경우. 이 때 트리는 바뀌지 않는다. 
+        """
+        try:
+            removed = list(diff['removed'])
+            renamed = [(old, new) for old, new in diff['renamed']]
+            added = dict(diff['added'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        for path in removed + [old for old, _ in renamed]:
+            if type(path) != str or self._getNode(path) is None: return False
+
+        for path in removed:
+            self.remove(path, REMOVEALL)
+        for old, new in renamed:
+            self.replace(old, self.basename(new))
+        for leafs in added.values():
+            self.appendAll(leafs)
+        return True
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,161 @@
+"""tools.py 모듈의 DateTools 클래스 성능 측정 모듈.
+
+pytest 등의 테스트 수집 대상이 되지 않도록 파일명을 bench_로 시작하게 함.
+해당 디렉토리에서 직접 실행하여 측정 결과를 확인한다.
+
+예)
+python bench_tools.py
+
+"""
+import sys
+import timeit
+import random
+import datetime
+import time
+
+from dirimporttool import get_super_dir_directly
+
+for i in range(1, 2+1):
+    super_dir = get_super_dir_directly(__file__, i)
+    sys.path.append(super_dir)
+
+import tools
+from tools import DateOptions, DateTools
+
+# 전역 상수 정의
+REPEAT = 5
+NUMBER = 20
+
+def make_date_strs(
+        date_type: DateOptions.DateType,
+        size: int = 300
+    ) -> (list[str]):
+    """측정에 쓰일 날짜 문자열들을 날짜 형태별로 생성하는 함수.
+    로그 베이스 디렉토리 내 날짜 디렉토리명들을 흉내낸다.
+    """
+    dtool = DateTools()
+    rand = random.Random(0)
+    results = []
+    for _ in range(size):
+        year = rand.randint(2000, 2030)
+        month = rand.randint(1, 12)
+        day = rand.randint(1, 28)
+        results.append(dtool.getDateStr(date_type, False, year, month, day))
+    return results
+
+def measure(title: str, func: callable):
+    """func를 NUMBER회 실행하는 작업을 REPEAT회 반복하여 
+    가장 짧은 소요 시간을 출력한다.
+    """
+    best = min(timeit.repeat(func, repeat=REPEAT, number=NUMBER))
+    print(f"{title:<40} {best / NUMBER * 1000:10.3f} ms")
+
+def bench_parse_date_str():
+    """날짜 형태별 isDateStr(), convertStrToDate() 측정.
+
+    캐시가 비어 있는 경우(cold)와 캐시가 채워진 경우(warm)를 나눠서 측정한다.
+    """
+    dtool = DateTools()
+    for date_type in [
+            DateOptions.DAY, DateOptions.WEEK, 
+            DateOptions.MONTH, DateOptions.YEAR
+        ]:
+        date_strs = make_date_strs(date_type)
+
+        def cold():
+            tools._parseDateStr.cache_clear()
+            for d in date_strs:
+                dtool.isDateStr(d)
+                dtool.convertStrToDate(d)
+
+        def warm():
+            for d in date_strs:
+                dtool.isDateStr(d)
+                dtool.convertStrToDate(d)
+
+        measure(f"{date_type} - cold cache", cold)
+        warm()
+        measure(f"{date_type} - warm cache", warm)
+
+def bench_date_buckets(size: int = 100_000):
+    """size개의 날짜들을 주 단위로 분류할 때 
+    getDateStr()을 하나씩 호출하는 경우와 getDateBuckets()를 비교 측정.
+    """
+    dtool = DateTools()
+    rand = random.Random(0)
+    start = datetime.datetime(2020, 1, 1).timestamp()
+    stamps = [start + rand.random() * 86400 * 365 * 5 for _ in range(size)]
+    days = [datetime.date.fromtimestamp(s) for s in stamps]
+
+    def one_by_one():
+        for d in days:
+            dtool.getDateStr(DateOptions.WEEK, False, d.year, d.month, d.day)
+
+    def bulk():
+        dtool.getDateBuckets(days, DateOptions.WEEK)
+
+    measure(f"week - getDateStr() x {size}", one_by_one)
+    measure(f"week - getDateBuckets() x {size}", bulk)
+    measure(
+        f"week - getDateBuckets() timestamps x {size}", 
+        lambda: dtool.getDateBuckets(stamps, DateOptions.WEEK)
+    )
+
+    if tools.np is not None:
+        np = tools.np
+        arr = np.array(stamps, dtype='float64').astype('datetime64[s]')
+        measure(
+            f"week - getDateBuckets() datetime64 x {size}",
+            lambda: dtool.getDateBuckets(arr, DateOptions.WEEK)
+        )
+
+def bench_get_date_str(size: int = 10_000):
+    """날짜 형태별 getDateStr() 측정 및 getNextBoundaryTimestamp()와 비교.
+
+    연도별 날짜 분류 표가 비어 있는 경우(cold)와 채워진 경우(warm)를 
+    나눠서 측정한다.
+    """
+    dtool = DateTools()
+    rand = random.Random(0)
+    start = datetime.date(2020, 1, 1)
+    days = [
+        start + datetime.timedelta(days=rand.randrange(365 * 5))
+        for _ in range(size)
+    ]
+    for date_type in [
+            DateOptions.DAY, DateOptions.WEEK, 
+            DateOptions.MONTH, DateOptions.YEAR
+        ]:
+        def run():
+            for d in days:
+                dtool.getDateStr(date_type, False, d.year, d.month, d.day)
+
+        def cold():
+            tools._getYearCalendar.cache_clear()
+            tools._getMonthWeekTable.cache_clear()
+            run()
+
+        measure(f"{date_type} - getDateStr() cold x {size}", cold)
+        measure(f"{date_type} - getDateStr() warm x {size}", run)
+
+    # 로그 기록마다 날짜 디렉토리가 바뀌었는지 확인하는 경우.
+    now = time.time()
+    today = dtool.getDateStr(DateOptions.WEEK, True)
+    boundary = dtool.getNextBoundaryTimestamp(DateOptions.WEEK, now)
+    measure(
+        f"rollover check by string x {size}",
+        lambda: [
+            dtool.getDateStr(DateOptions.WEEK, True) != today 
+            for _ in range(size)
+        ]
+    )
+    measure(
+        f"rollover check by timestamp x {size}",
+        lambda: [time.time() >= boundary for _ in range(size)]
+    )
+
+
+if __name__ == '__main__':
+    bench_parse_date_str()
+    bench_date_buckets()
+    bench_get_date_str()
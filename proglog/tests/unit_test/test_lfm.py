@@ -4,6 +4,9 @@ import unittest
 import sys
 import os
 import shutil
+import datetime
+import gzip
+import zipfile
 
 from dirimporttool import get_super_dir_directly
 
@@ -479,13 +482,13 @@ class TestZip(unittest.TestCase):
             self.assertEqual(lognum, len(self.datefd[datedir]))
 
         # zip 파일 내부 구조 테스트.
-        for i, zipfile in enumerate(zippath):
+        for i, zip_path in enumerate(zippath):
             subdirpath = os.path.join(self.tempdir, f'temp{i+1}')
             os.mkdir(subdirpath)
-            decompress_zip(zipfile, subdirpath)
+            decompress_zip(zip_path, subdirpath)
 
             zip_leaf = get_all_in_rootdir(subdirpath, False)
-            zipname = os.path.splitext(os.path.basename(zipfile))[0]
+            zipname = os.path.splitext(os.path.basename(zip_path))[0]
             self.assertEqual(os.listdir(subdirpath)[0], zipname)
             self.assertEqual(len(zip_leaf), 4)
             for en in zip_leaf:
@@ -516,13 +519,13 @@ class TestZip(unittest.TestCase):
             self.assertEqual(lognum, 0)
 
         # zip 파일 내부 구조 테스트.
-        for i, zipfile in enumerate(zippath):
+        for i, zip_path in enumerate(zippath):
             subdirpath = os.path.join(self.tempdir, f'temp{i+1}')
             os.mkdir(subdirpath)
-            decompress_zip(zipfile, subdirpath)
+            decompress_zip(zip_path, subdirpath)
 
             zip_leaf = get_all_in_rootdir(subdirpath, False)
-            zipname = os.path.splitext(os.path.basename(zipfile))[0]
+            zipname = os.path.splitext(os.path.basename(zip_path))[0]
             self.assertEqual(os.listdir(subdirpath)[0], zipname)
             self.assertEqual(len(zip_leaf), 4)
             for en in zip_leaf:
@@ -646,6 +649,186 @@ class TestZip(unittest.TestCase):
         self.assertEqual(in_root, self.entities)
 
 
+
+class TestSummarizeDateDir(unittest.TestCase):
+    """summarizeDateDir(), summarizeAllDateDirs() 메서드 테스트 클래스."""
+    def setUp(self):
+        self.test_rootdir_path = os.path.abspath(
+            os.path.join('..', 'testdata', 'for-summary')
+        )
+        self.datedir_path = os.path.join(self.test_rootdir_path, '2024-01-17')
+        os.makedirs(self.datedir_path, exist_ok=True)
+        self.lfm = LogFileManager(self.test_rootdir_path)
+
+        self.error_log = os.path.join(self.datedir_path, 'error.log')
+        self.debug_log = os.path.join(self.datedir_path, 'debug (1).log')
+        self.write(self.error_log, [
+            "2024-01-17 10:00:00,001 - ERROR\n",
+            "Traceback (most recent call last):\n",
+            "ZeroDivisionError: division by zero\n",
+            "2024-01-17 11:00:00,002 - ERROR\n",
+            "2024-01-17 11:00:00,003 - ERROR\n",
+        ])
+        self.write(self.debug_log, [
+            "2024-01-17 09:00:00,000 - DEBUG\n",
+            "a = 1\n",
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.test_rootdir_path)
+
+    def write(self, file_path: str, lines: list[str], mode: str = 'w'):
+        with open(file_path, mode, encoding='utf-8', newline='') as file:
+            file.write(''.join(lines))
+
+    def testSummarizeDateDir(self):
+        result = self.lfm.summarizeDateDir('2024-01-17')
+        self.assertEqual(result['records'], 4)
+        self.assertEqual(result['levels'], {'ERROR': 3, 'DEBUG': 1})
+        self.assertEqual(
+            result['loggers'], {'__error__': 3, '__debug__': 1}
+        )
+        self.assertEqual(
+            result['size'], 
+            os.path.getsize(self.error_log) + os.path.getsize(self.debug_log)
+        )
+        self.assertEqual(
+            sorted(result['files']), ['debug (1).log', 'error.log']
+        )
+        self.assertEqual(
+            result['first'], datetime.datetime(2024, 1, 17, 9, 0, 0, 0)
+        )
+        self.assertEqual(
+            result['last'], datetime.datetime(2024, 1, 17, 11, 0, 0, 3000)
+        )
+
+        # 날짜 디렉토리가 아니거나 존재하지 않는 디렉토리.
+        self.assertEqual(self.lfm.summarizeDateDir('not-a-date'), None)
+        self.assertEqual(self.lfm.summarizeDateDir('2024-01-18'), None)
+
+    def testIncrementalUpdate(self):
+        self.lfm.summarizeDateDir('2024-01-17')
+
+        # 로그 기록이 추가되면 추가된 부분만 반영된다. 
+        # 줄바꿈 문자가 없는, 아직 기록 중인 줄은 집계하지 않는다.
+        self.write(self.error_log, [
+            "2024-01-17 12:00:00,000 - __error__.main - CRITICAL\n",
+            "2024-01-17 13:00:00,000 - ERR",
+        ], 'a')
+        result = self.lfm.summarizeDateDir('2024-01-17')
+        self.assertEqual(result['records'], 5)
+        self.assertEqual(result['levels']['CRITICAL'], 1)
+        self.assertEqual(result['loggers']['__error__'], 4)
+        self.assertEqual(
+            result['last'], datetime.datetime(2024, 1, 17, 12, 0, 0)
+        )
+
+        self.write(self.error_log, ["OR\n"], 'a')
+        result = self.lfm.summarizeDateDir('2024-01-17')
+        self.assertEqual(result['records'], 6)
+        self.assertEqual(result['levels']['ERROR'], 4)
+
+        # 로그 파일 내용이 지워지거나 로그 파일이 삭제된 경우.
+        self.write(self.error_log, [])
+        os.remove(self.debug_log)
+        result = self.lfm.summarizeDateDir('2024-01-17')
+        self.assertEqual(result['records'], 0)
+        self.assertEqual(result['files'], {'error.log': 0})
+        self.assertEqual(result['first'], None)
+
+    def testSummarizeAllDateDirs(self):
+        os.makedirs(os.path.join(self.test_rootdir_path, '2024-01-18'))
+        os.makedirs(os.path.join(self.test_rootdir_path, 'not-a-date'))
+        results = self.lfm.summarizeAllDateDirs()
+        self.assertEqual(list(results), ['2024-01-17', '2024-01-18'])
+        self.assertEqual(results['2024-01-18']['records'], 0)
+        self.assertEqual(results['2024-01-17']['records'], 4)
+
+
+
+class TestReadMergedLogs(unittest.TestCase):
+    """readMergedLogs() 메서드 테스트 클래스."""
+    def setUp(self):
+        self.test_rootdir_path = os.path.abspath(
+            os.path.join('..', 'testdata', 'for-merge')
+        )
+        self.datedir_path = os.path.join(self.test_rootdir_path, '2024-01-17')
+        os.makedirs(self.datedir_path, exist_ok=True)
+        self.lfm = LogFileManager(self.test_rootdir_path)
+
+        self.write('info (1).log', [
+            "2024-01-17 09:00:00,000 - INFO\n",
+            "start\n",
+            "2024-01-17 10:00:00,000 - INFO\n",
+        ])
+        self.write('info.log', [
+            "2024-01-17 10:00:00,000 - INFO\n",
+            "2024-01-17 12:00:00,000 - INFO\n",
+        ])
+        self.write('error.log', [
+            "2024-01-17 11:00:00,000 - ERROR\n",
+            "Traceback (most recent call last):\n",
+            "ZeroDivisionError: division by zero\n",
+        ])
+        with gzip.open(
+                os.path.join(self.datedir_path, 'error (1).log.gz'), 'wt',
+                encoding='utf-8'
+            ) as file:
+            file.write("2024-01-17 09:30:00,000 - ERROR\n")
+        with zipfile.ZipFile(
+                os.path.join(self.datedir_path, '2024-01-17.zip'), 'w'
+            ) as zf:
+            zf.writestr(
+                '2024-01-17/debug.log', 
+                "2024-01-17 10:30:00,000 - DEBUG\na = 1\n"
+            )
+            # 날짜 디렉토리에 같은 이름의 로그 파일이 있으므로 무시된다.
+            zf.writestr(
+                '2024-01-17/info.log', "2024-01-17 00:00:00,000 - INFO\n"
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_rootdir_path)
+
+    def write(self, file_name: str, lines: list[str]):
+        file_path = os.path.join(self.datedir_path, file_name)
+        with open(file_path, 'w', encoding='utf-8', newline='') as file:
+            file.write(''.join(lines))
+
+    def testReadMergedLogs(self):
+        results = list(self.lfm.readMergedLogs('2024-01-17'))
+        self.assertEqual(
+            [(dt.hour, dt.minute, source) for dt, source, _ in results],
+            [
+                (9, 0, 'info (1).log'),
+                (9, 30, 'error (1).log.gz'),
+                (10, 0, 'info (1).log'),
+                (10, 0, 'info.log'),
+                (10, 30, '2024-01-17.zip/2024-01-17/debug.log'),
+                (11, 0, 'error.log'),
+                (12, 0, 'info.log'),
+            ]
+        )
+        # 여러 줄로 된 로그 기록은 하나로 묶인다.
+        self.assertEqual(
+            results[0][2], "2024-01-17 09:00:00,000 - INFO\nstart\n"
+        )
+        self.assertEqual(results[5][2].count('\n'), 3)
+
+    def testLogFileNames(self):
+        results = self.lfm.readMergedLogs('2024-01-17', ['error.log'])
+        self.assertEqual(
+            [source for _, source, _ in results], 
+            ['error (1).log.gz', 'error.log']
+        )
+
+    def testInvalidDateDir(self):
+        with self.assertRaises(FileNotFoundError):
+            next(self.lfm.readMergedLogs('2024-01-18'))
+        with self.assertRaises(FileNotFoundError):
+            next(self.lfm.readMergedLogs('not-a-date'))
+
+
 if __name__ == '__main__':
     @helpers.WorkCWD(__file__)
     def exec_test():
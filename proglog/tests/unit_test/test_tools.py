@@ -57,6 +57,9 @@ class TestDateTools(unittest.TestCase):
         test_date(2023, 11, 21, '2023-10-31')
         test_date(2023, 12, 5, '2023-11-30')
         test_date(2024, 3, 12, '2024-02-29')
+        # 지난 달의 일수가 이번 달보다 적은 경우.
+        test_date(2023, 3, 1, '2023-02-28')
+        test_date(2023, 12, 1, '2023-11-30')
 
     def testGetWeekOfDayInMonth(self):
         def test_date(year: int, month: int, day: int, expected):
@@ -68,6 +71,10 @@ class TestDateTools(unittest.TestCase):
         test_date(2023, 11, 21, 4)
         test_date(2023, 12, 2, -5)
         test_date(2023, 12, 11, 2)
+        # 2023-03-01(수)은 3월의 1주차.
+        test_date(2023, 3, 1, 1)
+        # 2024-03-01(금)은 2월의 마지막 주(5주차)에 해당.
+        test_date(2024, 3, 1, -5)
 
     def testGetDateStr(self):
         def get_date_str(t_date: datetime.date, option: DateOptions):
@@ -86,6 +93,74 @@ class TestDateTools(unittest.TestCase):
         year_result = get_date_str(target_date, self.dateop.YEAR)
         self.assertEqual(year_result, '2023')
 
+        # 연도가 바뀌는 주.
+        target_date = datetime.date(2021, 1, 2)
+        week_result = get_date_str(target_date, self.dateop.WEEK)
+        self.assertEqual(week_result, '2020-12-05주')
+
+        # 구분 기호 변경 및 잘못된 날짜 형태 옵션.
+        self.datetool.delimiter = '.'
+        day_result = get_date_str(datetime.date(2023, 12, 1), self.dateop.DAY)
+        self.assertEqual(day_result, '2023.12.01')
+        self.assertEqual(get_date_str(target_date, self.dateop.FREE), None)
+
+    def testGetNextBoundary(self):
+        def test_date(option: DateOptions, the_day: tuple, expected: tuple):
+            result = self.datetool.getNextBoundary(
+                option, datetime.date(*the_day)
+            )
+            self.assertEqual(result, datetime.date(*expected))
+
+        test_date(self.dateop.DAY, (2023, 12, 31), (2024, 1, 1))
+        test_date(self.dateop.MONTH, (2023, 12, 15), (2024, 1, 1))
+        test_date(self.dateop.YEAR, (2023, 3, 1), (2024, 1, 1))
+        test_date(self.dateop.WEEK, (2023, 11, 21), (2023, 11, 27))
+        # 2023-12-01(금)은 2023-11-5주이므로 다음 경계는 2023-12-04(월).
+        test_date(self.dateop.WEEK, (2023, 11, 27), (2023, 12, 4))
+        # 2024-02-01(목)부터 2024-02-1주가 시작됨.
+        test_date(self.dateop.WEEK, (2024, 1, 29), (2024, 2, 1))
+        self.assertEqual(
+            self.datetool.getNextBoundary(
+                self.dateop.FREE, datetime.date(2023, 1, 1)
+            ), 
+            None
+        )
+
+        # 다음 경계 전날까지는 날짜 문자열이 같고, 경계에서 바뀌는지 확인.
+        def get_date_str(t_date: datetime.date, option: DateOptions):
+            return self.datetool.getDateStr(
+                option, False, t_date.year, t_date.month, t_date.day
+            )
+
+        the_day = datetime.date(2023, 1, 1)
+        for _ in range(400):
+            for option in [
+                    self.dateop.DAY, self.dateop.WEEK, 
+                    self.dateop.MONTH, self.dateop.YEAR
+                ]:
+                boundary = self.datetool.getNextBoundary(option, the_day)
+                before = boundary - datetime.timedelta(days=1)
+                self.assertEqual(
+                    get_date_str(the_day, option), 
+                    get_date_str(before, option)
+                )
+                self.assertNotEqual(
+                    get_date_str(the_day, option), 
+                    get_date_str(boundary, option)
+                )
+            the_day += datetime.timedelta(days=1)
+
+    def testGetNextBoundaryTimestamp(self):
+        the_time = datetime.datetime(2023, 11, 30, 23, 59, 59)
+        result = self.datetool.getNextBoundaryTimestamp(
+            self.dateop.MONTH, the_time.timestamp()
+        )
+        self.assertEqual(result, datetime.datetime(2023, 12, 1).timestamp())
+        result = self.datetool.getNextBoundaryTimestamp(
+            self.dateop.WEEK, the_time.timestamp()
+        )
+        self.assertEqual(result, datetime.datetime(2023, 12, 4).timestamp())
+
     def testIsDateStr(self):
         data = ''
         self.assertEqual(self.datetool.isDateStr(data), None)
@@ -164,6 +239,107 @@ class TestDateTools(unittest.TestCase):
         data = '2023_12_01주'
         self.assertEqual(self.datetool.isDateStr(data), None)
 
+    def testParseDateStr(self):
+        # test 1
+        # 날짜 형태와 datetime.date 객체를 한꺼번에 반환하는지 확인.
+        datas = [
+            ('2023-12-04', self.dateop.DAY, '2023-12-04'),
+            ('2023-12-1주', self.dateop.WEEK, '2023-12-04'),
+            ('2023-10-05주', self.dateop.WEEK, '2023-10-30'),
+            ('2023-12', self.dateop.MONTH, '2023-12-01'),
+            ('02021', self.dateop.YEAR, '2021-01-01'),
+        ]
+        for data, ex_type, ex_date in datas:
+            dtype, result = self.datetool.parseDateStr(data)
+            self.assertEqual(dtype, ex_type)
+            self.assertEqual(result.isoformat(), ex_date)
+            self.assertEqual(dtype, self.datetool.isDateStr(data))
+            self.assertEqual(result, self.datetool.convertStrToDate(data))
+
+        # test 2
+        datas = [
+            '', '2023-11-31', '2023-12-6주', '2023-12-주',
+            '2023-12-12-', '2023_12', '-1', '10000', '2023-1-1주주',
+        ]
+        for data in datas:
+            self.assertEqual(self.datetool.parseDateStr(data), None)
+
+        # test 3
+        # 구분 기호가 바뀌면 해당 구분 기호로 날짜 문자열을 해석한다.
+        self.datetool.delimiter = '.'
+        self.assertEqual(
+            self.datetool.parseDateStr('2023.12.04'),
+            (self.dateop.DAY, datetime.date(2023, 12, 4))
+        )
+        self.assertEqual(self.datetool.parseDateStr('2023-12-04'), None)
+
+    def testGetDateBuckets(self):
+        # test 1
+        # 각 날짜를 하나씩 getDateStr(), convertStrToDate()로 
+        # 변환한 결과와 같은지 확인.
+        the_day = datetime.date(2023, 1, 1)
+        days = [the_day + datetime.timedelta(days=i) for i in range(800)]
+        for date_type in [
+                self.dateop.DAY, self.dateop.WEEK, 
+                self.dateop.MONTH, self.dateop.YEAR
+            ]:
+            labels, starts = self.datetool.getDateBuckets(days, date_type)
+            for d, label, start in zip(days, labels, starts):
+                expected = self.datetool.getDateStr(
+                    date_type, False, d.year, d.month, d.day
+                )
+                self.assertEqual(label, expected)
+                self.assertEqual(
+                    start, self.datetool.convertStrToDate(expected)
+                )
+
+        # test 2
+        # 여러 자료형이 섞여 있어도 변환되는지 확인.
+        datas = [
+            datetime.datetime(2023, 12, 1, 13, 30),
+            '2023-12-01 13:30:00,123',
+            '2023-12-1주',
+            None,
+        ]
+        labels, starts = self.datetool.getDateBuckets(
+            datas, self.dateop.WEEK
+        )
+        self.assertEqual(
+            labels, ['2023-11-05주', '2023-11-05주', '2023-12-01주', None]
+        )
+        self.assertEqual(starts, [
+            datetime.date(2023, 11, 27), datetime.date(2023, 11, 27),
+            datetime.date(2023, 12, 4), None
+        ])
+
+        # test 3
+        # 날짜로 변환할 수 없는 자료형.
+        with self.assertRaises(TypeError):
+            self.datetool.getDateBuckets([[2023, 12, 1]], self.dateop.DAY)
+
+    def testGetDateBucketsWithNumpy(self):
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            self.skipTest("numpy가 설치되어 있지 않음.")
+
+        dates = np.array(
+            ['2023-11-30T10:00', '2023-12-01T23:59', 'NaT', '2023-12-04'],
+            dtype='datetime64[m]'
+        )
+        labels, starts = self.datetool.getDateBuckets(
+            dates, self.dateop.WEEK
+        )
+        self.assertEqual(
+            labels.tolist(), 
+            ['2023-11-05주', '2023-11-05주', None, '2023-12-01주']
+        )
+        self.assertEqual(starts.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(
+            starts.astype(str).tolist(),
+            ['2023-11-27', '2023-11-27', 'NaT', '2023-12-04']
+        )
+
     def testGetDateFromWeek(self):
         # test 1
         data = '2023-11-1주' # 해당 월의 1일이 수요일 -> 1일부터 1주차
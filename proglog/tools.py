@@ -1,9 +1,29 @@
 import datetime
 import calendar
 import os
+import re
 import time
+import functools
 from typing import Literal, TypeAlias
 from operator import itemgetter
+from collections.abc import Iterable
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    # numpy는 선택 사항. 설치되지 않은 경우 
+    # numpy.datetime64 배열 입력 기능만 사용할 수 없다.
+    np = None
+
+# 날짜 문자열 파싱 결과를 보관하는 LRU 캐시의 최대 크기.
+# 로그 베이스 디렉토리 내 같은 날짜 디렉토리명들이 반복해서 파싱되므로 
+# 수백 개 정도의 디렉토리명을 충분히 담을 수 있는 크기로 정함.
+DATE_STR_CACHE_SIZE = 1024
+# 월별 주차 표를 보관하는 LRU 캐시의 최대 크기. (약 85년치)
+WEEK_TABLE_CACHE_SIZE = 1024
+# 연도별 날짜 분류 표를 보관하는 LRU 캐시의 최대 크기.
+# 로깅 중에는 보통 올해와 작년 정도만 조회되므로 작게 잡음.
+CALENDAR_CACHE_SIZE = 16
 
 
 class DateOptions():
@@ -26,6 +46,176 @@ class DateOptions():
     DateType: TypeAlias = Literal['day', 'week', 'month', 'year']
 
 
+def _getDateOfWeek(
+        year: int,
+        month: int,
+        week: int,
+        weekday: int = calendar.MONDAY
+    ) -> (datetime.date):
+    """'YYYY-MM-N주' 형태의 주를 구성하는 연, 월, 주차 숫자와 요일을 입력하면
+    해당 날짜를 datetime.date 객체로 반환하는 함수.
+
+    계산 기준은 DateTools.getDateFromWeek() 메서드를 따른다.
+    즉, 첫 째 주에 weekday로 지정한 날이 없다면 해당 달의 1일로 정하고,
+    마지막 주의 weekday가 다음 달에 해당하면 다음 달의 날짜로 반환한다.
+    """
+    first_weekday = calendar.weekday(year, month, 1)
+    if first_weekday <= calendar.THURSDAY:
+        if week == 1:
+            if weekday < first_weekday:
+                return datetime.date(year, month, 1)
+            return datetime.date(year, month, 1 + weekday - first_weekday)
+        week -= 1
+    # 달력 상에서 두 번째 행의 월요일에 해당하는 날
+    the_day = 1 + (7 - first_weekday)
+    the_day += 7 * (week-1) + weekday
+
+    final_day = calendar.monthrange(year, month)[1]
+    diff = the_day - final_day
+    if diff > 0:
+        return datetime.date(year, month, final_day) \
+            + datetime.timedelta(days=diff)
+    return datetime.date(year, month, the_day)
+
+
+@functools.lru_cache(maxsize=None)
+def _compileDatePattern(delimiter: str) -> (re.Pattern):
+    """날짜 구분 기호에 맞는 날짜 문자열 정규표현식을 컴파일하여 반환.
+
+    각 그룹은 차례대로 연, 월, 주차, 일을 의미한다.
+    """
+    d = re.escape(delimiter)
+    return re.compile(rf'(\d+)(?:{d}(\d+)(?:{d}(?:(\d+)주|(\d+)))?)?')
+
+
+@functools.lru_cache(maxsize=DATE_STR_CACHE_SIZE)
+def _parseDateStr(
+        target: str,
+        delimiter: str
+    ) -> (tuple[DateOptions.DateType, datetime.date] | None):
+    """날짜 문자열을 한 번에 검사 및 변환하여 (DateType, datetime.date) 튜플로
+    반환하는 함수. DateTools.parseDateStr() 메서드에서 사용하며,
+    결과는 LRU 캐시에 보관된다.
+    """
+    matched = _compileDatePattern(delimiter).fullmatch(target)
+    if matched is None: return None
+    year, month, week, day = matched.groups()
+
+    year = int(year)
+    if not datetime.MINYEAR <= year <= datetime.MAXYEAR: return None
+    if month is None:
+        return DateOptions.YEAR, datetime.date(year, 1, 1)
+
+    month = int(month)
+    if not 1 <= month <= 12: return None
+    if week is not None:
+        week = int(week)
+        if not 1 <= week <= 5: return None
+        try:
+            return DateOptions.WEEK, _getDateOfWeek(year, month, week)
+        except OverflowError:
+            # datetime.MAXYEAR 이후의 날짜로 넘어가는 경우.
+            return None
+    if day is None:
+        return DateOptions.MONTH, datetime.date(year, month, 1)
+
+    day = int(day)
+    if not 1 <= day <= calendar.monthrange(year, month)[1]: return None
+    return DateOptions.DAY, datetime.date(year, month, day)
+
+
+@functools.lru_cache(maxsize=WEEK_TABLE_CACHE_SIZE)
+def _getMonthWeekTable(
+        year: int,
+        month: int
+    ) -> (tuple[tuple[int, int, int, datetime.date], ...]):
+    """특정 연, 월의 각 일이 몇 째주에 속하는지를 미리 계산해둔 표를 반환하는 함수.
+
+    i번째 원소는 (i+1)일이 속한 주의 (연, 월, N주, 해당 주의 시작 날짜) 튜플이다. 
+    주차 계산 기준은 DateTools.getWeekOfDayInMonth() 메서드를 따르며, 
+    지난 달의 마지막 주로 계산되는 날은 지난 달의 연, 월로 표기된다. 
+    해당 주의 시작 날짜는 DateTools.convertStrToDate() 메서드의 WEEK 기준을 따른다.
+
+    예) 2023-12-01(금) -> (2023, 11, 5, datetime.date(2023, 11, 27))
+    """
+    first_weekday = calendar.weekday(year, month, 1)
+    last_day = calendar.monthrange(year, month)[1]
+    # 1일이 월, 화, 수, 목 중 하나라면 1일이 포함된 주가 이번 달의 1주차.
+    offset = 1 if first_weekday <= calendar.THURSDAY else 0
+
+    table = []
+    last_week_of_last_month = None
+    week_start = {}
+    for day in range(1, last_day+1):
+        n_week = (day + first_weekday - 1) // 7 + offset
+        if n_week == 0:
+            if last_week_of_last_month is None:
+                if month == 1:
+                    last_year, last_month = year - 1, 12
+                else:
+                    last_year, last_month = year, month - 1
+                last_week_of_last_month \
+                    = _getMonthWeekTable(last_year, last_month)[-1]
+            table.append(last_week_of_last_month)
+            continue
+        if n_week not in week_start:
+            week_start[n_week] = _getDateOfWeek(year, month, n_week)
+        table.append((year, month, n_week, week_start[n_week]))
+    return tuple(table)
+
+
+@functools.lru_cache(maxsize=CALENDAR_CACHE_SIZE)
+def _getYearCalendar(
+        year: int,
+        delimiter: str
+    ) -> (tuple[tuple[str, str, str, str, datetime.date], ...]):
+    """특정 연도의 모든 날짜에 대한 날짜 분류별 날짜 문자열을 
+    미리 계산해둔 표를 반환하는 함수. 
+
+    i번째 원소는 해당 연도의 (i+1)번째 날에 대한 
+    (DAY, WEEK, MONTH, YEAR 날짜 문자열, 해당 주의 시작 날짜) 튜플이다. 
+    처음 조회될 때 한 번만 만들어지며, DateTools.getDateStr() 메서드에서 
+    _CALENDAR_COLUMNS에 정의된 열 번호로 조회한다.
+    같은 주, 월, 연도의 날짜 문자열은 같은 문자열 객체를 공유한다.
+
+    예) _getYearCalendar(2023, '-')[334]
+    -> ('2023-12-01', '2023-11-05주', '2023-12', '2023', 
+    datetime.date(2023, 11, 27))
+    """
+    def combine(*args: int) -> (str):
+        # DateTools.combineDateToGetDateStr()과 같은 형태.
+        return delimiter.join([f'{a:02d}' for a in args])
+
+    year_label = combine(year)
+    week_labels = {}
+    table = []
+    for month in range(1, 12+1):
+        month_label = combine(year, month)
+        for day, week_info in enumerate(
+                _getMonthWeekTable(year, month), start=1
+            ):
+            w_year, w_month, n_week, week_start = week_info
+            try:
+                week_label = week_labels[week_info]
+            except KeyError:
+                week_label = combine(w_year, w_month, n_week) + '주'
+                week_labels[week_info] = week_label
+            table.append((
+                combine(year, month, day), week_label, 
+                month_label, year_label, week_start
+            ))
+    return tuple(table)
+
+
+# _getYearCalendar() 함수가 반환하는 표에서 날짜 형태별 열 번호.
+_CALENDAR_COLUMNS = {
+    DateOptions.DAY: 0,
+    DateOptions.WEEK: 1,
+    DateOptions.MONTH: 2,
+    DateOptions.YEAR: 3,
+}
+
+
 class DateTools():
     """logpackage.py 모듈 내에서만 사용하는 클래스.
     날짜 문자열을 다루는 툴 성격의 클래스이다.
@@ -83,18 +273,11 @@ class DateTools():
             current_date: datetime.date
         ) -> (datetime.date):
         """주어진 날짜의 지난 달의 마지막 일의 날짜를 datetime.date 객체로 반환."""
-        last_day_this_month = calendar.monthrange(
-            current_date.year, current_date.month
-        )[1]
-        before_a_month = current_date \
-            - datetime.timedelta(days=last_day_this_month)
-        before_a_month_last_day = calendar.monthrange(
-            before_a_month.year, before_a_month.month
-        )[1]
-        before_a_month = datetime.date(
-            before_a_month.year, before_a_month.month, before_a_month_last_day
-        )
-        return before_a_month
+        # 이번 달의 1일에서 하루를 빼면 지난 달의 마지막 일이 된다.
+        # 주어진 날짜에서 이번 달의 일수만큼 빼는 방식은 3월 1일처럼 
+        # 지난 달의 일수가 더 적은 경우 두 달 전의 날짜가 되므로 사용하지 않는다.
+        first_day = datetime.date(current_date.year, current_date.month, 1)
+        return first_day - datetime.timedelta(days=1)
     
     def getDateStr(
             self, 
@@ -129,35 +312,139 @@ class DateTools():
             WEEK : 'YYYY-MM-N주' 형태의 날짜 문자열로 변환하고자 할 때.
             MONTH : 'YYYY-MM' 형태의 날짜 문자열로 변환하고자 할 때.
             YEAR : 'YYYY' 형태의 날짜 문자열로 변환하고자 할 때.
+        None
+            format_option 매개변수에 DAY, WEEK, MONTH, YEAR 외의 값이 
+            입력된 경우.
+
+        Notes
+        -----
+        날짜 문자열은 해당 연도의 모든 날짜에 대해 한 번에 만들어 두는 
+        연도별 날짜 분류 표에서 조회한다. 표는 연도별로 처음 조회될 때 
+        만들어지며, 최대 CALENDAR_CACHE_SIZE개 연도까지 보관된다.
         
         """
         the_day = datetime.date(year, month, day)
         if is_today:
             the_day = datetime.date.today()
         
-        if format_option == self.d_opt.WEEK:
-            n_week = self.getWeekOfDayInMonth(the_day)
-            if n_week < 0:
-                before_month = self._getLastDayOfLastMonth(the_day)
-                return self.combineDateToGetDateStr(
-                    before_month.year, before_month.month, -n_week
-                ) + '주'
-            return self.combineDateToGetDateStr(
-                the_day.year, the_day.month, n_week
-            ) + '주'
+        try:
+            column = _CALENDAR_COLUMNS[format_option]
+        except KeyError:
+            return None
+        return self._getCalendarRow(the_day)[column]
+
+    def _getCalendarRow(
+            self,
+            the_day: datetime.date
+        ) -> (tuple[str, str, str, str, datetime.date]):
+        """연도별 날짜 분류 표에서 특정 날짜에 해당하는 행을 반환."""
+        return _getYearCalendar(the_day.year, self.delimiter)[
+            the_day.timetuple().tm_yday - 1
+        ]
+    
+    def getNextBoundary(
+            self,
+            format_option: DateOptions.DateType,
+            the_day: datetime.date | None = None
+        ) -> (datetime.date | None):
+        """특정 날짜 이후 처음으로 날짜 문자열이 바뀌는 날짜를 반환하는 메서드.
+
+        즉, getDateStr() 메서드로 얻은 날짜 문자열이 the_day와 달라지는 
+        첫 번째 날을 반환한다.
+
+        Parameters
+        ----------
+        format_option : DateOptions.DateType
+            DAY, WEEK, MONTH, YEAR 상수 중 하나를 기입.
+        the_day : datetime.date | None, default None
+            기준 날짜. None이면 오늘 날짜를 기준으로 한다.
+
+        Returns
+        -------
+        datetime.date
+            DAY : 다음 날.
+            WEEK : 다음 주의 월요일. 
+                단, 그 전에 다음 달의 1주차가 시작된다면 다음 달의 1일.
+                예) 2024-01-29(월) -> 2024-02-01 (2024-02-1주 시작)
+            MONTH : 다음 달의 1일.
+            YEAR : 다음 해의 1월 1일.
+        None
+            format_option 매개변수에 DAY, WEEK, MONTH, YEAR 외의 값이 
+            입력된 경우.
+
+        """
+        if the_day is None:
+            the_day = datetime.date.today()
+
         if format_option == self.d_opt.DAY:
-            return self.combineDateToGetDateStr(
-                the_day.year, the_day.month, the_day.day
-            )
-        if format_option == self.d_opt.MONTH:
-            return self.combineDateToGetDateStr(
-                the_day.year, the_day.month
-            )
+            return the_day + datetime.timedelta(days=1)
         if format_option == self.d_opt.YEAR:
-            return self.combineDateToGetDateStr(
-                the_day.year
-            )
-    
+            return datetime.date(the_day.year+1, 1, 1)
+        if format_option not in (self.d_opt.WEEK, self.d_opt.MONTH):
+            return None
+
+        if the_day.month == 12:
+            next_month = datetime.date(the_day.year+1, 1, 1)
+        else:
+            next_month = datetime.date(the_day.year, the_day.month+1, 1)
+        if format_option == self.d_opt.MONTH:
+            return next_month
+
+        next_monday = the_day + datetime.timedelta(days=7-the_day.weekday())
+        # 다음 달의 1일이 금, 토, 일 중 하나라면 이번 달의 마지막 주에 
+        # 속하므로 날짜 문자열이 바뀌지 않는다.
+        if (next_month < next_monday 
+                and next_month.weekday() <= calendar.THURSDAY):
+            return next_month
+        return next_monday
+
+    def getNextBoundaryTimestamp(
+            self,
+            format_option: DateOptions.DateType,
+            timestamp: float | None = None
+        ) -> (float | None):
+        """특정 시각 이후 처음으로 날짜 문자열이 바뀌는 시각을 
+        타임스탬프로 반환하는 메서드.
+
+        로그 핸들러 등에서 매 기록마다 날짜 문자열을 만들어 비교하지 않고 
+        타임스탬프 비교만으로 날짜 디렉토리가 바뀌었는지 확인하고자 할 때 사용.
+
+        Parameters
+        ----------
+        format_option : DateOptions.DateType
+            DAY, WEEK, MONTH, YEAR 상수 중 하나를 기입.
+        timestamp : float | None, default None
+            기준 시각. time.time(), logging.LogRecord.created 등의 타임스탬프.
+            None이면 현재 시각을 기준으로 한다.
+
+        Returns
+        -------
+        float
+            getNextBoundary() 메서드가 반환하는 날짜의 0시 0분 0초(로컬 시간)에 
+            해당하는 타임스탬프.
+        None
+            format_option 매개변수에 DAY, WEEK, MONTH, YEAR 외의 값이 
+            입력된 경우.
+
+        Examples
+        --------
+        로깅 핸들러의 emit() 메서드 등에서 다음과 같이 사용할 수 있다.
+
+            if record.created >= self.boundary:
+                self.boundary = dtool.getNextBoundaryTimestamp(
+                    DateOptions.DAY, record.created
+                )
+                # 새 날짜 디렉토리로 변경.
+
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        boundary = self.getNextBoundary(
+            format_option, datetime.date.fromtimestamp(timestamp)
+        )
+        if boundary is None: return None
+        return time.mktime(boundary.timetuple())
+
     def getWeekOfDayInMonth(self, the_day: datetime.date):
         """특정 날짜가 주어졌을 때, 그 날이 해당 달에서 몇 쨰주인지를 
         반환하는 메서드.
@@ -194,26 +481,12 @@ class DateTools():
         .. [1] https://antennagom.com/844
 
         """
-        first_day = datetime.date(the_day.year, the_day.month, 1)
-        criterion = [
-            calendar.MONDAY, calendar.TUESDAY, 
-            calendar.WEDNESDAY, calendar.THURSDAY,
-        ]
-        n_week = 0
-        monday_of_second_week = first_day.day + (7 - first_day.weekday())
-        if first_day.weekday() in criterion:
-            n_week = 1
-            if the_day.day >= monday_of_second_week:
-                n_week += (the_day.day - monday_of_second_week) // 7 + 1
-        else:
-            if the_day.day < monday_of_second_week:
-                last_day_of_last_month = self._getLastDayOfLastMonth(the_day)
-                before_month_weeks = self.getWeekOfDayInMonth(
-                    last_day_of_last_month
-                )
-                n_week = - before_month_weeks
-            else:
-                n_week += (the_day.day - monday_of_second_week) // 7 + 1
+        year, month, n_week, _ = _getMonthWeekTable(
+            the_day.year, the_day.month
+        )[the_day.day-1]
+        if (year, month) != (the_day.year, the_day.month):
+            # 지난 달의 마지막 주로 계산되는 날.
+            return -n_week
         return n_week
     
     def isDateStr(
@@ -262,58 +535,42 @@ class DateTools():
         만족해야 한다. 
 
         """
-        def _is_in_range(data: str, min_value: int, max_value: int):
-            try:
-                return min_value <= int(data) <= max_value
-            except ValueError:
-                return False
+        parsed = self.parseDateStr(target)
+        if parsed is None: return None
+        return parsed[0]
 
-        def is_year(data: str):
-            return _is_in_range(data, datetime.MINYEAR, datetime.MAXYEAR)
-        
-        def is_month(data: str):
-            return _is_in_range(data, 1, 12)
-        
-        def is_day(data: str, year: int = None, month: int = None):
-            if year and month:
-                end_day = calendar.monthrange(year, month)[1]
-            else:
-                end_day = 31
-            return _is_in_range(data, 1, end_day)
-        
-        def is_week(data: str):
-            if data.endswith('주'):
-                return _is_in_range(data[:-1], 1, 5)
-            return False
-        
-        target_split = target.split(self.delimiter)
-        state = None
-        year, month = 0, 0
-        for i, data in enumerate(target_split):
-            if i == 0:
-                if is_year(data):
-                    state = self.d_opt.YEAR
-                    year = int(data)
-                else:
-                    return None
-            elif i == 1:
-                if is_month(data):
-                    state = self.d_opt.MONTH
-                    month = int(data)
-                else:
-                    return None
-            elif i == 2:
-                if is_week(data):
-                    state = self.d_opt.WEEK
-                elif is_day(data, year, month):
-                    state = self.d_opt.DAY
-                else:
-                    state = None
-            else:
-                # len(target_split) >= 3 이상이면 
-                # 정해진 날짜 형태 중 그 어느것도 만족하지 않는다.
-                state = None
-        return state
+    def parseDateStr(
+            self,
+            target: str
+        ) -> (tuple[DateOptions.DateType, datetime.date] | None):
+        """주어진 날짜 문자열의 날짜 형태를 검사함과 동시에 이를 
+        datetime.date 객체로 변환하여 한꺼번에 반환하는 메서드.
+
+        isDateStr(), convertStrToDate() 메서드는 내부적으로 이 메서드를 사용한다.
+        날짜 문자열 검사 조건은 isDateStr() 메서드를, 변환된 날짜 값의 기준은 
+        convertStrToDate() 메서드를 따른다.
+
+        Parameters
+        ----------
+        target : str
+            검사 및 변환할 날짜 문자열.
+
+        Returns
+        -------
+        tuple[DateOptions.DateType, datetime.date]
+            날짜 문자열의 날짜 형태와 그에 해당하는 datetime.date 객체.
+            예) '2023-12-1주' -> ('week', datetime.date(2023, 12, 4))
+        None
+            정해진 날짜 형태 중 어느 것과도 만족되지 않을 경우.
+
+        Notes
+        -----
+        정규표현식을 이용해 한 번의 탐색으로 검사 및 변환을 하며, 
+        그 결과는 최대 DATE_STR_CACHE_SIZE개까지 LRU 캐시에 보관된다. 
+        따라서 같은 날짜 디렉토리명을 반복해서 검사하는 경우 다시 계산하지 않는다.
+
+        """
+        return _parseDateStr(target, self.delimiter)
     
     def getDateFromWeek(
             self, 
@@ -325,7 +582,7 @@ class DateTools():
         해당 주의 날짜를 'YYYY-MM-DD'형태로 반환하는 메서드.
 
         week_date 매개변수로 주어지는 날짜 형태 문자열이 'YYYY-MM-N주' 
-        형태인지 확인하기 위해 내부적으로 이 클래스의 isDateStr() 
+        형태인지 확인하기 위해 내부적으로 이 클래스의 parseDateStr() 
         메서드를 사용함.
 
         Parameters
@@ -357,49 +614,25 @@ class DateTools():
             아닐 경우 반환.
 
         """
-        if self.isDateStr(week_date) != self.d_opt.WEEK:
+        parsed = self.parseDateStr(week_date)
+        if parsed is None or parsed[0] != self.d_opt.WEEK:
             return None
         
-        year, month, week = week_date.split(self.delimiter)
-        year, month, week = int(year), int(month), int(week[:-1])
+        # parsed[1]은 해당 주의 월요일이며, 첫 째 주에 월요일이 없다면 
+        # 해당 달의 1일이다. 따라서 해당 주의 월요일로부터 weekday만큼 
+        # 떨어진 날이 parsed[1]보다 앞서면 parsed[1]을 반환하면 된다.
+        first_date = parsed[1]
+        the_date = first_date + datetime.timedelta(
+            days=weekday - first_date.weekday()
+        )
+        if the_date < first_date:
+            the_date = first_date
 
-        def return_what(day):
-            if to_str:
-                return self.combineDateToGetDateStr(year, month, day)
-            return datetime.date(year, month, day)
-    
-        first_day = datetime.date(year, month, 1)
-        criterion = [
-            calendar.MONDAY, calendar.TUESDAY, 
-            calendar.WEDNESDAY, calendar.THURSDAY,
-        ]
-        the_day = 0
-        if first_day.weekday() in criterion:
-            if week == 1:
-                if weekday < first_day.weekday():
-                    # 첫 째 주에 weekday로 지정한 날이 없다면
-                    # 첫 째 주 첫 날인 1일로 기본으로 지정.
-                    the_day = 1
-                else:
-                    the_day = 1 + weekday - first_day.weekday()
-                return return_what(the_day)
-            else:
-                week -= 1
-        # 달력 상에서 두 번째 행의 월요일에 해당하는 날
-        the_day = first_day.day + (7 - first_day.weekday())
-        the_day += 7 * (week-1) + weekday
-
-        # 특정 달의 마지막 주이고, weekday가 그 다음 달의 1일 이후 날짜에 해당된다면
-        # 그 날로 수정.
-        # 예) 2023-11-5주, 금요일 -> 2023-12-01
-        final_day = calendar.monthrange(year, month)[1]
-        diff = the_day - final_day
-        if diff > 0:
-            next_date = datetime.date(year, month, final_day) \
-                + datetime.timedelta(days=diff)
-            year, month, the_day = next_date.year, next_date.month, next_date.day
-
-        return return_what(the_day)
+        if to_str:
+            return self.combineDateToGetDateStr(
+                the_date.year, the_date.month, the_date.day
+            )
+        return the_date
     
     def convertStrToDate(self, date_str: str) -> (datetime.date | None):
         """날짜 문자열을 입력받으면 이를 datetime.date 객체로 변환하여 
@@ -434,21 +667,146 @@ class DateTools():
             문자열이 date_str에 입력된 경우 반환됨.
         
         """
-        datetype = self.isDateStr(date_str)
-        if datetype is None: return None
-
-        if datetype == self.d_opt.DAY:
-            year, month, day = [int(d) for d in date_str.split(self.delimiter)]
-            return datetime.date(year, month, day)
-        if datetype == self.d_opt.WEEK:
-            return self.getDateFromWeek(date_str, to_str=False)
-        if datetype == self.d_opt.MONTH:
-            year, month = [int(d) for d in date_str.split(self.delimiter)]
-            return datetime.date(year, month, 1)
-        if datetype == self.d_opt.YEAR:
-            year = int(date_str)
-            return datetime.date(year, 1, 1)
-        
+        parsed = self.parseDateStr(date_str)
+        if parsed is None: return None
+        return parsed[1]
+
+    def _toDate(self, item) -> (datetime.date | None):
+        """getDateBuckets() 메서드에 입력된 개별 요소를 datetime.date 객체로 변환."""
+        if isinstance(item, datetime.datetime):
+            return item.date()
+        if isinstance(item, datetime.date):
+            return item
+        if isinstance(item, (int, float)):
+            # time.time(), logging.LogRecord.created 등의 타임스탬프.
+            return datetime.date.fromtimestamp(item)
+        if isinstance(item, str):
+            parsed = self.parseDateStr(item)
+            if parsed is not None: return parsed[1]
+            # 'YYYY-MM-DD HH:MM:SS,mmm' 형태의 로그 기록 시각 등.
+            try:
+                return datetime.date.fromisoformat(item[:10])
+            except ValueError:
+                return None
+        if np is not None and isinstance(item, np.datetime64):
+            # NaT는 None으로 변환된다.
+            return item.astype('datetime64[D]').astype(object)
+        if item is None:
+            return None
+        raise TypeError(
+            f"날짜로 변환할 수 없는 자료형입니다: {type(item).__name__}"
+        )
+
+    def _getBucket(
+            self,
+            the_day: datetime.date,
+            format_option: DateOptions.DateType
+        ) -> (tuple[str, datetime.date] | tuple[None, None]):
+        """특정 날짜가 속한 날짜 분류의 날짜 문자열과 그 시작 날짜를 반환."""
+        try:
+            column = _CALENDAR_COLUMNS[format_option]
+        except KeyError:
+            return None, None
+        row = self._getCalendarRow(the_day)
+        if format_option == self.d_opt.WEEK:
+            start = row[4]
+        elif format_option == self.d_opt.DAY:
+            start = the_day
+        elif format_option == self.d_opt.MONTH:
+            start = datetime.date(the_day.year, the_day.month, 1)
+        else:
+            start = datetime.date(the_day.year, 1, 1)
+        return row[column], start
+
+    def getDateBuckets(
+            self,
+            dates: Iterable,
+            format_option: DateOptions.DateType
+        ):
+        """여러 날짜 데이터들을 한꺼번에 날짜 분류별 날짜 문자열과
+        해당 분류의 시작 날짜로 변환하는 메서드.
+
+        로그 기록 시각들을 주, 월 단위 등으로 묶어 집계하고자 할 때 사용.
+        주 단위 계산은 월별로 미리 계산해둔 주차 표를 이용하므로
+        각 요소마다 getWeekOfDayInMonth() 메서드를 호출하지 않는다.
+        또한 같은 날짜는 한 번만 계산한다.
+
+        Parameters
+        ----------
+        dates : Iterable | numpy.ndarray
+            변환하고자 하는 날짜 데이터들. 각 요소는 다음 중 하나여야 한다.
+            datetime.date, datetime.datetime,
+            int | float (타임스탬프. 로컬 시간 기준으로 변환),
+            str (DateOptions의 날짜 형태 또는 'YYYY-MM-DD'로 시작하는 문자열),
+            numpy.datetime64, None.
+            numpy가 설치되어 있다면 numpy.datetime64 배열을 그대로 입력할 수 있다.
+        format_option : DateOptions.DateType
+            DAY, WEEK, MONTH, YEAR 상수 중 하나를 기입.
+            날짜 문자열 형태는 getDateStr() 메서드의 반환값 형태를 따른다.
+
+        Returns
+        -------
+        tuple[list[str | None], list[datetime.date | None]]
+            각 날짜가 속한 분류의 날짜 문자열들과 그 분류의 시작 날짜들.
+            시작 날짜는 해당 날짜 문자열을 convertStrToDate() 메서드로
+            변환한 결과와 같다.
+            날짜로 변환할 수 없는 요소에 대해서는 각각 None이 들어간다.
+        tuple[numpy.ndarray, numpy.ndarray]
+            dates 매개변수로 numpy.datetime64 배열을 입력한 경우.
+            날짜 문자열 배열(dtype=object)과 시작 날짜 배열(dtype='datetime64[D]')을
+            반환한다. 변환할 수 없는 요소는 각각 None, NaT로 채워진다.
+
+        Raises
+        ------
+        TypeError
+            날짜로 변환할 수 없는 자료형의 요소가 포함된 경우.
+
+        Examples
+        --------
+        >>> dtool = DateTools()
+        >>> labels, starts = dtool.getDateBuckets(
+        ...     ['2023-11-30', '2023-12-01', '2023-12-04'], DateOptions.WEEK)
+        >>> labels
+        ['2023-11-05주', '2023-11-05주', '2023-12-01주']
+        >>> [d.isoformat() for d in starts]
+        ['2023-11-27', '2023-11-27', '2023-12-04']
+
+        """
+        if (np is not None and isinstance(dates, np.ndarray)
+                and dates.dtype.kind == 'M'):
+            days = dates.astype('datetime64[D]').ravel()
+            uniq_days, inverse = np.unique(days, return_inverse=True)
+            uniq_labels, uniq_starts = [], []
+            for the_day in uniq_days.astype(object):
+                if the_day is None:
+                    uniq_labels.append(None)
+                    uniq_starts.append(None)
+                    continue
+                label, start = self._getBucket(the_day, format_option)
+                uniq_labels.append(label)
+                uniq_starts.append(start)
+            labels = np.array(uniq_labels, dtype=object)[inverse]
+            starts = np.array(
+                uniq_starts, dtype='datetime64[D]')[inverse]
+            return labels.reshape(dates.shape), starts.reshape(dates.shape)
+
+        labels, starts = [], []
+        done: dict[datetime.date, tuple[str, datetime.date]] = {}
+        for item in dates:
+            the_day = self._toDate(item)
+            if the_day is None:
+                labels.append(None)
+                starts.append(None)
+                continue
+            try:
+                label, start = done[the_day]
+            except KeyError:
+                label, start = self._getBucket(the_day, format_option)
+                done[the_day] = (label, start)
+            labels.append(label)
+            starts.append(start)
+        return labels, starts
+
     def convertStrToDatetime(self, datetime_str: str):
         """'YYYY-MM-DD-HH:MM:SS' 형태의 시간 문자열을 
         datetime.datetime 객체로 변환하여 반환하는 메서드. 
@@ -568,16 +926,18 @@ class DateTools():
 
         """
         try:
-            sub_entities = os.listdir(root_dir)
+            with os.scandir(root_dir) as entries:
+                sub_entities = list(entries)
         except FileNotFoundError:
             return None
         
         datedirs = []
-        for entity in sub_entities:
-            date_type = self.isDateStr(entity)
-            fullpath = os.path.join(root_dir, entity)
-            if os.path.isdir(fullpath) and date_type:
-                birthdatetime = time.localtime(os.path.getctime(fullpath))
+        for entry in sub_entities:
+            date_type = self.isDateStr(entry.name)
+            fullpath = entry.path
+            if date_type and entry.is_dir():
+                # 디렉토리를 읽을 때 얻은 정보를 쓴다. (윈도우에서는 추가 시스템 콜이 없음)
+                birthdatetime = time.localtime(entry.stat().st_ctime)
                 birthdatetime = time.strftime(
                     '%Y-%m-%d-%H:%M:%S', birthdatetime
                 )